@@ -0,0 +1,197 @@
+"""
+Offline benchmarks for withrepo.
+
+Generates a synthetic repository, serves it from a local archive server and
+times each phase, so runs are reproducible without network access:
+
+    python -m benchmarks.run --files 5000 --repeat 5 --output bench.json
+
+Results are written as JSON, one entry per benchmark with per-run seconds and
+summary statistics, plus the per-phase spans recorded by repo(timeit=True).
+"""
+
+# Standard library
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import statistics
+import tempfile
+from typing import Callable, Dict, List
+
+# Local
+from benchmarks.synthetic import SyntheticRepoSpec, generate_repo, build_archive
+from benchmarks.server import ArchiveServer
+
+from withrepo import repo, init_cache, copy_and_split_root_by_language_group
+from withrepo.download import download_and_extract_archive
+from withrepo.trash import discard, drain
+
+COMMIT = "0123456789abcdef0123456789abcdef01234567"
+
+
+def stats(runs: List[float]) -> Dict[str, float]:
+    return {
+        "runs": runs,
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "mean": statistics.fmean(runs),
+        "max": max(runs),
+    }
+
+
+def bench(fn: Callable[[], None], repeat: int) -> Dict[str, float]:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    drain()
+    return stats(runs)
+
+
+def phase_stats(spans_per_run: List[Dict[str, float]]) -> Dict[str, dict]:
+    phases = sorted({name for spans in spans_per_run for name in spans})
+    return {
+        name: stats([spans.get(name, 0.0) for spans in spans_per_run])
+        for name in phases
+    }
+
+
+def run_benchmarks(spec: SyntheticRepoSpec, repeat: int, workdir: str) -> dict:
+    src_parent = os.path.join(workdir, "src")
+    serve_dir = os.path.join(workdir, "serve")
+    os.makedirs(os.path.join(serve_dir, "repo", "archive"))
+    root = generate_repo(src_parent, spec)
+    zip_path = build_archive(
+        root, os.path.join(serve_dir, "repo", "archive", f"{COMMIT}.zip"), "zip"
+    )
+    tar_path = build_archive(
+        root, os.path.join(serve_dir, "repo", "archive", f"{COMMIT}.gztar"), "gztar"
+    )
+
+    results = {}
+    with ArchiveServer(serve_dir) as server:
+        repo_url = f"{server.url}/repo"
+
+        # repo() end to end, uncached, with per-phase spans
+        spans_per_run = []
+
+        def repo_uncached():
+            with repo(url=repo_url, commit=COMMIT, timeit=True) as r:
+                pass
+            spans_per_run.append(r.timings.summary())
+
+        results["repo.uncached"] = bench(repo_uncached, repeat)
+        results["repo.uncached"]["phases"] = phase_stats(spans_per_run)
+
+        # the same through a redirect, the way github.com redirects to codeload
+        def repo_redirected():
+            with repo(url=f"{server.url}/redirect/repo", commit=COMMIT):
+                pass
+
+        results["repo.redirected"] = bench(repo_redirected, repeat)
+
+        def extract_gztar():
+            path, lang_groups = download_and_extract_archive(
+                f"{server.url}/repo/archive/{COMMIT}.gztar"
+            )
+            discard(os.path.dirname(path))
+            for lang_group in lang_groups:
+                discard(lang_group.path)
+
+        results["download_and_extract_archive.gztar"] = bench(extract_gztar, repeat)
+
+        # cold and warm filesystem cache
+        cache_dir = os.path.join(workdir, "cache")
+        init_cache(cache_dir)
+
+        def repo_cache_cold():
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            init_cache(cache_dir)
+            with repo(url=repo_url, commit=COMMIT):
+                pass
+
+        results["repo.cache_cold"] = bench(repo_cache_cold, repeat)
+
+        def repo_cache_warm():
+            with repo(url=repo_url, commit=COMMIT):
+                pass
+
+        results["repo.cache_warm"] = bench(repo_cache_warm, repeat)
+
+        with repo(url=repo_url, commit=COMMIT) as r:
+            results["tree"] = bench(lambda: r.tree(), repeat)
+            results["tree.multilang"] = bench(lambda: r.tree(multilang=True), repeat)
+
+            files = r.tree()
+
+            def read_all():
+                for f in r.tree():
+                    f.contents()
+
+            results["RepoFile.contents"] = bench(read_all, repeat)
+            results["RepoFile.contents"]["files"] = len(files)
+            results["RepoFile.contents"]["bytes"] = sum(f.size or 0 for f in files)
+
+    def split_walk():
+        for lang_group in copy_and_split_root_by_language_group(root):
+            discard(lang_group.path)
+
+    results["copy_and_split_root_by_language_group"] = bench(split_walk, repeat)
+
+    return {
+        "meta": {
+            "timestamp": time.time(),
+            "python": sys.version,
+            "platform": platform.platform(),
+            "spec": spec.__dict__,
+            "repeat": repeat,
+            "archive_bytes": {
+                "zip": os.path.getsize(zip_path),
+                "gztar": os.path.getsize(tar_path),
+            },
+        },
+        "results": results,
+    }
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, default=1000)
+    parser.add_argument("--min-size", type=int, default=256)
+    parser.add_argument("--max-size", type=int, default=16 * 1024)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--vendor-fraction", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    spec = SyntheticRepoSpec(
+        files=args.files,
+        min_size=args.min_size,
+        max_size=args.max_size,
+        depth=args.depth,
+        vendor_fraction=args.vendor_fraction,
+        seed=args.seed,
+    )
+    workdir = tempfile.mkdtemp(prefix="withrepo-bench-")
+    try:
+        report = run_benchmarks(spec, args.repeat, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    output = json.dumps(report, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
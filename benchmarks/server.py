@@ -0,0 +1,127 @@
+# Standard library
+import os
+import re
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)$")
+
+
+class ArchiveRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves files from server.directory, the way a provider's archive endpoint would:
+      - /redirect/<path> answers 302 to /<path>, like github.com -> codeload
+      - Range requests get 206 partial content
+      - every response carries an ETag and honors If-None-Match
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.handle_file(send_body=False)
+
+    def do_GET(self):
+        self.handle_file(send_body=True)
+
+    def handle_file(self, send_body: bool):
+        self.server.requests.append((self.command, self.path, dict(self.headers)))
+        path = self.path.split("?", 1)[0]
+        if path.startswith("/redirect/"):
+            self.send_response(302)
+            self.send_header("Location", path[len("/redirect") :])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        file_path = os.path.join(self.server.directory, path.lstrip("/"))
+        if not os.path.isfile(file_path):
+            self.send_error(404)
+            return
+
+        stat = os.stat(file_path)
+        version = f"{file_path}:{stat.st_size}:{stat.st_mtime_ns}"
+        etag = f'"{hashlib.sha1(version.encode()).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        start, end = 0, stat.st_size - 1
+        status = 200
+        match = RANGE_PATTERN.match(self.headers.get("Range", ""))
+        if match and any(match.groups()) and stat.st_size:
+            first, last = match.groups()
+            if first:
+                start, end = int(first), int(last) if last else end
+            else:
+                start = max(0, stat.st_size - int(last))
+            end = min(end, stat.st_size - 1)
+            if start > end:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{stat.st_size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            status = 206
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{stat.st_size}")
+        self.end_headers()
+        if not send_body:
+            return
+
+        with open(file_path, "rb") as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = f.read(min(remaining, 1024 * 1024))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+
+class ArchiveServer:
+    """A local stand-in for a provider's archive endpoint, run on a background thread."""
+
+    def __init__(self, directory: str, handler=ArchiveRequestHandler):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.httpd.daemon_threads = True
+        self.httpd.directory = directory
+        self.httpd.requests = []
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self) -> List[tuple]:
+        return self.httpd.requests
+
+    def start(self) -> "ArchiveServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "ArchiveServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
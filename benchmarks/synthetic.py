@@ -0,0 +1,115 @@
+# Standard library
+import os
+import random
+import shutil
+import tarfile
+import zipfile
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+# Line templates per extension, so generated files tokenize like real source
+LINE_TEMPLATES = {
+    ".py": "def function_{n}(value):\n    return value * {n}  # line {n}\n",
+    ".ts": "export function fn{n}(value: number): number {{ return value * {n}; }}\n",
+    ".js": "function fn{n}(value) {{ return value * {n}; }}\n",
+    ".go": "func Fn{n}(value int) int {{ return value * {n} }}\n",
+    ".rs": "pub fn fn_{n}(value: i64) -> i64 {{ value * {n} }}\n",
+    ".java": "    public int fn{n}(int value) {{ return value * {n}; }}\n",
+    ".md": "Paragraph {n} of the synthetic documentation.\n",
+    ".json": '  "key_{n}": {n},\n',
+    ".txt": "plain text line {n}\n",
+}
+
+DEFAULT_LANGUAGE_MIX = {
+    ".py": 0.3,
+    ".ts": 0.15,
+    ".js": 0.1,
+    ".go": 0.1,
+    ".rs": 0.05,
+    ".java": 0.05,
+    ".md": 0.1,
+    ".json": 0.1,
+    ".txt": 0.05,
+}
+
+
+@dataclass
+class SyntheticRepoSpec:
+    files: int = 1000
+    min_size: int = 256
+    max_size: int = 16 * 1024
+    language_mix: Dict[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_LANGUAGE_MIX)
+    )
+    depth: int = 4
+    fanout: int = 6
+    vendor_fraction: float = 0.1
+    vendor_dirs: Tuple[str, ...] = ("node_modules", "vendor", "third_party")
+    binary_fraction: float = 0.01
+    seed: int = 0
+    top_level: str = "synthetic-0123456789abcdef0123456789abcdef01234567"
+
+
+def _random_dir(rng: random.Random, spec: SyntheticRepoSpec) -> str:
+    depth = rng.randrange(spec.depth + 1)
+    parts = [f"pkg{rng.randrange(spec.fanout)}" for _ in range(depth)]
+    if rng.random() < spec.vendor_fraction:
+        parts.insert(0, rng.choice(spec.vendor_dirs))
+    return os.path.join(*parts) if parts else ""
+
+
+def _file_body(rng: random.Random, ext: str, size: int) -> bytes:
+    template = LINE_TEMPLATES.get(ext, LINE_TEMPLATES[".txt"])
+    lines, total, n = [], 0, 0
+    while total < size:
+        line = template.format(n=n)
+        lines.append(line)
+        total += len(line)
+        n += 1
+    return "".join(lines)[:size].encode()
+
+
+def generate_repo(parent: str, spec: SyntheticRepoSpec = None) -> str:
+    """
+    Writes a deterministic synthetic repository under parent/spec.top_level,
+    the way provider archives nest everything under one top-level directory.
+    """
+    spec = spec or SyntheticRepoSpec()
+    rng = random.Random(spec.seed)
+    root = os.path.join(parent, spec.top_level)
+    if os.path.exists(root):
+        shutil.rmtree(root)
+
+    exts, weights = zip(*spec.language_mix.items())
+    for i in range(spec.files):
+        directory = os.path.join(root, _random_dir(rng, spec))
+        os.makedirs(directory, exist_ok=True)
+        size = rng.randint(spec.min_size, spec.max_size)
+        if rng.random() < spec.binary_fraction:
+            path = os.path.join(directory, f"blob_{i}.bin")
+            body = rng.randbytes(size)
+        else:
+            ext = rng.choices(exts, weights)[0]
+            path = os.path.join(directory, f"file_{i}{ext}")
+            body = _file_body(rng, ext, size)
+        with open(path, "wb") as f:
+            f.write(body)
+    return root
+
+
+def build_archive(root: str, out_path: str, archive_type: str = "zip") -> str:
+    """Archives root (keeping its top-level directory) as zip, tar or gztar."""
+    parent = os.path.dirname(root)
+    if archive_type == "zip":
+        with zipfile.ZipFile(out_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for dirpath, _, files in os.walk(root):
+                for file in files:
+                    path = os.path.join(dirpath, file)
+                    zf.write(path, os.path.relpath(path, parent))
+    elif archive_type in {"tar", "gztar"}:
+        mode = "w:gz" if archive_type == "gztar" else "w"
+        with tarfile.open(out_path, mode) as tf:
+            tf.add(root, arcname=os.path.basename(root))
+    else:
+        raise ValueError(f"build_archive(): Unsupported archive type '{archive_type}'")
+    return out_path
@@ -0,0 +1,201 @@
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+import withrepo.auth
+import withrepo.cache
+import withrepo.ratelimit
+import withrepo.remote
+from withrepo import repo, init_auth, init_cache, init_remote_cache, TokenPool
+from withrepo import RepoProvider
+from withrepo.auth import PROVIDER_AUTH_HOSTS, authenticated_url, credentials_hook
+from test_cache import make_zip, serve_archive
+from test_remote import serve_blob_store
+
+
+@pytest.fixture(autouse=True)
+def isolated_credentials(monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+    monkeypatch.setattr(withrepo.remote, "_remote_cache", None)
+    # fresh tables, restored on teardown, so no pool or bucket outlives its test
+    monkeypatch.setattr(withrepo.ratelimit, "_limits", {})
+    monkeypatch.setattr(withrepo.ratelimit, "_limiters", {})
+    monkeypatch.setattr(withrepo.ratelimit, "_max_wait", 1)
+    monkeypatch.setattr(withrepo.ratelimit, "_initialized", True)
+    monkeypatch.setattr(withrepo.auth, "_pools", {})
+    monkeypatch.setattr(withrepo.auth, "_initialized", True)
+
+
+def serve_with_token_limits(payload, limits):
+    """
+    A provider stand-in: every token gets limits[token] requests per hour,
+    advertised in X-RateLimit-* headers, and anonymous requests are refused.
+    """
+    used = {token: 0 for token in limits}
+    rejected = []
+    reset = int(time.time()) + 3600
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            token = self.headers.get("Authorization", "").removeprefix("Bearer ")
+            if token not in limits:
+                self.send_response(401)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            exhausted = used[token] >= limits[token]
+            if exhausted:
+                rejected.append(token)
+            else:
+                used[token] += 1
+            self.send_response(403 if exhausted else 200)
+            self.send_header("X-RateLimit-Limit", str(limits[token]))
+            self.send_header("X-RateLimit-Remaining", str(limits[token] - used[token]))
+            self.send_header("X-RateLimit-Reset", str(reset))
+            self.send_header("Content-Length", "0" if exhausted else str(len(payload)))
+            self.end_headers()
+            if not exhausted:
+                self.wfile.write(payload)
+
+        do_HEAD = do_GET  # only ever anonymous, so never with a body
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, used, rejected
+
+
+def test_pool_spreads_requests_across_token_quotas():
+    limits = {"a": 2, "b": 3}
+    server, used, rejected = serve_with_token_limits(
+        make_zip({"a.py": "print(1)\n"}), limits
+    )
+    url = f"http://127.0.0.1:{server.server_address[1]}/demo"
+    init_auth({"127.0.0.1": ["a", "b"]})
+
+    # the pool's aggregate quota, without a single request spent on a spent token
+    for commit in range(5):
+        with repo(url=url, commit=str(commit)) as r:
+            assert [f.path for f in r.tree()] == ["a.py"]
+    assert used == limits
+    assert rejected == []
+
+    # every token is retired until its reset, an hour away
+    with pytest.raises(Exception, match="rate limited"):
+        with repo(url=url, commit="5"):
+            pass
+    server.shutdown()
+
+
+def test_per_call_tokens_stay_on_their_provider(monkeypatch):
+    server, used, _ = serve_with_token_limits(make_zip({"a.py": "1\n"}), {"c": 5})
+    url = f"http://127.0.0.1:{server.server_address[1]}/demo"
+    pool = TokenPool(["c"])
+    github_hosts = PROVIDER_AUTH_HOSTS[RepoProvider.GITHUB] + ("127.0.0.1",)
+    monkeypatch.setitem(PROVIDER_AUTH_HOSTS, RepoProvider.GITHUB, github_hosts)
+
+    with repo(url=url, commit="0", token=pool):
+        pass
+    with pytest.raises(Exception, match="401"):
+        with repo(url=url, commit="1"):
+            pass
+    # a provider's tokens are never sent to another provider's hosts
+    with pytest.raises(Exception, match="401"):
+        with repo(url=url, commit="2", token=pool, provider=RepoProvider.GITLAB):
+            pass
+    server.shutdown()
+
+    assert used == {"c": 1}
+    assert pool.tokens[0].remaining == 4
+
+
+def test_credentials_never_follow_a_redirect_to_another_host():
+    pool = TokenPool(["d"], header="PRIVATE-TOKEN", scheme="")
+    init_auth({"gitlab.com": pool})
+    hook = credentials_hook(pool)
+    for url, kept in [
+        ("https://gitlab.com/a/b", True),
+        ("https://cdn.example.com/a.zip", False),
+    ]:
+        request = httpx.Request("GET", url, headers=pool.headers(pool.tokens[0]))
+        hook(request)
+        assert ("PRIVATE-TOKEN" in request.headers) == kept
+
+
+def test_github_archives_go_through_the_api():
+    assert (
+        authenticated_url("https://github.com/psf/requests/archive/v2.31.0.zip")
+        == "https://api.github.com/repos/psf/requests/zipball/v2.31.0"
+    )
+
+
+def test_an_exhausted_pool_only_holds_back_its_own_callers():
+    server, used, _ = serve_with_token_limits(
+        make_zip({"a.py": "1\n"}), {"spent": 0, "fresh": 5}
+    )
+    url = f"http://127.0.0.1:{server.server_address[1]}/demo"
+    spent = TokenPool(["spent"])
+    init_auth({"127.0.0.1": ["fresh"]})
+    github_hosts = PROVIDER_AUTH_HOSTS[RepoProvider.GITHUB]
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(
+            PROVIDER_AUTH_HOSTS, RepoProvider.GITHUB, github_hosts + ("127.0.0.1",)
+        )
+        with pytest.raises(Exception, match="rate limited"):
+            with repo(url=url, commit="0", token=spent):
+                pass
+
+    start = time.monotonic()
+    with repo(url=url, commit="1") as r:
+        assert [f.path for f in r.tree()] == ["a.py"]
+    assert time.monotonic() - start < 5
+    server.shutdown()
+    assert used == {"spent": 0, "fresh": 1}
+
+
+def test_private_trees_are_cached_per_credentials(tmp_path):
+    server, used, _ = serve_with_token_limits(make_zip({"a.py": "1\n"}), {"e": 5})
+    store, blobs = serve_blob_store()
+    url = f"http://127.0.0.1:{server.server_address[1]}/demo"
+    init_cache(str(tmp_path))
+    init_remote_cache(f"http://127.0.0.1:{store.server_address[1]}")
+
+    init_auth({"127.0.0.1": ["e"]})
+    for _ in range(2):
+        with repo(url=url, commit="c0ffee") as r:
+            assert [f.path for f in r.tree()] == ["a.py"]
+    assert used == {"e": 1}  # the second call is a cache hit
+
+    # without the token, neither the local cache nor the shared tier serves it
+    init_auth({})
+    with pytest.raises(Exception, match="401"):
+        with repo(url=url, commit="c0ffee"):
+            pass
+    server.shutdown()
+    store.shutdown()
+    assert blobs == {}
+
+
+def test_public_trees_are_shared_with_tokens_configured(tmp_path):
+    provider, provider_hits = serve_archive(make_zip({"a.py": "1\n"}))
+    store, blobs = serve_blob_store()
+    url = f"http://127.0.0.1:{provider.server_address[1]}/demo"
+    init_remote_cache(f"http://127.0.0.1:{store.server_address[1]}")
+
+    # the first host has tokens, the second none; the archive is public either way
+    for host, tokens in enumerate([["e"], []]):
+        init_auth({"127.0.0.1": tokens} if tokens else {})
+        init_cache(str(tmp_path / f"host{host}"))
+        with repo(url=url, commit="c0ffee") as r:
+            assert [f.path for f in r.tree()] == ["a.py"]
+    provider.shutdown()
+    store.shutdown()
+
+    assert len(provider_hits) == 1
+    assert len(blobs) == 1
@@ -0,0 +1,34 @@
+import os
+
+import pytest
+
+import withrepo.budget
+import withrepo.cache
+from withrepo import repo, configure_workspace
+from withrepo.budget import _read_ledger, ledger_path
+from withrepo.trash import drain
+from test_cache import make_zip, serve_archive
+
+
+@pytest.fixture(autouse=True)
+def isolated_workspace(tmp_path, monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+    monkeypatch.setattr(withrepo.budget, "_workspace", None)
+    return configure_workspace(str(tmp_path / "work"), budget_bytes=10**9)
+
+
+def test_raising_body_releases_its_reservation(isolated_workspace):
+    server, _ = serve_archive(make_zip({"a.py": "print(1)\n"}))
+    url = f"http://127.0.0.1:{server.server_address[1]}/demo"
+    path = ledger_path(isolated_workspace)
+
+    with pytest.raises(RuntimeError):
+        with repo(url=url, commit="c0ffee") as r:
+            tree = r.path
+            assert len(_read_ledger(path)) == 1
+            raise RuntimeError("body failed")
+    server.shutdown()
+
+    assert drain(timeout=10)
+    assert _read_ledger(path) == {}
+    assert not os.path.exists(tree)
@@ -0,0 +1,75 @@
+import io
+import os
+import zipfile
+import threading
+import multiprocessing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from withrepo import repo, init_cache
+
+
+def make_zip(files):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for path, content in files.items():
+            zf.writestr(f"demo-abc/{path}", content)
+    return buf.getvalue()
+
+
+def serve_archive(payload):
+    """Serves payload for every GET and counts the requests, HEADs excluded."""
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_HEAD(self):
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+
+        def do_GET(self):
+            hits.append(self.path)
+            self.do_HEAD()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, hits
+
+
+def fetch_in_worker(cache_dir, url, barrier, results):
+    init_cache(cache_dir)
+    barrier.wait()
+    with repo(url=url, commit="c0ffee") as r:
+        results.put((r.path, tuple(sorted(f.path for f in r.tree()))))
+
+
+def test_concurrent_fetches_download_once(tmp_path):
+    payload = make_zip({"a.py": "print(1)\n", "b.js": "const b = 1\n"})
+    server, hits = serve_archive(payload)
+    url = f"http://127.0.0.1:{server.server_address[1]}/demo"
+
+    ctx = multiprocessing.get_context("spawn")
+    n_workers = 6
+    barrier, results = ctx.Barrier(n_workers), ctx.Queue()
+    workers = [
+        ctx.Process(
+            target=fetch_in_worker, args=(str(tmp_path), url, barrier, results)
+        )
+        for _ in range(n_workers)
+    ]
+    for w in workers:
+        w.start()
+    outputs = [results.get(timeout=60) for _ in workers]
+    for w in workers:
+        w.join(timeout=60)
+        assert w.exitcode == 0
+    server.shutdown()
+
+    assert len(hits) == 1
+    assert len(set(outputs)) == 1
+    path, files = outputs[0]
+    assert files == ("a.py", "b.js")
+    assert os.path.isdir(path)  # cached trees outlive their contexts
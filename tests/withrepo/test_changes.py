@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+import withrepo.budget
+import withrepo.cache
+from withrepo import repo, diff, configure_workspace
+from withrepo.trash import drain
+from test_cache import make_zip, serve_archive
+
+BASE = {
+    "a.py": "a = 1\n",
+    "b.py": "b = 1\n",
+    "c.py": "c = 'moved'\n",
+    "d.txt": "gone\n",
+}
+HEAD = {
+    "a.py": "a = 1\n",
+    "b.py": "b = 2\n",
+    "sub/c2.py": "c = 'moved'\n",
+    "e.py": "e = 1\n",
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated_workspace(tmp_path, monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+    monkeypatch.setattr(withrepo.budget, "_workspace", None)
+    configure_workspace(str(tmp_path / "work"))
+
+
+@pytest.fixture
+def specs():
+    base_server, _ = serve_archive(make_zip(BASE))
+    head_server, _ = serve_archive(make_zip(HEAD))
+    yield (
+        {"url": f"http://127.0.0.1:{base_server.server_address[1]}/demo"},
+        {"url": f"http://127.0.0.1:{head_server.server_address[1]}/demo"},
+    )
+    base_server.shutdown()
+    head_server.shutdown()
+
+
+def test_diff_classifies_changes(specs):
+    base, head = specs
+    changes = [
+        (f.change_type, f.path, getattr(f, "previous_path", None), f.content)
+        for f in diff(base, head, commit="c0ffee")
+    ]
+    assert changes == [
+        ("modified", "b.py", None, "b = 2\n"),
+        ("deleted", "d.txt", None, "gone\n"),
+        ("added", "e.py", None, "e = 1\n"),
+        ("renamed", "sub/c2.py", "c.py", "c = 'moved'\n"),
+    ]
+
+    without_renames = {
+        (f.change_type, f.path) for f in diff(base, head, detect_renames=False)
+    }
+    assert ("added", "sub/c2.py") in without_renames
+    assert ("deleted", "c.py") in without_renames
+
+
+def test_breaking_out_of_diff_cleans_up_both_trees(specs):
+    base, head = specs
+    with repo(**base) as ctx:
+        scratch_parent = os.path.dirname(os.path.dirname(ctx.path))
+
+    def scratch_trees():
+        return [n for n in os.listdir(scratch_parent) if n.startswith("scope_")]
+
+    assert drain(timeout=10)
+    before = scratch_trees()
+    for _ in diff(base, head):
+        assert len(scratch_trees()) > len(before)
+        break
+    assert drain(timeout=10)
+    assert scratch_trees() == before
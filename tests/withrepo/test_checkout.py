@@ -0,0 +1,83 @@
+import os
+import errno
+
+import pytest
+
+import withrepo.cache
+import withrepo.checkout
+from withrepo import repo, init_cache
+from withrepo.checkout import checkout_tree
+from test_cache import make_zip, serve_archive
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+    monkeypatch.setattr(withrepo.cache, "_cache_format", "tree")
+
+
+@pytest.fixture
+def root(tmp_path):
+    root = tmp_path / "root"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "a.py").write_text("print(1)\n")
+    (root / "run.sh").write_text("#!/bin/sh\n")
+    os.chmod(root / "run.sh", 0o555)
+    os.symlink("pkg/a.py", root / "link.py")
+    return root
+
+
+def unsupported(code):
+    def fail(*args):
+        raise OSError(code, os.strerror(code))
+
+    return fail
+
+
+def test_hardlink_falls_back_to_reflink_then_copy(tmp_path, root, monkeypatch):
+    links = []
+
+    def link(src, dst):
+        links.append(src)
+        unsupported(errno.EXDEV)()
+
+    monkeypatch.setattr(withrepo.checkout.os, "link", link)
+    no_reflinks = unsupported(errno.EOPNOTSUPP)
+    monkeypatch.setattr(withrepo.checkout, "reflink_file", no_reflinks)
+
+    dest = tmp_path / "dest"
+    materializer = checkout_tree(str(root), str(dest), "hardlink")
+    # an unsupported mode is dropped after the first failure
+    assert len(links) == 1
+    assert materializer.counts == {"reflink": 0, "hardlink": 0, "copy": 2}
+    assert materializer.mode == "copy"
+
+    assert (dest / "pkg" / "a.py").read_text() == "print(1)\n"
+    assert os.readlink(dest / "link.py") == "pkg/a.py"
+    assert os.stat(dest / "run.sh").st_mode & 0o777 == 0o755  # made writable
+    copied, source = dest / "pkg" / "a.py", root / "pkg" / "a.py"
+    assert os.stat(copied).st_ino != os.stat(source).st_ino
+
+
+def test_other_errors_are_not_fallen_back_from(tmp_path, root, monkeypatch):
+    monkeypatch.setattr(withrepo.checkout, "reflink_file", unsupported(errno.ENOSPC))
+    with pytest.raises(OSError) as e:
+        checkout_tree(str(root), str(tmp_path / "dest"), "reflink")
+    assert e.value.errno == errno.ENOSPC
+
+
+def test_checkout_of_a_cached_tree(tmp_path):
+    server, _ = serve_archive(make_zip({"a.py": "print(1)\n", "pkg/b.js": "b = 1\n"}))
+    url = f"http://127.0.0.1:{server.server_address[1]}/demo"
+    init_cache(str(tmp_path / "cache"))
+
+    with repo(url=url, commit="c0ffee", timeit=True) as r:
+        dest = r.checkout(str(tmp_path / "dest"), mode="hardlink")
+        (span,) = [s for s in r.timings.spans if s.name == "checkout"]
+        assert span.attributes["files.hardlink"] == 2
+        source = os.path.join(r.path, "a.py")
+        assert os.stat(os.path.join(dest, "a.py")).st_ino == os.stat(source).st_ino
+        with pytest.raises(Exception, match="is not empty"):
+            r.checkout(dest)
+    server.shutdown()
+    assert open(os.path.join(dest, "pkg", "b.js")).read() == "b = 1\n"
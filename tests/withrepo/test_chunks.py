@@ -0,0 +1,56 @@
+import pytest
+
+import withrepo.cache
+from withrepo import repo
+from withrepo.chunks import Chunk, chunk_text
+from test_cache import make_zip, serve_archive
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+
+
+def test_chunks_break_on_lines_with_overlap():
+    text = "".join(f"line {i}\n" for i in range(1, 8))
+    chunks = list(chunk_text(text, "a.py", "python", max_lines=3, overlap=1))
+    assert [(c.start_line, c.end_line) for c in chunks] == [(1, 3), (3, 5), (5, 7)]
+    assert chunks[1].text == "line 3\nline 4\nline 5\n"
+
+    # a line longer than max_chars is split on its own
+    chunks = list(chunk_text("ab\n" + "x" * 10 + "\ncd\n", "b.txt", max_chars=4))
+    assert [c.text for c in chunks] == ["ab\n", "xxxx", "xxxx", "xx\n", "cd\n"]
+    assert [c.start_line for c in chunks] == [1, 2, 2, 2, 3]
+
+
+def test_chunks_number_lines_like_grep():
+    text = "a\x0cb\nc\rd\ne"
+    chunks = list(chunk_text(text, "a.py", max_lines=1))
+    assert [(c.start_line, c.text) for c in chunks] == [
+        (1, "a\x0cb\n"),
+        (2, "c\rd\n"),
+        (3, "e"),
+    ]
+    assert list(chunk_text("", "a.py")) == []
+
+
+def test_tree_chunks_stream_in_path_order():
+    files = {f"m{i:03}.py": f"a = {i}\nb = {i}\n" for i in range(40)}
+    files["blob.bin"] = "\0binary"
+    server, _ = serve_archive(make_zip(files))
+    url = f"http://127.0.0.1:{server.server_address[1]}/demo"
+
+    with repo(url=url, commit="c0ffee") as r:
+        serial = list(r.chunks(max_lines=1, workers=1))
+        parallel = list(r.chunks(max_lines=1, workers=2))
+        batches = list(r.chunks(max_lines=1, batch_size=32))
+    server.shutdown()
+
+    assert serial == parallel
+    assert len(serial) == 80
+    assert serial[:2] == [
+        Chunk("m000.py", 1, 1, "a = 0\n", "python"),
+        Chunk("m000.py", 2, 2, "b = 0\n", "python"),
+    ]
+    assert [len(b) for b in batches] == [32, 32, 16]
+    assert [c for b in batches for c in b] == serial
@@ -0,0 +1,65 @@
+import io
+import json
+
+import pytest
+
+import withrepo.cache
+from withrepo import repo, init_cache
+from withrepo.export import read_binary_export
+from test_cache import make_zip, serve_archive
+
+FILES = {"a.py": "print(1)\n", "pkg/b.js": "const b = 'é'\n", "c.bin": "\0\1\2"}
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+    monkeypatch.setattr(withrepo.cache, "_cache_format", "tree")
+
+
+@pytest.fixture
+def url():
+    server, _ = serve_archive(make_zip(FILES))
+    yield f"http://127.0.0.1:{server.server_address[1]}/demo"
+    server.shutdown()
+
+
+def test_jsonl_export(url):
+    out = io.StringIO()
+    with repo(url=url, commit="c0ffee") as r:
+        assert r.export(out, fields=["path", "language"]) == 3
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert {r["path"]: (r["language"], r["content"]) for r in records} == {
+        "a.py": ("python", "print(1)\n"),
+        "pkg/b.js": ("javascript", "const b = 'é'\n"),
+        "c.bin": (None, "\0\1\2"),
+    }
+
+
+@pytest.mark.parametrize("format", ["tree", "pack"])
+@pytest.mark.parametrize("to_file", [False, True])
+def test_binary_export_round_trips(tmp_path, url, format, to_file):
+    init_cache(str(tmp_path / "cache"), format=format)
+    out = open(tmp_path / "export.bin", "w+b") if to_file else io.BytesIO()
+    with out:
+        with repo(url=url, commit="c0ffee") as r:
+            assert r.export(out, format="binary") == 3
+        out.seek(0)
+        records = {f["path"]: (f, content) for f, content in read_binary_export(out)}
+    assert {path: content for path, (_, content) in records.items()} == {
+        path: content.encode() for path, content in FILES.items()
+    }
+    assert records["a.py"][0]["size"] == len(FILES["a.py"])
+
+
+def test_export_without_content(url):
+    out = io.BytesIO()
+    with repo(url=url, commit="c0ffee") as r:
+        r.export(out, format="binary", fields=["path"], include_content=False)
+    out.seek(0)
+    records = sorted(read_binary_export(out), key=lambda r: r[0]["path"])
+    assert records == [
+        ({"path": "a.py"}, None),
+        ({"path": "c.bin"}, None),
+        ({"path": "pkg/b.js"}, None),
+    ]
@@ -0,0 +1,48 @@
+import types
+
+import pytest
+
+import withrepo.cache
+from withrepo import repo
+from withrepo.withrepo import File
+from test_cache import make_zip, serve_archive
+
+FILES = {
+    "a.py": "print(1)\n",
+    "README": "# demo\n",
+    "Makefile": "all:\n",
+    "pkg/x.TS": "const x = 1\n",
+    "archive.tar.gz": "not really\n",
+    ".env": "A=1\n",
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+
+
+@pytest.fixture
+def url():
+    server, _ = serve_archive(make_zip(FILES))
+    yield f"http://127.0.0.1:{server.server_address[1]}/demo"
+    server.shutdown()
+
+
+def test_bulk_conversion_matches_the_constructor(url):
+    with repo(url=url, commit="c0ffee") as r:
+        tree = r.tree()
+        files = File.from_repo_files(tree)
+        for repo_file, file in zip(tree, files):
+            legacy = File(repo_file.path, repo_file.abs_path, repo_file.contents())
+            assert vars(file) == vars(legacy)
+            assert file.content is repo_file.contents()  # shared, not copied
+        assert [vars(f) for f in r.to_files()] == [vars(f) for f in files]
+    assert len(files) == len(FILES)
+
+
+def test_lazy_conversion_without_content(url):
+    with repo(url=url, commit="c0ffee") as r:
+        files = r.to_files(include_content=False, lazy=True)
+        assert isinstance(files, types.GeneratorType)
+        assert sorted(f.path for f in files if f.content is None) == sorted(FILES)
@@ -0,0 +1,106 @@
+import re
+
+import pytest
+
+import withrepo.budget
+import withrepo.cache
+from withrepo import repo, configure_workspace
+from test_cache import make_zip, serve_archive
+
+FILES = {
+    "src/a.py": "needle = 1\nother = 2\nneedle = 3\n",
+    "src/b.js": "const needle = 4\n",
+    "src/c.py": "x = 0\r\nNEEDLE = 5\r\n",
+    "docs/guide.md": "a needle in the docs\n",
+    "node_modules/dep/index.js": "module.exports.needle = 6\n",
+    "blob.bin": "needle\0binary",
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated_workspace(tmp_path, monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+    monkeypatch.setattr(withrepo.budget, "_workspace", None)
+    configure_workspace(str(tmp_path / "workspace"))
+
+
+@pytest.fixture
+def url():
+    server, _ = serve_archive(make_zip(FILES))
+    yield f"http://127.0.0.1:{server.server_address[1]}/demo"
+    server.shutdown()
+
+
+def found(matches):
+    return sorted((m.path, m.line_no, m.line) for m in matches)
+
+
+def test_grep_skips_binaries_and_vendored_files(url):
+    with repo(url=url, commit="c0ffee") as r:
+        assert found(r.grep("needle")) == [
+            ("docs/guide.md", 1, "a needle in the docs"),
+            ("src/a.py", 1, "needle = 1"),
+            ("src/a.py", 3, "needle = 3"),
+            ("src/b.js", 1, "const needle = 4"),
+        ]
+        # compiled patterns keep their flags, lines lose their \r
+        assert found(r.grep(re.compile("^needle", re.IGNORECASE))) == [
+            ("src/a.py", 1, "needle = 1"),
+            ("src/a.py", 3, "needle = 3"),
+            ("src/c.py", 2, "NEEDLE = 5"),
+        ]
+        vendored = found(r.grep("needle", include_vendor=True))
+        assert ("node_modules/dep/index.js", 1, "module.exports.needle = 6") in vendored
+        assert "blob.bin" not in {path for path, _, _ in vendored}
+
+
+def test_grep_filters_by_language_and_glob(url):
+    with repo(url=url, commit="c0ffee") as r:
+        assert {m.path for m in r.grep("needle", languages=["python"])} == {"src/a.py"}
+        # LSP language names select every language they serve
+        assert {m.path for m in r.grep("needle", languages=["typescript"])} == {
+            "src/b.js"
+        }
+        assert {m.path for m in r.grep("needle", globs=["docs/*", "*.js"])} == {
+            "docs/guide.md",
+            "src/b.js",
+        }
+        assert list(r.grep("needle", globs=["*.rs"])) == []
+
+
+def test_grep_stops_after_max_results(url):
+    with repo(url=url, commit="c0ffee") as r:
+        everything = list(r.grep("needle"))
+        assert list(r.grep("needle", max_results=2)) == everything[:2]
+
+
+def test_worker_pool_matches_in_file_order(tmp_path):
+    files = {f"m{i:03}.py": f"x = {i}\nvalue = {i}\n" for i in range(150)}
+    server, _ = serve_archive(make_zip(files))
+    url = f"http://127.0.0.1:{server.server_address[1]}/demo"
+
+    with repo(url=url, commit="c0ffee") as r:
+        serial = list(r.grep("value", workers=1))
+        assert list(r.grep("value", workers=3)) == serial
+        assert list(r.grep("value", workers=3, max_results=70)) == serial[:70]
+    server.shutdown()
+    assert len(serial) == 150
+    assert {m.line_no for m in serial} == {2}
+
+
+def test_grep_stopped_early_is_not_a_failure(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    for i in range(5):
+        (root / f"m{i}.py").write_text(f"value = {i}\n")
+
+    with repo(root_path=str(root), timeit=True) as r:
+        assert sorted(m.path for m in r.grep("value")) == [
+            f"m{i}.py" for i in range(5)
+        ]
+        for match in r.grep("value", workers=1):
+            break
+        first, stopped = [s for s in r.timings.spans if s.name == "grep"]
+        assert first.attributes["matches"] == 5
+        assert stopped.attributes["matches"] == 1
+        assert "error" not in stopped.attributes
@@ -0,0 +1,37 @@
+import os
+import sys
+import json
+import subprocess
+
+PROBE = """
+import sys, json, tempfile
+import withrepo
+bare = sorted(sys.modules)
+with withrepo.repo(root_path=tempfile.mkdtemp()) as r:
+    r.tree()
+print(json.dumps({"bare": bare, "root_path": sorted(sys.modules)}))
+"""
+
+
+def probe():
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_import_is_lazy():
+    modules = probe()
+
+    # importing the package loads none of its submodules
+    for heavy in ("withrepo.withrepo", "withrepo.download", "httpx", "concurrent"):
+        assert heavy not in modules["bare"]
+
+    # root_path mode never touches the download stack or optional dependencies
+    for heavy in ("httpx", "tree_sitter", "multiprocessing", "cProfile"):
+        assert heavy not in modules["root_path"]
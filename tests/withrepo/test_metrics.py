@@ -0,0 +1,66 @@
+import os
+import json
+
+import pytest
+
+from withrepo import repo, enable_metrics, disable_metrics, render_metrics
+from withrepo.metrics import REGISTRY, MetricsRegistry
+
+
+@pytest.fixture
+def metrics_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(REGISTRY, "multiprocess_dir", None)
+    path = tmp_path / "metrics"
+    enable_metrics(str(path))
+    yield path
+    disable_metrics()
+
+
+def test_root_path_calls_publish_their_metrics(tmp_path, metrics_dir):
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "a.py").write_text("a = 1\n")
+
+    with repo(root_path=str(root)) as r:
+        r.tree()
+    with open(metrics_dir / f"metrics_{os.getpid()}.json") as f:
+        snapshot = json.load(f)
+    assert sum(value for _, value in snapshot["withrepo_files_walked_total"]) >= 1
+
+
+def test_render_in_the_prometheus_text_format():
+    registry = MetricsRegistry()
+    requests = registry.counter("demo_requests_total", "Requests.")
+    requests.inc(provider='git"hub')
+    requests.inc(2, provider="a\\b\nc")
+    latency = registry.histogram("demo_seconds", "Latency.", buckets=(0.1, 1))
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+
+    assert registry.render().splitlines() == [
+        "# HELP demo_requests_total Requests.",
+        "# TYPE demo_requests_total counter",
+        'demo_requests_total{provider="git\\"hub"} 1',
+        'demo_requests_total{provider="a\\\\b\\nc"} 2',
+        "# HELP demo_seconds Latency.",
+        "# TYPE demo_seconds histogram",
+        'demo_seconds_bucket{le="0.1"} 1',
+        'demo_seconds_bucket{le="1"} 2',
+        'demo_seconds_bucket{le="+Inf"} 3',
+        "demo_seconds_sum 5.55",
+        "demo_seconds_count 3",
+    ]
+
+
+def test_render_metrics_covers_a_call(tmp_path, metrics_dir):
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "a.py").write_text("a = 1\n")
+
+    with repo(root_path=str(root)) as r:
+        r.tree()
+    text = render_metrics()
+    assert "# TYPE withrepo_files_walked_total counter" in text
+    assert "# TYPE withrepo_split_seconds histogram" in text
+    assert 'withrepo_split_seconds_bucket{le="+Inf"}' in text
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+import withrepo.cache
+from withrepo import repo, init_cache
+from withrepo.manifest import Manifest, ManifestEntry
+from withrepo.pack import Pack, open_pack, write_pack
+from test_cache import make_zip, serve_archive
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+    monkeypatch.setattr(withrepo.cache, "_cache_format", "tree")
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_pack_round_trip(tmp_path, compress):
+    root = tmp_path / "root"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "a.py").write_text("print(1)\n" * 100)
+    (root / "b.bin").write_bytes(os.urandom(1000))
+    (root / "run.sh").write_text("#!/bin/sh\n")
+    os.chmod(root / "run.sh", 0o755)
+    os.symlink("pkg/a.py", root / "link.py")
+
+    write_pack(str(root), str(tmp_path / "tree.wrpack"), compress=compress)
+    pack = Pack(str(tmp_path / "tree.wrpack"))
+    assert [e.path for e in pack.entries] == ["b.bin", "link.py", "pkg/a.py", "run.sh"]
+    assert pack.read_bytes("b.bin") == (root / "b.bin").read_bytes()
+    assert pack.read_text("link.py") == "print(1)\n" * 100
+
+    dest = tmp_path / "dest"
+    assert pack.unpack(str(dest)) == 4
+    assert os.readlink(dest / "link.py") == "pkg/a.py"
+    assert os.access(dest / "run.sh", os.X_OK)
+    assert (dest / "pkg" / "a.py").read_text() == (root / "pkg" / "a.py").read_text()
+
+
+def test_packed_cache_entries(tmp_path):
+    server, _ = serve_archive(make_zip({"a.py": "print(1)\n", "b.js": "const b = 1\n"}))
+    url = f"http://127.0.0.1:{server.server_address[1]}/demo"
+    init_cache(str(tmp_path), format="pack+zlib")
+
+    with repo(url=url, commit="c0ffee") as r:
+        assert os.path.isfile(r.path)
+        assert {f.path: f.contents() for f in r.tree()} == {
+            "a.py": "print(1)\n",
+            "b.js": "const b = 1\n",
+        }
+        assert [m.path for m in r.grep("const")] == ["b.js"]
+    server.shutdown()
+
+    # the whole entry is one file, next to its lock
+    (entry,) = [p for p in tmp_path.iterdir() if p.is_dir()]
+    assert [p.name for p in entry.iterdir()] == ["tree.wrpack"]
+
+
+def test_replaced_packs_are_reopened(tmp_path):
+    root, path = tmp_path / "root", str(tmp_path / "tree.wrpack")
+    root.mkdir()
+    (root / "a.py").write_text("old\n")
+    write_pack(str(root), path)
+    assert open_pack(path).read_bytes("a.py") == b"old\n"
+
+    (root / "a.py").write_text("new\n")
+    write_pack(str(root), path, manifest=Manifest(str(root), []))
+    assert open_pack(path).entries == []
+
+
+def test_failed_writes_leave_nothing_behind(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    missing = ManifestEntry("gone.py", 1, "python", True, "0" * 64)
+    with pytest.raises(FileNotFoundError):
+        manifest = Manifest(str(root), [missing])
+        write_pack(str(root), str(tmp_path / "tree.wrpack"), manifest)
+    assert os.listdir(tmp_path) == ["root"]
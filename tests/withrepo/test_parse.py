@@ -0,0 +1,76 @@
+import pytest
+
+import withrepo.cache
+import withrepo.parse
+from withrepo import repo, init_cache
+from withrepo.parse import ParseCache, Symbol, TREE_SITTER_MISSING, get_parser
+from test_cache import make_zip, serve_archive
+
+FILES = {
+    "a.py": "class A:\n    def f(self):\n        pass\n",
+    "b.py": "def g():\n    pass\n",
+    "notes.txt": "not code\n",
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+    monkeypatch.setattr(withrepo.parse, "PARSE_CACHE", ParseCache())
+
+
+@pytest.fixture
+def url():
+    server, _ = serve_archive(make_zip(FILES))
+    yield f"http://127.0.0.1:{server.server_address[1]}/demo"
+    server.shutdown()
+
+
+def test_without_tree_sitter_every_file_carries_an_error(url, monkeypatch):
+    monkeypatch.setattr(withrepo.parse, "load_tree_sitter", lambda: None)
+    with repo(url=url, commit="c0ffee") as r:
+        parsed = r.parse()
+    assert [(p.path, p.grammar, p.error) for p in parsed] == [
+        ("a.py", "python", TREE_SITTER_MISSING),
+        ("b.py", "python", TREE_SITTER_MISSING),
+    ]
+
+
+def test_parses_are_cached_by_content_hash(tmp_path, url, monkeypatch):
+    parsed_paths = []
+
+    def parse_file(abs_path, grammar):
+        parsed_paths.append(abs_path)
+        return [Symbol("s", "function", 1, 1, 0, 1, None)], None
+
+    monkeypatch.setattr(withrepo.parse, "is_available", lambda: True)
+    monkeypatch.setattr(withrepo.parse, "parse_file", parse_file)
+    init_cache(str(tmp_path / "cache"))
+
+    with repo(url=url, commit="c0ffee", timeit=True) as r:
+        assert [p.cached for p in r.parse()] == [False, False]
+        assert [p.cached for p in r.parse()] == [True, True]
+        (_, span) = [s for s in r.timings.spans if s.name == "parse"]
+        assert span.attributes["cached"] == 2
+    assert len(parsed_paths) == 2
+
+    # another process, or a later commit with the same files, reads them from disk
+    monkeypatch.setattr(withrepo.parse, "PARSE_CACHE", ParseCache())
+    with repo(url=url, commit="c0ffee") as r:
+        parsed = r.parse()
+    assert [p.cached for p in parsed] == [True, True]
+    assert parsed[0].symbols == [Symbol("s", "function", 1, 1, 0, 1, None)]
+    assert len(parsed_paths) == 2
+
+
+def test_symbols_and_their_parents(url):
+    pytest.importorskip("tree_sitter")
+    if get_parser("python") is None:
+        pytest.skip("no tree-sitter grammar for python")
+    with repo(url=url, commit="c0ffee") as r:
+        a, b = r.parse(workers=1)
+    assert [(s.name, s.kind, s.start_line, s.parent) for s in a.symbols] == [
+        ("A", "class", 1, None),
+        ("f", "function", 2, "A"),
+    ]
+    assert [s.name for s in b.symbols] == ["g"]
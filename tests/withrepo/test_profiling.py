@@ -0,0 +1,36 @@
+import os
+import tracemalloc
+
+import pytest
+
+import withrepo.cache
+from withrepo import repo
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+
+
+def test_profile_is_dumped_when_the_body_raises(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "a.py").write_text("a = 1\n")
+
+    with pytest.raises(RuntimeError):
+        with repo(root_path=str(root), profile=str(tmp_path / "profiles")) as r:
+            r.tree()
+            assert tracemalloc.is_tracing()
+            raise RuntimeError("body failed")
+    assert not tracemalloc.is_tracing()
+    (dump,) = os.listdir(tmp_path / "profiles")
+    files = set(os.listdir(tmp_path / "profiles" / dump))
+    assert {"profile.pstats", "profile.txt", "allocations.txt", "meta.json"} <= files
+
+
+def test_failed_fetch_stops_tracing(tmp_path):
+    with pytest.raises(Exception):
+        # the discard port, nothing listens
+        with repo(url="http://127.0.0.1:9/demo", commit="c0ffee", profile=True):
+            pass
+    assert not tracemalloc.is_tracing()
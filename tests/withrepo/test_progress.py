@@ -0,0 +1,55 @@
+import threading
+
+import pytest
+
+import withrepo.cache
+from withrepo import repo, ProgressQueue
+from withrepo.progress import ProgressReporter
+from test_cache import make_zip, serve_archive
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+
+
+def test_fetch_reports_each_phase():
+    server, _ = serve_archive(make_zip({"a.py": "print(1)\n", "b.js": "b = 1\n"}))
+    url = f"http://127.0.0.1:{server.server_address[1]}/demo"
+    events = []
+
+    with repo(url=url, commit="c0ffee", progress=events.append) as r:
+        path = r.path
+    server.shutdown()
+
+    downloads = [e for e in events if e.phase == "download"]
+    assert downloads[-1].fraction == 1.0
+    assert [(e.phase, e.done, e.total, e.unit) for e in events[len(downloads) :]] == [
+        ("extract", 2, 2, "members"),
+        ("split", 2, 2, "groups"),
+        ("done", 1, 1, ""),
+    ]
+    assert events[-1].detail == path
+
+
+def test_failed_fetch_ends_the_queue():
+    events = ProgressQueue()
+
+    def fetch():
+        with pytest.raises(Exception):
+            with repo(url="http://127.0.0.1:1/demo", commit="c0ffee", progress=events):
+                pass
+
+    thread = threading.Thread(target=fetch)
+    thread.start()
+    assert [e.phase for e in events] == ["error"]
+    thread.join()
+
+
+def test_updates_are_rate_limited():
+    events = []
+    reporter = ProgressReporter(events.append, min_interval=60)
+    for done in range(1, 11):
+        reporter.update("download", done, 10, "bytes")
+    # the first update, then only the one that completes the phase
+    assert [e.done for e in events] == [1, 10]
@@ -0,0 +1,96 @@
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import withrepo.cache
+import withrepo.ratelimit
+from withrepo import repo, RateLimiter
+from withrepo.ratelimit import parse_rate_limit_headers
+from test_cache import make_zip
+
+
+@pytest.fixture(autouse=True)
+def isolated_limits(monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+    # fresh tables, restored on teardown, so no bucket outlives its test
+    monkeypatch.setattr(withrepo.ratelimit, "_limits", {})
+    monkeypatch.setattr(withrepo.ratelimit, "_limiters", {})
+    monkeypatch.setattr(withrepo.ratelimit, "_initialized", True)
+
+
+def serve_rate_limited(payload, rejections):
+    """Rejects the first requests with a 429 and Retry-After: 1, then serves payload."""
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(time.monotonic())
+            if len(hits) <= rejections:
+                self.send_response(429)
+                self.send_header("Retry-After", "1")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, hits
+
+
+def test_parse_rate_limit_headers():
+    now = 1_700_000_000.0
+    github = parse_rate_limit_headers(
+        {
+            "X-RateLimit-Limit": "60",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": "1700000030",
+        },
+        now,
+    )
+    assert github == (60, 0, 1_700_000_030.0, None)
+    # the IETF draft's reset is in seconds, Retry-After may be an HTTP date
+    draft = parse_rate_limit_headers(
+        {"RateLimit-Reset": "30", "Retry-After": "Tue, 14 Nov 2023 22:14:00 GMT"}, now
+    )
+    assert draft.reset_at == now + 30
+    assert draft.retry_after == 40
+
+
+def test_rate_limited_downloads_are_retried():
+    server, hits = serve_rate_limited(make_zip({"a.py": "print(1)\n"}), rejections=1)
+    url = f"http://127.0.0.1:{server.server_address[1]}/demo"
+
+    with repo(url=url, commit="c0ffee", timeit=True) as r:
+        assert [f.path for f in r.tree()] == ["a.py"]
+        (download,) = [s for s in r.timings.spans if s.name == "download"]
+        assert download.attributes["retries"] == 1
+    server.shutdown()
+
+    assert len(hits) == 2
+    assert hits[1] - hits[0] >= 0.9
+
+
+def test_waiters_are_served_by_priority():
+    limiter = RateLimiter("example.com", rate=10, burst=1)
+    limiter.acquire()  # empties the bucket
+    served = []
+
+    def wait(priority):
+        limiter.acquire(priority)
+        served.append(priority)
+
+    threads = [threading.Thread(target=wait, args=(p,)) for p in (0, 1, 5, 2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert served == [5, 2, 1, 0]
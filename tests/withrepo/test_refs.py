@@ -0,0 +1,87 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import withrepo.auth
+import withrepo.cache
+import withrepo.ratelimit
+import withrepo.refs
+from withrepo.refs import resolve_ref
+from withrepo.utils import RepoArguments, RepoProvider
+
+SHA = "a" * 40
+ARGS = RepoArguments(user="demo", repo="demo", provider=RepoProvider.GITHUB)
+
+
+@pytest.fixture(autouse=True)
+def isolated_refs(tmp_path, monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", str(tmp_path / "cache"))
+    monkeypatch.setattr(withrepo.ratelimit, "_limits", {})
+    monkeypatch.setattr(withrepo.ratelimit, "_limiters", {})
+    monkeypatch.setattr(withrepo.ratelimit, "_initialized", True)
+    monkeypatch.setattr(withrepo.auth, "_pools", {})
+    monkeypatch.setattr(withrepo.auth, "_initialized", True)
+
+
+def serve_commits(monkeypatch, body, etag='"v1"'):
+    """A commits API stand-in that answers If-None-Match with a 304."""
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(self.headers.get("If-None-Match"))
+            if etag and self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            if etag:
+                self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/commits/HEAD"
+    monkeypatch.setattr(withrepo.refs, "ref_resolution_url", lambda args: url)
+    return server, requests
+
+
+def test_resolutions_are_reused_within_the_ttl(monkeypatch):
+    server, requests = serve_commits(monkeypatch, {"sha": SHA})
+    assert resolve_ref(ARGS) == SHA
+    assert resolve_ref(ARGS) == SHA
+    server.shutdown()
+    assert requests == [None]
+
+
+def test_expired_resolutions_are_revalidated(monkeypatch):
+    server, requests = serve_commits(monkeypatch, {"sha": SHA})
+    assert resolve_ref(ARGS, ttl=0) == SHA
+    assert resolve_ref(ARGS, ttl=0) == SHA  # a 304, answered from the cache
+    server.shutdown()
+    assert requests == [None, '"v1"']
+
+
+@pytest.mark.parametrize("body", [[SHA], {"sha": None}, {"sha": "main"}, {}])
+def test_unparseable_responses_fall_back(monkeypatch, body):
+    server, _ = serve_commits(monkeypatch, body)
+    assert resolve_ref(ARGS) is None
+    server.shutdown()
+
+
+def test_unwritable_cache_still_resolves(tmp_path, monkeypatch):
+    (tmp_path / "cache").mkdir()
+    (tmp_path / "cache" / "refs").write_text("not a directory")
+    server, _ = serve_commits(monkeypatch, {"sha": SHA})
+    assert resolve_ref(ARGS) == SHA
+    server.shutdown()
@@ -0,0 +1,101 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import withrepo.cache
+import withrepo.remote
+from withrepo import repo, init_cache, init_remote_cache
+from withrepo.cache import cache_key
+from test_cache import make_zip, serve_archive
+
+
+def serve_blob_store():
+    """An in-memory stand-in for the shared tier: GET and PUT /<key>."""
+    blobs = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            blob = blobs.get(self.path)
+            if blob is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(blob)))
+            self.end_headers()
+            self.wfile.write(blob)
+
+        def do_PUT(self):
+            blobs[self.path] = self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(201)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, blobs
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+    monkeypatch.setattr(withrepo.remote, "_remote_cache", None)
+
+
+def test_hosts_share_provider_downloads(tmp_path):
+    provider, provider_hits = serve_archive(make_zip({"a.py": "print(1)\n"}))
+    store, blobs = serve_blob_store()
+    url = f"http://127.0.0.1:{provider.server_address[1]}/demo"
+    init_remote_cache(f"http://127.0.0.1:{store.server_address[1]}")
+
+    # every host has its own local cache, and all but the first hit the shared tier
+    trees = []
+    for host in range(3):
+        init_cache(str(tmp_path / f"host{host}"))
+        with repo(url=url, commit="c0ffee", timeit=True) as r:
+            trees.append(sorted(f.path for f in r.tree()))
+            spans = r.timings.spans
+            hits = [s.attributes["hit"] for s in spans if s.name == "remote.get"]
+            assert hits == [host > 0]
+    provider.shutdown()
+    store.shutdown()
+
+    assert len(provider_hits) == 1
+    assert len(blobs) == 1
+    assert trees == [["a.py"]] * 3
+
+
+def test_unreachable_tier_falls_back_to_provider(tmp_path):
+    provider, provider_hits = serve_archive(make_zip({"a.py": "print(1)\n"}))
+    url = f"http://127.0.0.1:{provider.server_address[1]}/demo"
+    init_remote_cache("http://127.0.0.1:9")  # discard port, nothing listens
+    init_cache(str(tmp_path))
+
+    with repo(url=url, commit="c0ffee") as r:
+        assert [f.path for f in r.tree()] == ["a.py"]
+    provider.shutdown()
+    assert len(provider_hits) == 1
+
+
+def test_corrupt_blob_falls_back_to_provider(tmp_path):
+    payload = make_zip({"a.py": "print(1)\n"})
+    provider, provider_hits = serve_archive(payload)
+    store, blobs = serve_blob_store()
+    url = f"http://127.0.0.1:{provider.server_address[1]}/demo"
+    # the right length, so only extraction notices
+    blobs["/" + cache_key(f"{url}/archive/c0ffee.zip")] = b"x" * len(payload)
+    init_remote_cache(f"http://127.0.0.1:{store.server_address[1]}")
+    init_cache(str(tmp_path))
+
+    with repo(url=url, commit="c0ffee") as r:
+        assert [f.path for f in r.tree()] == ["a.py"]
+    provider.shutdown()
+    store.shutdown()
+
+    assert len(provider_hits) == 1
+    assert list(blobs.values()) == [payload]  # replaced by the good archive
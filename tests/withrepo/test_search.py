@@ -0,0 +1,90 @@
+import os
+import re
+
+import pytest
+
+import withrepo.budget
+import withrepo.cache
+from withrepo import repo, init_cache, configure_workspace
+from withrepo.search import load_trigram_index, query_literals
+from withrepo.snapshot import INDEX_LANG_DIR, index_dir
+from test_cache import make_zip, serve_archive
+
+FILES = {
+    "a.py": "color = 1\n",
+    "b.py": "colour = 2\n",
+    "c.py": "flavor = 3\n",
+    "d.txt": "ÄPFEL\n",
+    "e.txt": "KELVIN\n",  # a Kelvin sign, which IGNORECASE folds to k
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+    monkeypatch.setattr(withrepo.budget, "_workspace", None)
+    configure_workspace(str(tmp_path / "workspace"))
+
+
+@pytest.fixture
+def archive(tmp_path):
+    server, _ = serve_archive(make_zip(FILES))
+    init_cache(str(tmp_path / "cache"))
+    yield f"http://127.0.0.1:{server.server_address[1]}/demo"
+    server.shutdown()
+
+
+@pytest.mark.parametrize(
+    "query, literals",
+    [
+        ("colou?r", ["colo"]),
+        ("colou?rful", ["colo", "rful"]),
+        ("(fla)*vor", ["vor"]),
+        ("(fla)+vor", ["fla", "vor"]),
+        ("colou?r|flavor", []),
+        ("(color|flavor) = ", [" = "]),
+    ],
+)
+def test_required_literals(query, literals):
+    assert query_literals(re.compile(query)) == literals
+
+
+@pytest.mark.parametrize(
+    "query, candidates, matches",
+    [
+        ("lour", ["b.py"], ["b.py"]),
+        (re.compile("colou?r"), ["a.py", "b.py"], ["a.py", "b.py"]),
+        (re.compile("(fla)*vor"), ["c.py"], ["c.py"]),
+        (re.compile("colou?r|flavor"), sorted(FILES), ["a.py", "b.py", "c.py"]),
+        (re.compile("äpfel", re.IGNORECASE), sorted(FILES), ["d.txt"]),
+        (re.compile("kelvin", re.IGNORECASE), ["e.txt"], ["e.txt"]),
+    ],
+)
+def test_index_candidates_and_matches(archive, query, candidates, matches):
+    with repo(url=archive, commit="c0ffee") as r:
+        index = r.build_search_index()
+        assert [index.paths[i] for i in index.candidates(query_literals(query))] == (
+            candidates
+        )
+        assert [m.path for m in r.search(query)] == matches
+
+
+def test_stale_index_is_rebuilt(tmp_path):
+    parent = tmp_path / "parent"
+    root = parent / "root"
+    root.mkdir(parents=True)
+    (root / "a.py").write_text("old = 1\n")
+    stored = os.path.join(index_dir(str(root)), INDEX_LANG_DIR)
+
+    with repo(root_path=str(root)) as r:
+        assert [m.line for m in r.search("old")] == ["old = 1"]
+    first = load_trigram_index(stored)
+
+    (root / "a.py").write_text("new = 1\n")
+    with repo(root_path=str(root)) as r:
+        assert r.search("old") == []
+        assert [m.line for m in r.search("new")] == ["new = 1"]
+    assert load_trigram_index(stored).fingerprint != first.fingerprint
+    # the index lives in the workspace, nothing is written next to the caller's tree
+    assert os.listdir(parent) == ["root"]
+    assert os.listdir(root) == ["a.py"]
@@ -0,0 +1,59 @@
+import os
+import stat
+
+import pytest
+
+import withrepo.budget
+import withrepo.cache
+from withrepo import repo, configure_workspace
+from withrepo.trash import drain
+from test_cache import make_zip, serve_archive
+
+
+@pytest.fixture(autouse=True)
+def isolated_workspace(tmp_path, monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+    monkeypatch.setattr(withrepo.budget, "_workspace", None)
+    configure_workspace(str(tmp_path / "work"))
+
+
+@pytest.fixture
+def archive_url():
+    server, hits = serve_archive(make_zip({"a.py": "print(1)\n"}))
+    yield f"http://127.0.0.1:{server.server_address[1]}/demo", hits
+    server.shutdown()
+
+
+def test_read_only_checkouts_are_shared_until_the_last_release(archive_url):
+    url, hits = archive_url
+    with repo(url=url, commit="c0ffee", read_only=True) as a:
+        with repo(url=url, commit="c0ffee", read_only=True) as b:
+            assert a.path == b.path
+            mode = os.stat(os.path.join(a.path, "a.py")).st_mode
+            assert not mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+        # a still holds it
+        assert [f.path for f in a.tree()] == ["a.py"]
+    assert drain(timeout=10)
+    assert not os.path.exists(a.path)
+    assert len(hits) == 1
+
+
+def test_raising_body_releases_its_shared_checkout(archive_url):
+    url, _ = archive_url
+    with pytest.raises(RuntimeError):
+        with repo(url=url, commit="c0ffee", read_only=True) as r:
+            raise RuntimeError("body failed")
+    assert drain(timeout=10)
+    assert not os.path.exists(r.path)
+    # neither the entry nor its holders are left, only its lock file and the trash
+    shared_root = withrepo.budget.get_workspace().shared_root()
+    assert [n for n in os.listdir(shared_root) if len(n) == 32] == []
+
+
+def test_unpinned_read_only_requests_are_not_shared(archive_url):
+    # a HEAD archive from a host whose refs can't be resolved may change underneath
+    url, hits = archive_url
+    with repo(url=url, read_only=True) as a, repo(url=url, read_only=True) as b:
+        assert a.path != b.path
+        assert not a.read_only and not b.read_only
+    assert len(hits) == 2
@@ -0,0 +1,111 @@
+import os
+
+import pytest
+
+import withrepo.budget
+import withrepo.snapshot
+from withrepo import repo, configure_workspace
+from withrepo.snapshot import index_dir, scan
+from withrepo.trash import drain, sweep_stale_indexes
+
+
+@pytest.fixture(autouse=True)
+def isolated_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(withrepo.snapshot, "_snapshots", {})
+    monkeypatch.setattr(withrepo.budget, "_workspace", None)
+    configure_workspace(str(tmp_path / "workspace"))
+
+
+def test_rescan_reuses_unchanged_entries(tmp_path, monkeypatch):
+    root = tmp_path / "root"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "a.py").write_text("a = 1\n")
+    (root / "b.js").write_text("const b = 1\n")
+    first = scan(str(root))
+    assert sorted(first.changed) == ["b.js", "pkg/a.py"]
+
+    # outside the racy window, nothing is listed or read again
+    monkeypatch.setattr(withrepo.snapshot, "RACY_WINDOW_NS", -10**18)
+    again = scan(str(root), first.snapshot)
+    assert (again.changed, again.deleted, again.dirs_listed, again.files_hashed) == (
+        [],
+        [],
+        0,
+        0,
+    )
+
+    (root / "pkg" / "a.py").write_text("a = 2\n")
+    os.remove(root / "b.js")
+    (root / "pkg" / "c.py").write_text("c = 3\n")
+    result = scan(str(root), again.snapshot)
+    assert sorted(result.changed) == ["pkg/a.py", "pkg/c.py"]
+    assert result.deleted == ["b.js"]
+
+
+def test_root_path_language_groups_follow_edits(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "a.py").write_text("a = 1\n")
+    (root / "b.py").write_text("b = 1\n")
+
+    with repo(root_path=str(root)) as r:
+        (python,) = r.lang_groups
+        assert sorted(os.listdir(python.path)) == ["a.py", "b.py"]
+
+    (root / "a.py").write_text("a = 2\n")
+    os.remove(root / "b.py")
+    (root / "c.js").write_text("const c = 1\n")
+
+    with repo(root_path=str(root), timeit=True) as r:
+        groups = {g.language: g.path for g in r.lang_groups}
+        assert sorted(os.listdir(groups["python"])) == ["a.py"]
+        assert open(os.path.join(groups["python"], "a.py")).read() == "a = 2\n"
+        assert sorted(os.listdir(groups["typescript"])) == ["c.js"]
+        assert sorted(f.path for f in r.tree()) == ["a.py", "c.js"]
+        (span,) = [s for s in r.timings.spans if s.name == "index"]
+        assert span.attributes["incremental"]
+
+
+def test_unused_indexes_are_swept(tmp_path):
+    used, unused = tmp_path / "used", tmp_path / "unused"
+    for root in (used, unused):
+        root.mkdir()
+        (root / "a.py").write_text("a = 1\n")
+        with repo(root_path=str(root)):
+            pass
+    old = os.stat(index_dir(str(unused))).st_mtime - 8 * 24 * 60 * 60
+    os.utime(index_dir(str(unused)), (old, old))
+
+    assert sweep_stale_indexes() == [index_dir(str(unused))]
+    assert drain(timeout=10)
+    assert os.path.isdir(index_dir(str(used)))
+    assert not os.path.exists(index_dir(str(unused)))
+
+    with repo(root_path=str(unused), timeit=True) as r:
+        assert [f.path for f in r.tree()] == ["a.py"]
+        (span,) = [s for s in r.timings.spans if s.name == "index"]
+        assert not span.attributes["incremental"]
+
+
+def test_overlapping_contexts_see_their_own_groups(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "a.py").write_text("a = 1\n")
+    (root / "b.py").write_text("b = 1\n")
+
+    with repo(root_path=str(root)) as first:
+        (python,) = first.lang_groups
+        (root / "a.py").write_text("a = 2\n")
+        os.remove(root / "b.py")
+        with repo(root_path=str(root)) as second:
+            (updated,) = second.lang_groups
+            assert sorted(os.listdir(updated.path)) == ["a.py"]
+            assert open(os.path.join(updated.path, "a.py")).read() == "a = 2\n"
+        # the second call updated the index, not the first one's groups
+        assert sorted(os.listdir(python.path)) == ["a.py", "b.py"]
+        assert open(os.path.join(python.path, "a.py")).read() == "a = 1\n"
+        first_view = first.view
+
+    assert drain(timeout=10)
+    assert not os.path.exists(first_view)
+    assert sorted(os.listdir(root)) == ["a.py"]
@@ -0,0 +1,57 @@
+import pytest
+
+import withrepo.cache
+from withrepo import repo, Tracer, add_tracer, remove_tracer
+from test_cache import make_zip, serve_archive
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+
+
+@pytest.fixture
+def url():
+    server, _ = serve_archive(make_zip({"a.py": "print(1)\n", "b.js": "b = 1\n"}))
+    yield f"http://127.0.0.1:{server.server_address[1]}/demo"
+    server.shutdown()
+
+
+def test_phases_are_timed(url):
+    with repo(url=url, commit="c0ffee", timeit=True) as r:
+        r.tree()
+    spans = {s.name: s for s in r.timings.spans}
+    for name in ("resolve", "download", "unpack", "split", "tree", "cleanup"):
+        assert spans[name].parent is None
+        assert spans[name].attributes["provider"] == "github"
+        assert spans[name].duration >= 0
+    assert spans["download.transfer"].parent == "download"
+    assert spans["download"].attributes["bytes"] > 0
+    assert spans["unpack"].attributes["files"] == 2
+    assert spans["split"].attributes["languages"] == 2
+    assert set(r.timings.summary()) == set(spans)
+
+
+def test_tracers_see_spans_without_timeit(url):
+    events = []
+
+    class Recorder(Tracer):
+        def on_start(self, span):
+            events.append(("start", span.name))
+
+        def on_end(self, span):
+            events.append(("end", span.name))
+
+    tracer = Recorder()
+    add_tracer(tracer)
+    try:
+        with repo(url=url, commit="c0ffee") as r:
+            pass
+    finally:
+        remove_tracer(tracer)
+    assert events.index(("start", "download")) < events.index(("end", "download"))
+    assert events[-1] == ("end", "cleanup")
+
+    with repo(url=url, commit="c0ffee") as r:
+        pass
+    assert r.timings.spans == []
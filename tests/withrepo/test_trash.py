@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+import subprocess
+
+import pytest
+
+import withrepo.budget
+import withrepo.cache
+from withrepo import repo, configure_workspace
+from withrepo.trash import TRASH_DIR_NAME, drain, sweep_orphans
+from test_cache import make_zip, serve_archive
+
+
+@pytest.fixture(autouse=True)
+def isolated_workspace(tmp_path, monkeypatch):
+    monkeypatch.setattr(withrepo.cache, "_cache_dir", None)
+    monkeypatch.setattr(withrepo.budget, "_workspace", None)
+    return configure_workspace(str(tmp_path / "work"))
+
+
+def dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def test_cleanup_deletes_in_the_background():
+    server, _ = serve_archive(make_zip({"a.py": "print(1)\n"}))
+    url = f"http://127.0.0.1:{server.server_address[1]}/demo"
+
+    with repo(url=url, commit="c0ffee") as r:
+        scope_dir = os.path.dirname(r.path)
+        groups = [g.path for g in r.lang_groups]
+    server.shutdown()
+
+    # renamed away on exit, whether or not the deletion has finished
+    assert not os.path.exists(scope_dir)
+    assert drain(timeout=10)
+    assert not any(os.path.exists(p) for p in groups)
+    trash = os.path.join(os.path.dirname(scope_dir), TRASH_DIR_NAME)
+    assert os.listdir(trash) == []
+
+
+def test_orphans_of_dead_workers_are_swept(tmp_path):
+    parent = tmp_path / "tmp"
+    dead, mine = dead_pid(), os.getpid()
+    for name in (f"scope_{dead}_a", f"scope_{mine}_b", "scope_old", "scope_new"):
+        (parent / name).mkdir(parents=True)
+    old = time.time() - 2 * 24 * 60 * 60
+    os.utime(parent / "scope_old", (old, old))
+    (parent / TRASH_DIR_NAME / f"{dead}_c").mkdir(parents=True)
+    (parent / TRASH_DIR_NAME / f"{mine}_d").mkdir()
+
+    swept = sweep_orphans(str(parent))
+    assert sorted(os.path.basename(p) for p in swept) == [
+        f"{dead}_c",
+        f"scope_{dead}_a",
+        "scope_old",
+    ]
+    assert drain(timeout=10)
+    remaining = sorted(os.listdir(parent))
+    assert remaining == [f"scope_{mine}_b", "scope_new", TRASH_DIR_NAME]
+    assert os.listdir(parent / TRASH_DIR_NAME) == [f"{mine}_d"]
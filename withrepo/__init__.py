@@ -1,25 +1,168 @@
-from withrepo.withrepo import (
-    repo,
-    RepoContext,
-    RepoFile,
-    File,
-)
-
-from withrepo.utils import (
-    RepoProvider,
-    RepoArguments,
-)
-
-from withrepo.download import (
-    copy_and_split_root_by_language_group,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from withrepo.withrepo import (
+        repo,
+        RepoContext,
+        RepoFile,
+        File,
+    )
+
+    from withrepo.changes import (
+        diff,
+    )
+
+    from withrepo.utils import (
+        RepoProvider,
+        RepoArguments,
+    )
+
+    from withrepo.download import (
+        copy_and_split_root_by_language_group,
+    )
+
+    from withrepo.cache import (
+        init_cache,
+    )
+
+    from withrepo.remote import (
+        init_remote_cache,
+        RemoteCache,
+        HttpBlobStore,
+    )
+
+    from withrepo.ratelimit import (
+        init_rate_limits,
+        request_priority,
+        RateLimiter,
+    )
+
+    from withrepo.auth import (
+        init_auth,
+        TokenPool,
+    )
+
+    from withrepo.budget import (
+        configure_workspace,
+    )
+
+    from withrepo.timing import (
+        Timings,
+        Tracer,
+        add_tracer,
+        remove_tracer,
+    )
+
+    from withrepo.profiling import (
+        configure_profiling,
+    )
+
+    from withrepo.progress import (
+        ProgressEvent,
+        ProgressQueue,
+    )
+
+    from withrepo.search import (
+        SearchMatch,
+    )
+
+    from withrepo.parse import (
+        ParsedFile,
+        Symbol,
+    )
+
+    from withrepo.chunks import (
+        Chunk,
+    )
+
+    from withrepo.metrics import (
+        enable_metrics,
+        disable_metrics,
+        render_metrics,
+    )
+
+# The public API is imported on first access (PEP 562), so `import withrepo` stays
+# cheap for tools that only use part of it, e.g. root_path mode never loads httpx.
+_LAZY_ATTRIBUTES = {
+    "repo": "withrepo.withrepo",
+    "RepoContext": "withrepo.withrepo",
+    "RepoFile": "withrepo.withrepo",
+    "File": "withrepo.withrepo",
+    "diff": "withrepo.changes",
+    "RepoProvider": "withrepo.utils",
+    "RepoArguments": "withrepo.utils",
+    "copy_and_split_root_by_language_group": "withrepo.download",
+    "init_cache": "withrepo.cache",
+    "init_remote_cache": "withrepo.remote",
+    "RemoteCache": "withrepo.remote",
+    "HttpBlobStore": "withrepo.remote",
+    "init_rate_limits": "withrepo.ratelimit",
+    "request_priority": "withrepo.ratelimit",
+    "RateLimiter": "withrepo.ratelimit",
+    "init_auth": "withrepo.auth",
+    "TokenPool": "withrepo.auth",
+    "configure_workspace": "withrepo.budget",
+    "Timings": "withrepo.timing",
+    "Tracer": "withrepo.timing",
+    "add_tracer": "withrepo.timing",
+    "remove_tracer": "withrepo.timing",
+    "configure_profiling": "withrepo.profiling",
+    "ProgressEvent": "withrepo.progress",
+    "ProgressQueue": "withrepo.progress",
+    "SearchMatch": "withrepo.search",
+    "ParsedFile": "withrepo.parse",
+    "Symbol": "withrepo.parse",
+    "Chunk": "withrepo.chunks",
+    "enable_metrics": "withrepo.metrics",
+    "disable_metrics": "withrepo.metrics",
+    "render_metrics": "withrepo.metrics",
+}
 
 __all__ = [
     "repo",
     "RepoContext",
     "RepoFile",
     "File",
+    "diff",
     "RepoArguments",
     "RepoProvider",
     "copy_and_split_root_by_language_group",
-]
\ No newline at end of file
+    "init_cache",
+    "init_remote_cache",
+    "RemoteCache",
+    "HttpBlobStore",
+    "init_rate_limits",
+    "request_priority",
+    "RateLimiter",
+    "init_auth",
+    "TokenPool",
+    "configure_workspace",
+    "Timings",
+    "Tracer",
+    "add_tracer",
+    "remove_tracer",
+    "configure_profiling",
+    "ProgressEvent",
+    "ProgressQueue",
+    "SearchMatch",
+    "ParsedFile",
+    "Symbol",
+    "Chunk",
+    "enable_metrics",
+    "disable_metrics",
+    "render_metrics",
+]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,304 @@
+# Standard library
+import os
+import re
+import math
+import hashlib
+import time
+import itertools
+import threading
+import contextlib
+import contextvars
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
+from urllib.parse import urlparse
+
+# Local
+from withrepo.utils import RepoProvider
+from withrepo.cache import cache_key
+from withrepo.ratelimit import (
+    DEFAULT_BACKOFF,
+    is_rate_limited,
+    parse_rate_limit_headers,
+)
+
+# Third party
+if TYPE_CHECKING:
+    import httpx
+
+# CONSTANTS
+PROVIDER_TOKENS_ENV_VARS = {
+    RepoProvider.GITHUB: "WITHREPO_GITHUB_TOKENS",
+    RepoProvider.GITLAB: "WITHREPO_GITLAB_TOKENS",
+    RepoProvider.BITBUCKET: "WITHREPO_BITBUCKET_TOKENS",
+}
+
+# the hosts a provider's tokens are sent to, never any other
+PROVIDER_AUTH_HOSTS = {
+    RepoProvider.GITHUB: ("github.com", "api.github.com"),
+    RepoProvider.GITLAB: ("gitlab.com",),
+    RepoProvider.BITBUCKET: ("bitbucket.org", "api.bitbucket.org"),
+}
+
+# GitLab takes personal access tokens in its own header
+PROVIDER_AUTH_HEADERS = {RepoProvider.GITLAB: ("PRIVATE-TOKEN", "")}
+
+# github.com archive urls ignore tokens, the API serves the same archive with them
+GITHUB_ARCHIVE_PATTERN = re.compile(
+    r"https://github\.com/([^/]+)/([^/]+)/archive/(.+)\.(zip|tar\.gz)"
+)
+GITHUB_ARCHIVE_ENDPOINTS = {"zip": "zipball", "tar.gz": "tarball"}
+
+
+@dataclass
+class Token:
+    value: str = field(repr=False)
+    name: str  # for logs, the value is never printed
+    remaining: Optional[int] = None  # unknown until a response says
+    limit: Optional[int] = None
+    reset_at: float = 0.0
+    retired_until: float = 0.0
+    last_used: int = 0
+
+
+class TokenPool:
+    """
+    Credentials for one provider, spread across requests by remaining quota.
+
+    Each request takes the token with the most quota left, unknown quotas first
+    so every token is probed once, and the least recently used among equals.
+    Quotas are counted down as tokens are taken and corrected from each
+    response's rate-limit headers; a token that runs out, or is rejected by a
+    rate limit, is retired until its window resets. Pass the same pool to every
+    call that should share its quota.
+    """
+
+    def __init__(
+        self,
+        tokens: Union[str, List[str]],
+        header: str = "Authorization",
+        scheme: str = "Bearer",
+    ):
+        values = [tokens] if isinstance(tokens, str) else list(tokens)
+        if not values:
+            raise Exception("withrepo.auth: a token pool needs at least one token")
+        self.tokens = [Token(value, f"token{i}") for i, value in enumerate(values)]
+        self.header, self.scheme = header, scheme
+        self._uses = itertools.count(1)
+        self._lock = threading.Condition()
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def headers(self, token: Token) -> Dict[str, str]:
+        value = f"{self.scheme} {token.value}" if self.scheme else token.value
+        return {self.header: value}
+
+    def _usable(self, token: Token, now: float) -> bool:
+        if token.retired_until > now:
+            return False
+        if token.remaining is not None and now >= token.reset_at:
+            token.remaining = None  # a new window, sized by the next response
+        return token.remaining is None or token.remaining > 0
+
+    def take(self) -> Optional[Token]:
+        """Returns the token to use next, or None while every token is retired."""
+        with self._lock:
+            now = time.time()
+            usable = [t for t in self.tokens if self._usable(t, now)]
+            if not usable:
+                return None
+            token = max(
+                usable,
+                key=lambda t: (
+                    math.inf if t.remaining is None else t.remaining,
+                    -t.last_used,
+                ),
+            )
+            token.last_used = next(self._uses)
+            if token.remaining is not None:
+                token.remaining -= 1
+            return token
+
+    def next_available(self) -> float:
+        """When the first retired or exhausted token becomes usable again."""
+        with self._lock:
+            return min(
+                max(t.retired_until, t.reset_at if t.remaining == 0 else 0.0)
+                for t in self.tokens
+            )
+
+    def acquire(self, timeout: float) -> Token:
+        """
+        Waits for a token while every token is retired. Only callers of this
+        pool wait, the host stays open to requests with other credentials.
+        Raises TimeoutError if no token comes back within timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            token = self.take()
+            if token is not None:
+                return token
+            wait = self.next_available() - time.time()
+            if time.monotonic() + wait > deadline:
+                raise TimeoutError(
+                    f"withrepo.auth: every token is rate limited for another "
+                    f"{wait:.0f}s"
+                )
+            with self._lock:
+                self._lock.wait(max(wait, 0.0))
+
+    def observe(
+        self, token: Token, status_code: int, headers: Mapping[str, str]
+    ) -> bool:
+        """
+        Updates token's quota from a response. Returns True if the request was
+        rejected by a rate limit, in which case the token is retired and the
+        request should be retried with another.
+        """
+        now = time.time()
+        info = parse_rate_limit_headers(headers, now)
+        limited = is_rate_limited(status_code, info)
+        with self._lock:
+            if info.remaining is not None and info.reset_at is not None:
+                token.remaining, token.limit = info.remaining, info.limit
+                token.reset_at = info.reset_at
+            if limited:
+                if info.retry_after is not None:
+                    token.retired_until = now + info.retry_after
+                elif info.remaining == 0 and info.reset_at is not None:
+                    token.retired_until = info.reset_at
+                else:
+                    token.retired_until = now + DEFAULT_BACKOFF
+            self._lock.notify_all()
+        return limited
+
+
+def make_token_pool(
+    tokens: Union[str, List[str], TokenPool], provider: RepoProvider
+) -> TokenPool:
+    if isinstance(tokens, TokenPool):
+        return tokens
+    header, scheme = PROVIDER_AUTH_HEADERS.get(provider, ("Authorization", "Bearer"))
+    return TokenPool(tokens, header, scheme)
+
+
+_pools: Dict[str, TokenPool] = {}
+_initialized = False
+_lock = threading.Lock()
+# the credentials of the current repo() call and the hosts they are for, which
+# take precedence on those hosts
+_call_pool: contextvars.ContextVar = contextvars.ContextVar(
+    "withrepo_token_pool", default=None
+)
+
+
+def init_auth(
+    tokens: Dict[Union[RepoProvider, str], Union[str, List[str], TokenPool]] = None,
+):
+    """
+    Configures the credentials sent to each provider: a token, a list of tokens
+    or a TokenPool per RepoProvider, or per host for self-hosted and test
+    servers. Defaults come from $WITHREPO_GITHUB_TOKENS, $WITHREPO_GITLAB_TOKENS
+    and $WITHREPO_BITBUCKET_TOKENS, comma-separated.
+    """
+    global _initialized
+    if tokens is None:
+        tokens = {}
+        for provider, env_var in PROVIDER_TOKENS_ENV_VARS.items():
+            values = [t.strip() for t in os.environ.get(env_var, "").split(",")]
+            if any(values):
+                tokens[provider] = [t for t in values if t]
+
+    pools = {}
+    for key, value in tokens.items():
+        if isinstance(key, RepoProvider):
+            pool = make_token_pool(value, key)
+            pools.update((host, pool) for host in PROVIDER_AUTH_HOSTS[key])
+        else:
+            pools[key] = make_token_pool(value, RepoProvider.GITHUB)
+    with _lock:
+        _pools.clear()
+        _pools.update(pools)
+        _initialized = True
+
+
+def get_token_pool(url: str) -> Optional[TokenPool]:
+    """Returns the credentials to send with a request to url, if any."""
+    host = urlparse(url).hostname
+    call = _call_pool.get()
+    if call is not None and host in call[1]:
+        return call[0]
+    if not _initialized:
+        init_auth()
+    return _pools.get(host)
+
+
+def credential_scope(url: str) -> str:
+    """
+    An opaque id of the credentials sent with requests to url, "" when there are
+    none. Trees fetched with credentials are cached under it, so they are only
+    ever served back to callers holding the same tokens.
+    """
+    pool = get_token_pool(url)
+    if pool is None:
+        return ""
+    values = "\0".join(sorted(t.value for t in pool.tokens))
+    return hashlib.sha256(values.encode()).hexdigest()[:16]
+
+
+def scoped_cache_key(url: str) -> str:
+    """cache.cache_key(), scoped by the credentials the url is fetched with."""
+    scope = credential_scope(url)
+    return cache_key(f"{url}#{scope}" if scope else url)
+
+
+def credentials_hook(pool: TokenPool) -> Callable[["httpx.Request"], None]:
+    """
+    An httpx request hook that drops pool's header from requests to hosts it
+    isn't for. httpx only strips Authorization on cross-origin redirects, not
+    headers such as GitLab's PRIVATE-TOKEN.
+    """
+
+    def hook(request: "httpx.Request"):
+        if get_token_pool(str(request.url)) is not pool:
+            request.headers.pop(pool.header, None)
+
+    return hook
+
+
+@contextlib.contextmanager
+def use_tokens(
+    tokens: Union[str, List[str], TokenPool, None], provider: RepoProvider
+) -> Iterator[None]:
+    """
+    Requests to provider's hosts made in this block use tokens, over the
+    configured ones. Requests to any other host never see them.
+    """
+    if tokens is None:
+        yield
+        return
+    pool = make_token_pool(tokens, provider)
+    token = _call_pool.set((pool, PROVIDER_AUTH_HOSTS.get(provider, ())))
+    try:
+        yield
+    finally:
+        _call_pool.reset(token)
+
+
+def authenticated_url(url: str) -> str:
+    """The url that serves the same archive as url to authenticated requests."""
+    match = GITHUB_ARCHIVE_PATTERN.fullmatch(url)
+    if match is None:
+        return url
+    user, repo, ref, extension = match.groups()
+    endpoint = GITHUB_ARCHIVE_ENDPOINTS[extension]
+    return f"https://api.github.com/repos/{user}/{repo}/{endpoint}/{ref}"
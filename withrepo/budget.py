@@ -0,0 +1,173 @@
+# Standard library
+import os
+import json
+import time
+import shutil
+import tarfile
+import tempfile
+import zipfile
+from dataclasses import dataclass
+from typing import List, Optional
+
+# Local
+from withrepo.cache import entry_lock
+from withrepo.utils import is_pid_alive
+
+# CONSTANTS
+WORK_DIR_ENV_VAR = "WITHREPO_WORK_DIR"
+FAST_DIR_ENV_VAR = "WITHREPO_FAST_DIR"
+DISK_BUDGET_ENV_VAR = "WITHREPO_DISK_BUDGET"
+LEDGER_FILE_NAME = ".withrepo-budget.json"
+SHARED_DIR_NAME = "withrepo-shared"
+INDEX_DIR_NAME = "withrepo-index"
+RATE_LIMIT_DIR_NAME = "withrepo-ratelimit"
+FAST_MAX_BYTES = 64 * 1024 * 1024
+FAST_FREE_MARGIN = 1.25
+# the extracted tree plus its language split, which holds each file at most once
+SPLIT_OVERHEAD = 2
+BUDGET_WAIT_TIMEOUT = 5 * 60.0
+BUDGET_POLL_INTERVAL = 0.25
+
+
+@dataclass
+class Workspace:
+    root: str  # where scratch trees are extracted
+    fast_root: str = None  # optional tmpfs for small repos, e.g. /dev/shm
+    fast_max_bytes: int = FAST_MAX_BYTES
+    budget_bytes: int = None  # shared by every process using the same root
+    wait_timeout: float = BUDGET_WAIT_TIMEOUT
+
+    def roots(self) -> List[str]:
+        return [r for r in (self.root, self.fast_root) if r]
+
+    def shared_root(self) -> str:
+        """Where read-only checkouts of uncached trees are shared between contexts."""
+        return os.path.join(self.root, SHARED_DIR_NAME)
+
+    def index_root(self) -> str:
+        """Where root_path snapshots and their language groups persist between calls."""
+        return os.path.join(self.root, INDEX_DIR_NAME)
+
+    def rate_limit_root(self) -> str:
+        """Where provider rate-limit buckets are shared between processes."""
+        return os.path.join(self.root, RATE_LIMIT_DIR_NAME)
+
+
+_workspace: Optional[Workspace] = None
+
+
+def configure_workspace(
+    root: str = None,
+    fast_root: str = None,
+    fast_max_bytes: int = FAST_MAX_BYTES,
+    budget_bytes: int = None,
+    wait_timeout: float = BUDGET_WAIT_TIMEOUT,
+) -> Workspace:
+    """
+    Configures where uncached trees are extracted and how many bytes they may use.
+    Defaults come from $WITHREPO_WORK_DIR, $WITHREPO_FAST_DIR and $WITHREPO_DISK_BUDGET.
+    """
+    global _workspace
+    root = root or os.environ.get(WORK_DIR_ENV_VAR) or tempfile.gettempdir()
+    fast_root = fast_root or os.environ.get(FAST_DIR_ENV_VAR)
+    if budget_bytes is None and os.environ.get(DISK_BUDGET_ENV_VAR):
+        budget_bytes = int(os.environ[DISK_BUDGET_ENV_VAR])
+    for r in (root, fast_root):
+        if r:
+            os.makedirs(r, exist_ok=True)
+    _workspace = Workspace(
+        os.path.abspath(root),
+        os.path.abspath(fast_root) if fast_root else None,
+        fast_max_bytes,
+        budget_bytes,
+        wait_timeout,
+    )
+    return _workspace
+
+
+def get_workspace() -> Workspace:
+    return _workspace or configure_workspace()
+
+
+def estimate_extracted_bytes(archive_path: str, archive_type: str) -> int:
+    """Estimates the scratch bytes a fetch needs from the archive's own metadata."""
+    try:
+        if archive_type == "zip":
+            with zipfile.ZipFile(archive_path) as zf:
+                size = sum(info.file_size for info in zf.infolist())
+        else:
+            with tarfile.open(archive_path, "r:*") as tf:
+                size = sum(member.size for member in tf)
+    except (OSError, zipfile.BadZipFile, tarfile.TarError):
+        size = os.path.getsize(archive_path)
+    return size * SPLIT_OVERHEAD
+
+
+def choose_root(workspace: Workspace, estimated_bytes: int) -> str:
+    """Small repos go to the fast root while it has room, everything else spills to disk."""
+    fast_root = workspace.fast_root
+    if fast_root and estimated_bytes <= workspace.fast_max_bytes:
+        if shutil.disk_usage(fast_root).free > estimated_bytes * FAST_FREE_MARGIN:
+            return fast_root
+    return workspace.root
+
+
+def ledger_path(workspace: Workspace) -> str:
+    return os.path.join(workspace.root, LEDGER_FILE_NAME)
+
+
+def _read_ledger(path: str) -> dict:
+    try:
+        with open(path, "r") as f:
+            ledger = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # reservations of dead processes are released implicitly
+    return {k: v for k, v in ledger.items() if is_pid_alive(v["pid"])}
+
+
+def _write_ledger(path: str, ledger: dict):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(ledger, f)
+    os.replace(tmp_path, path)
+
+
+def reserve(key: str, estimated_bytes: int, workspace: Workspace = None):
+    """
+    Reserves estimated_bytes of the workspace budget under key, waiting for other
+    fetches to release theirs while the budget is exhausted. A fetch larger than
+    the whole budget is admitted once nothing else holds a reservation.
+    """
+    workspace = workspace or get_workspace()
+    if workspace.budget_bytes is None:
+        return
+
+    path = ledger_path(workspace)
+    deadline = time.monotonic() + workspace.wait_timeout
+    while True:
+        with entry_lock(path):
+            ledger = _read_ledger(path)
+            used = sum(v["bytes"] for v in ledger.values())
+            if not ledger or used + estimated_bytes <= workspace.budget_bytes:
+                ledger[key] = {"pid": os.getpid(), "bytes": estimated_bytes}
+                _write_ledger(path, ledger)
+                return
+        if time.monotonic() > deadline:
+            raise TimeoutError(
+                f"withrepo.reserve(): disk budget exhausted, {used} of "
+                f"{workspace.budget_bytes} bytes in use, {estimated_bytes} requested"
+            )
+        time.sleep(BUDGET_POLL_INTERVAL)
+
+
+def release(key: str, workspace: Workspace = None):
+    workspace = workspace or get_workspace()
+    if workspace.budget_bytes is None:
+        return
+
+    path = ledger_path(workspace)
+    with entry_lock(path):
+        ledger = _read_ledger(path)
+        if ledger.pop(key, None) is not None:
+            _write_ledger(path, ledger)
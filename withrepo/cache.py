@@ -0,0 +1,212 @@
+# Standard library
+import os
+import time
+import glob
+import hashlib
+import contextlib
+from typing import Callable, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Local
+from withrepo.utils import force_rmtree, is_pid_alive
+
+# CONSTANTS
+CACHE_DIR_ENV_VAR = "WITHREPO_CACHE_DIR"
+CACHE_FORMAT_ENV_VAR = "WITHREPO_CACHE_FORMAT"
+# "tree" stores extracted directories, "pack" one file per tree (see withrepo.pack),
+# "pack+zlib" the same with every file compressed
+CACHE_FORMATS = ("tree", "pack", "pack+zlib")
+LOCK_TIMEOUT = 30 * 60.0
+LOCK_POLL_INTERVAL = 0.05
+PARTIAL_SUFFIX = ".partial"
+LOCK_SUFFIX = ".lock"
+HOLDERS_SUFFIX = ".holders"
+
+_cache_dir: Optional[str] = None
+_cache_format: str = CACHE_FORMATS[0]
+
+
+def init_cache(path: str = None, format: str = None) -> str:
+    """
+    Explicitly initializes the filesystem cache (for APIs, workers, etc.).
+    Falls back to $WITHREPO_CACHE_DIR, then to a directory under the user's cache dir.
+    format is how new entries are stored, one of CACHE_FORMATS, falling back to
+    $WITHREPO_CACHE_FORMAT; entries of every format are read regardless.
+    """
+    global _cache_dir, _cache_format
+    path = path or os.environ.get(CACHE_DIR_ENV_VAR) or default_cache_dir()
+    format = format or os.environ.get(CACHE_FORMAT_ENV_VAR) or CACHE_FORMATS[0]
+    if format not in CACHE_FORMATS:
+        raise Exception(
+            f"withrepo.cache: unknown format {format}, use one of {CACHE_FORMATS}"
+        )
+    os.makedirs(path, exist_ok=True)
+    _cache_dir = os.path.abspath(path)
+    _cache_format = format
+    return _cache_dir
+
+
+def default_cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "withrepo")
+
+
+def get_cache_dir() -> Optional[str]:
+    """Returns the cache directory, or None if caching hasn't been enabled."""
+    if _cache_dir is None and os.environ.get(CACHE_DIR_ENV_VAR):
+        return init_cache()
+    return _cache_dir
+
+
+def get_cache_format() -> str:
+    return _cache_format
+
+
+def cache_key(url: str) -> str:
+    return hashlib.sha256(url.encode()).hexdigest()[:32]
+
+
+def entry_path(key: str) -> str:
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        raise Exception("withrepo.cache: cache is not initialized, call init_cache()")
+    return os.path.join(cache_dir, key)
+
+
+def is_entry_complete(path: str) -> bool:
+    # entries are published with a single rename, so existence implies completeness
+    return os.path.isdir(path)
+
+
+@contextlib.contextmanager
+def entry_lock(path: str, timeout: float = LOCK_TIMEOUT) -> Iterator[None]:
+    """
+    Holds an exclusive fcntl lock for the cache entry at path.
+
+    flock() locks are released by the kernel when their owner exits, so a worker that
+    dies mid-fetch never leaves a lock behind; whatever it had half-written is swept
+    by the next owner (see remove_partial_entries()).
+    """
+    if fcntl is None:
+        yield
+        return
+
+    fd = os.open(path + LOCK_SUFFIX, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(
+                        f"withrepo.cache: timed out waiting for lock on '{path}'"
+                    )
+                time.sleep(LOCK_POLL_INTERVAL)
+
+        # record the owner, purely to make stuck entries debuggable
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, f"{os.getpid()}\n".encode(), 0)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def remove_partial_entries(path: str):
+    """Removes staging directories left behind by owners that died mid-fetch."""
+    for partial in glob.glob(glob.escape(path) + PARTIAL_SUFFIX + ".*"):
+        force_rmtree(partial)
+
+
+def get_or_create_entry(
+    key: str, create: Callable[[str], None], timeout: float = LOCK_TIMEOUT
+) -> str:
+    """
+    Returns the path of the complete cache entry for key.
+
+    Single-flight across threads and processes: exactly one caller runs
+    create(staging_path) while the others wait on the entry lock, then share
+    the published entry.
+    """
+    path = entry_path(key)
+    if is_entry_complete(path):
+        return path
+
+    with entry_lock(path, timeout=timeout):
+        # another process may have published the entry while we were waiting
+        if is_entry_complete(path):
+            return path
+
+        publish_entry(path, create)
+    return path
+
+
+def publish_entry(path: str, create: Callable[[str], None]):
+    """
+    Runs create(staging_path) and publishes the result at path with a single
+    rename. The caller must hold the entry lock.
+    """
+    remove_partial_entries(path)
+    staging_path = f"{path}{PARTIAL_SUFFIX}.{os.getpid()}"
+    os.makedirs(staging_path)
+    try:
+        create(staging_path)
+        os.rename(staging_path, path)
+    except BaseException:
+        force_rmtree(staging_path)
+        raise
+
+
+def add_holder(path: str) -> str:
+    """Registers the calling process as a reader of the entry at path."""
+    holders_dir = path + HOLDERS_SUFFIX
+    os.makedirs(holders_dir, exist_ok=True)
+    holder = os.path.join(holders_dir, f"{os.getpid()}_{os.urandom(8).hex()}")
+    open(holder, "w").close()
+    return holder
+
+
+def remove_holder(holder: str):
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(holder)
+
+
+def live_holders(path: str) -> List[str]:
+    """
+    The readers of the entry at path. Holders left behind by dead processes are
+    removed, so a crashed reader never pins an entry forever.
+    """
+    holders_dir = path + HOLDERS_SUFFIX
+    try:
+        names = os.listdir(holders_dir)
+    except FileNotFoundError:
+        return []
+    live = []
+    for name in names:
+        holder = os.path.join(holders_dir, name)
+        pid = name.split("_", 1)[0]
+        if pid.isdigit() and is_pid_alive(int(pid)):
+            live.append(holder)
+        else:
+            remove_holder(holder)
+    return live
+
+
+def evict_entry(key: str):
+    path = entry_path(key)
+    with entry_lock(path):
+        holders = live_holders(path)
+        if holders:
+            raise Exception(
+                f"withrepo.cache: {path} is in use by {len(holders)} read-only contexts"
+            )
+        if os.path.exists(path):
+            force_rmtree(path)
@@ -0,0 +1,110 @@
+# Standard library
+import contextlib
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# Local
+from withrepo.manifest import hash_file
+from withrepo.withrepo import File, RepoContext, RepoFile, repo
+
+# CONSTANTS
+ADDED = "added"
+MODIFIED = "modified"
+DELETED = "deleted"
+RENAMED = "renamed"
+
+RepoSpec = Union[dict, RepoContext]
+
+
+def content_hash(f: RepoFile) -> str:
+    # manifest-backed trees already know it; walked trees hash on demand, once
+    if f.content_hash is None:
+        f.content_hash = hash_file(f.abs_path)
+    return f.content_hash
+
+
+def file_changed(base: RepoFile, head: RepoFile) -> bool:
+    if base.size is not None and head.size is not None and base.size != head.size:
+        return True
+    return content_hash(base) != content_hash(head)
+
+
+def diff_trees(
+    base_files: Dict[str, RepoFile],
+    head_files: Dict[str, RepoFile],
+    detect_renames: bool = True,
+) -> List[Tuple[str, Optional[RepoFile], Optional[RepoFile]]]:
+    """
+    (change_type, base file, head file) for every path that differs, by path.
+    Renames are exact: a deleted and an added file with the same content.
+    """
+    added = [p for p in head_files if p not in base_files]
+    deleted = [p for p in base_files if p not in head_files]
+    changes = [
+        (MODIFIED, base_files[p], head_files[p])
+        for p in head_files
+        if p in base_files and file_changed(base_files[p], head_files[p])
+    ]
+
+    if detect_renames and added and deleted:
+        deleted_by_hash = defaultdict(list)
+        for p in sorted(deleted):
+            deleted_by_hash[content_hash(base_files[p])].append(p)
+        remaining_added = []
+        for p in sorted(added):
+            candidates = deleted_by_hash.get(content_hash(head_files[p]))
+            if candidates:
+                changes.append((RENAMED, base_files[candidates.pop(0)], head_files[p]))
+            else:
+                remaining_added.append(p)
+        renamed_from = {base.path for change, base, _ in changes if change == RENAMED}
+        added = remaining_added
+        deleted = [p for p in deleted if p not in renamed_from]
+
+    changes.extend((ADDED, None, head_files[p]) for p in added)
+    changes.extend((DELETED, base_files[p], None) for p in deleted)
+    changes.sort(key=lambda c: (c[2] or c[1]).path)
+    return changes
+
+
+@contextlib.contextmanager
+def open_spec(spec: RepoSpec, common: dict) -> Iterator[RepoContext]:
+    if isinstance(spec, RepoContext):
+        yield spec
+        return
+    with repo(**{**common, **spec}) as ctx:
+        yield ctx
+
+
+def diff(
+    base: RepoSpec,
+    head: RepoSpec,
+    include_content: bool = True,
+    detect_renames: bool = True,
+    **common,
+) -> Iterator[File]:
+    """
+    Yields a File, with change_type set, for every file added, modified, deleted
+    or renamed between base and head. Each spec is an open RepoContext or the
+    repo() arguments for one, merged over common:
+
+        for f in withrepo.diff({"commit": base_sha}, {"commit": head_sha},
+                               user="user", repo="repo"):
+            print(f.change_type, f.path)
+
+    Trees are compared by size and content hash, from their manifests when they
+    have one, and only changed files are read. Deleted files carry the base
+    content; renamed files also carry previous_path. The trees are cleaned up
+    once the iteration ends, so read what you need from each File as it comes.
+    """
+    with open_spec(base, common) as base_ctx, open_spec(head, common) as head_ctx:
+        base_files = {f.path: f for f in base_ctx.tree()}
+        head_files = {f.path: f for f in head_ctx.tree()}
+        for change_type, base_file, head_file in diff_trees(
+            base_files, head_files, detect_renames
+        ):
+            file = File.from_repo_file(head_file or base_file, include_content)
+            file.change_type = change_type
+            if change_type == RENAMED:
+                file.previous_path = base_file.path
+            yield file
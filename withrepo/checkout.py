@@ -0,0 +1,142 @@
+# Standard library
+import os
+import errno
+import shutil
+import stat
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# CONSTANTS
+CHECKOUT_MODES = ("reflink", "hardlink", "copy")
+# what each mode falls back to, cheapest first
+CHECKOUT_FALLBACKS = {
+    "reflink": ("reflink", "copy"),
+    "hardlink": ("hardlink", "reflink", "copy"),
+    "copy": ("copy",),
+}
+FICLONE = 0x40049409  # _IOW(0x94, 9, int), from linux/fs.h
+COPY_CHUNK_SIZE = 64 * 1024 * 1024
+
+# errors that mean "this filesystem (pair) can't do that", not "this file failed"
+UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.EPERM,
+    errno.EMLINK,
+    errno.EOPNOTSUPP,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+    errno.ENOSYS,
+}
+
+
+def reflink_file(src: str, dst: str):
+    """Clones src into dst sharing extents (btrfs, XFS, bcachefs, APFS-on-Linux...)."""
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, "reflinks need fcntl")
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.remove(dst)
+            raise
+
+
+def copy_file(src: str, dst: str):
+    """In-kernel copy via copy_file_range where available, else a plain copy."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if hasattr(os, "copy_file_range"):
+            size = os.fstat(fsrc.fileno()).st_size
+            copied = 0
+            try:
+                while copied < size:
+                    n = os.copy_file_range(
+                        fsrc.fileno(), fdst.fileno(), min(COPY_CHUNK_SIZE, size - copied)
+                    )
+                    if n == 0:
+                        break
+                    copied += n
+                if copied == size:
+                    return
+            except OSError as e:
+                if e.errno not in UNSUPPORTED_ERRNOS:
+                    raise
+            fsrc.seek(copied)
+            fdst.seek(copied)
+        shutil.copyfileobj(fsrc, fdst, COPY_CHUNK_SIZE)
+
+
+class Materializer:
+    """
+    Places files with the requested mode, falling back along CHECKOUT_FALLBACKS.
+    Once a mode fails as unsupported it isn't retried, since the next file is
+    almost always on the same pair of filesystems.
+    """
+
+    def __init__(self, mode: str):
+        if mode not in CHECKOUT_MODES:
+            raise Exception(
+                f"withrepo.checkout: unknown mode {mode}, use one of {CHECKOUT_MODES}"
+            )
+        self.modes = list(CHECKOUT_FALLBACKS[mode])
+        self.counts = {m: 0 for m in CHECKOUT_MODES}
+
+    def place(self, src: str, dst: str, st_mode: int):
+        while True:
+            mode = self.modes[0]
+            try:
+                if mode == "hardlink":
+                    os.link(src, dst)
+                else:
+                    if mode == "reflink":
+                        reflink_file(src, dst)
+                    else:
+                        copy_file(src, dst)
+                    # the copy is the caller's to edit, even if the source is read-only
+                    os.chmod(dst, stat.S_IMODE(st_mode) | stat.S_IWUSR)
+                self.counts[mode] += 1
+                return
+            except OSError as e:
+                if e.errno not in UNSUPPORTED_ERRNOS or len(self.modes) == 1:
+                    raise
+                self.modes.pop(0)
+
+    @property
+    def mode(self) -> str:
+        """The mode most files were placed with."""
+        return max(self.counts, key=self.counts.get)
+
+
+def checkout_tree(root: str, dest: str, mode: str = "reflink") -> Materializer:
+    """
+    Recreates the tree at root in dest, which must not exist or be empty.
+    Symlinks are recreated as symlinks, never followed, and file modes are kept
+    (made writable by their owner).
+    """
+    materializer = Materializer(mode)
+    if os.path.exists(dest) and os.listdir(dest):
+        raise Exception(f"withrepo.checkout: {dest} is not empty")
+    os.makedirs(dest, exist_ok=True)
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        relative = os.path.relpath(dirpath, root)
+        target_dir = dest if relative == "." else os.path.join(dest, relative)
+        for name in dirnames:
+            src = os.path.join(dirpath, name)
+            if os.path.islink(src):  # os.walk lists links to directories here
+                os.symlink(os.readlink(src), os.path.join(target_dir, name))
+            else:
+                os.mkdir(os.path.join(target_dir, name))
+        for name in filenames:
+            src = os.path.join(dirpath, name)
+            dst = os.path.join(target_dir, name)
+            st = os.lstat(src)
+            if stat.S_ISLNK(st.st_mode):
+                os.symlink(os.readlink(src), dst)
+            elif stat.S_ISREG(st.st_mode):
+                materializer.place(src, dst, st.st_mode)
+    return materializer
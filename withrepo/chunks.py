@@ -0,0 +1,132 @@
+# Standard library
+import itertools
+from collections import deque
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# Local
+from withrepo.grep import available_cpus
+from withrepo.search import is_binary
+from withrepo.pack import read_file
+
+# CONSTANTS
+DEFAULT_MAX_CHARS = 2000
+CHUNK_TASK_SIZE = 32  # files per worker task
+PARALLEL_MIN_FILES = 512
+TASKS_IN_FLIGHT_PER_WORKER = 2  # bounds memory when the consumer is slower
+
+
+class Chunk(NamedTuple):
+    path: str
+    start_line: int  # 1-based, inclusive
+    end_line: int
+    text: str
+    language: Optional[str]
+
+
+def chunk_text(
+    text: str,
+    path: str,
+    language: str = None,
+    max_chars: int = None,
+    max_lines: int = None,
+    overlap: int = 0,
+) -> Iterator[Chunk]:
+    """
+    Splits text on line boundaries into chunks of at most max_chars characters
+    and max_lines lines, where consecutive chunks share overlap lines. A line
+    longer than max_chars is split on its own into max_chars pieces.
+    """
+    if max_chars is None and max_lines is None:
+        max_chars = DEFAULT_MAX_CHARS
+    # "\n" only, as grep counts lines; splitlines() also breaks on \r, \f, ...
+    lines = [line + "\n" for line in text.split("\n")]
+    lines[-1] = lines[-1][:-1]
+    if not lines[-1]:
+        lines.pop()
+    start, n_lines = 0, len(lines)
+    while start < n_lines:
+        end, size = start, 0
+        while end < n_lines and (max_lines is None or end - start < max_lines):
+            too_big = max_chars is not None and size + len(lines[end]) > max_chars
+            if too_big and end > start:
+                break
+            size += len(lines[end])
+            end += 1
+
+        if max_chars is not None and size > max_chars:  # a single, overlong line
+            line = lines[start]
+            for i in range(0, len(line), max_chars):
+                yield Chunk(path, start + 1, start + 1, line[i : i + max_chars], language)
+        else:
+            yield Chunk(path, start + 1, end, "".join(lines[start:end]), language)
+
+        if end >= n_lines:
+            break
+        start = max(end - overlap, start + 1)
+
+
+def chunk_file(
+    path: str, abs_path: str, language: Optional[str], **limits
+) -> List[Chunk]:
+    try:
+        data = read_file(abs_path)
+    except OSError:
+        return []
+    if is_binary(data):
+        return []
+    return list(chunk_text(data.decode(errors="replace"), path, language, **limits))
+
+
+def _chunk_files(
+    files: Sequence[Tuple[str, str, Optional[str]]], limits: dict
+) -> List[Chunk]:
+    chunks = []
+    for path, abs_path, language in files:
+        chunks.extend(chunk_file(path, abs_path, language, **limits))
+    return chunks
+
+
+def batched(iterable: Iterable, n: int) -> Iterator[list]:
+    it = iter(iterable)
+    while batch := list(itertools.islice(it, n)):
+        yield batch
+
+
+def chunk_files(
+    files: Sequence[Tuple[str, str, Optional[str]]],
+    max_chars: int = None,
+    max_lines: int = None,
+    overlap: int = 0,
+    workers: int = None,
+) -> Iterator[Chunk]:
+    """
+    Streams the chunks of (relative path, absolute path, language) files in order,
+    reading each file only when it's reached. With workers > 1 files are chunked
+    on a process pool, a bounded number of tasks ahead of the consumer.
+    """
+    limits = dict(max_chars=max_chars, max_lines=max_lines, overlap=overlap)
+    if workers is None:
+        workers = 1 if len(files) < PARALLEL_MIN_FILES else available_cpus()
+    if workers <= 1:
+        for path, abs_path, language in files:
+            yield from chunk_file(path, abs_path, language, **limits)
+        return
+
+    tasks = batched(files, CHUNK_TASK_SIZE)
+    # deferred, it pulls in multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = deque(
+            pool.submit(_chunk_files, task, limits)
+            for task in itertools.islice(tasks, workers * TASKS_IN_FLIGHT_PER_WORKER)
+        )
+        while pending:
+            chunks = pending.popleft().result()
+            task = next(tasks, None)
+            if task is not None:
+                pending.append(pool.submit(_chunk_files, task, limits))
+            yield from chunks
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -12,7 +12,10 @@ Attribution:
 
 # Standard library
 import os
+import time
 import shutil
+import tarfile
+import zipfile
 import tempfile
 from typing import List, Tuple
 
@@ -22,10 +25,35 @@ from withrepo.utils import (
     RepoProvider,
     LanguageGroup,
     copy_and_split_root_by_language_group,
+    force_rmtree,
+    scope_prefix,
+)
+from withrepo.manifest import build_manifest, write_manifest, is_sidecar
+from withrepo.cache import (
+    cache_key,
+    get_or_create_entry,
+    get_cache_format,
+    CACHE_FORMATS,
+)
+from withrepo.pack import PACK_FILE_NAME, open_pack, write_pack
+from withrepo.remote import get_remote_cache
+from withrepo.ratelimit import get_rate_limiter, MAX_RETRIES
+from withrepo.auth import (
+    authenticated_url,
+    credential_scope,
+    credentials_hook,
+    get_token_pool,
+    scoped_cache_key,
+)
+from withrepo.timing import Timings
+from withrepo.progress import ProgressReporter
+from withrepo.budget import (
+    get_workspace,
+    estimate_extracted_bytes,
+    choose_root,
+    reserve,
+    release,
 )
-
-# Third party
-import httpx
 
 # CONSTANTS
 CHUNK_SIZE = 2 * 1024 * 1024
@@ -37,47 +65,280 @@ PROVIDER_TO_URL_MAP = {
 }
 
 
-def download_and_extract_archive(url: str) -> Tuple[str, List[LanguageGroup]]:
+# Layout of a cache entry
+CACHE_TREE_DIR = "tree"
+CACHE_LANG_DIR = "lang"
+
+
+def collapse_single_child(directory: str) -> str:
+    child_dirs = [c for c in os.listdir(directory) if not is_sidecar(c)]
+    if len(child_dirs) == 1:
+        return os.path.join(directory, child_dirs[0])
+    return directory
+
+
+def clear_directory(directory: str):
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if os.path.isdir(path) and not os.path.islink(path):
+            force_rmtree(path)
+        else:
+            os.remove(path)
+
+
+def download_archive(
+    url: str,
+    file_name: str,
+    timings: Timings = None,
+    progress: ProgressReporter = None,
+) -> int:
+    """
+    Streams the archive at url into file_name. Returns the number of bytes written.
+
+    Requests wait their turn in the host's rate limiter, and responses rejected
+    by a rate limit are retried once the limiter says the host has recovered.
+    With credentials for the host, each attempt takes a token from its pool, and
+    waits on the pool alone while every token is retired.
+    """
+    import httpx  # deferred, it's most of the cost of importing withrepo
+
+    timings = timings or Timings()
+    pool = get_token_pool(url)
+    request_url = authenticated_url(url) if pool else url
+    limiter = get_rate_limiter(request_url)
+    written = 0
+    hooks = {"request": [credentials_hook(pool)]} if pool else None
+    with httpx.Client(follow_redirects=True, http2=True, event_hooks=hooks) as client:
+        with timings.span("download", url=url) as download_span:
+            for attempt in range(MAX_RETRIES + 1):
+                token = None
+                with timings.span("ratelimit", host=limiter.host) as limit_span:
+                    started = time.monotonic()
+                    if pool is not None:
+                        token = pool.acquire(limiter.max_wait)
+                    limiter.acquire()
+                    limit_span.set(waited=time.monotonic() - started)
+                request = client.build_request(
+                    "GET",
+                    request_url,
+                    headers=pool.headers(token) if token else None,
+                    timeout=60.0,
+                    extensions={"trace": timings.httpx_trace()},
+                )
+                # time to first byte, including connect and redirects
+                with timings.span("download.ttfb"):
+                    response = client.send(request, stream=True)
+                status, headers = response.status_code, response.headers
+                if token is not None:
+                    limited = pool.observe(token, status, headers)
+                else:
+                    limited = limiter.observe(status, headers)
+                if not limited or attempt == MAX_RETRIES:
+                    break
+                response.close()
+            download_span.set(retries=attempt)
+            try:
+                if response.status_code != 200:
+                    error_text = response.read().decode()
+                    raise httpx.RequestError(
+                        f"Error downloading file '{url}': {response.status_code} {error_text}"
+                    )
+                content_length = response.headers.get("content-length")
+                total = int(content_length) if content_length else None
+                with timings.span("download.transfer") as transfer_span:
+                    with open(file_name, "wb") as f:
+                        for chunk in response.iter_raw(chunk_size=CHUNK_SIZE):
+                            f.write(chunk)
+                            written += len(chunk)
+                            if progress:
+                                progress.update("download", written, total, "bytes")
+                    transfer_span.set(bytes=written)
+                if progress and total is None:
+                    progress.update("download", written, written, "bytes")
+            finally:
+                response.close()
+            download_span.set(bytes=written, http_version=response.http_version)
+    return written
+
+
+def is_public(url: str) -> bool:
+    """
+    Whether url serves its archive to anonymous requests too. Any failure to
+    tell, including a host that refuses HEAD, counts as private.
+    """
+    import httpx
+
+    limiter = get_rate_limiter(url)
+    try:
+        limiter.acquire()
+        response = httpx.head(url, follow_redirects=True, timeout=60.0)
+    except (httpx.HTTPError, TimeoutError):
+        return False
+    limiter.observe(response.status_code, response.headers)
+    return response.status_code == 200
+
+
+def extract_archive(
+    archive_path: str,
+    extract_directory: str,
+    archive_type: str,
+    progress: ProgressReporter = None,
+) -> int:
+    """
+    Same as shutil.unpack_archive(), but member by member so progress can be
+    reported against the member count. Returns the number of members extracted.
+    """
+    if not progress:
+        shutil.unpack_archive(archive_path, extract_directory, archive_type)
+        return 0
+
+    if archive_type == "zip":
+        with zipfile.ZipFile(archive_path) as zf:
+            members = zf.infolist()
+            for i, member in enumerate(members, 1):
+                zf.extract(member, extract_directory)
+                progress.update("extract", i, len(members), "members")
+        return len(members)
+
+    with tarfile.open(archive_path, "r:*") as tf:
+        members = tf.getmembers()
+
+        def reporting_members():
+            for i, member in enumerate(members, 1):
+                yield member
+                progress.update("extract", i, len(members), "members")
+
+        kwargs = {"filter": "tar"} if hasattr(tarfile, "tar_filter") else {}
+        tf.extractall(extract_directory, members=reporting_members(), **kwargs)
+    return len(members)
+
+
+def download_and_extract_archive(
+    url: str,
+    extract_directory: str = None,
+    lang_group_directory: str = None,
+    timings: Timings = None,
+    progress: ProgressReporter = None,
+    shareable: bool = False,
+    split: bool = True,
+) -> Tuple[str, List[LanguageGroup]]:
     """
     Downloads the archive from the given URL having format {archive_type} and extracts it to the given {target_path}
+
+    Without an extract_directory, the tree goes to a scratch directory in the
+    configured workspace, after reserving its estimated size from the disk budget;
+    the reservation is keyed by that scratch directory and released on cleanup.
+
+    Shareable (commit-pinned) archives are fetched from the remote cache tier
+    when one is enabled, and archives fetched from the provider are published
+    there once they extract cleanly, if they are public; a blob that fails to
+    extract is fetched again from the provider. Without split, no language
+    groups are made.
     """
     if not url:
         raise Exception("withrepo.download_file(): URL is empty")
 
+    timings = timings or Timings()
     archive_type = url.split(".")[-1]
-    extract_directory = tempfile.mkdtemp(prefix="scope_")
-    fd, tmp_file_name = tempfile.mkstemp(prefix="scope_")
+    workspace = get_workspace()
+    fd, tmp_file_name = tempfile.mkstemp(prefix=scope_prefix(), dir=workspace.root)
+    os.close(fd)
+    scratch_directory = None
     lang_groups = []
 
+    remote = get_remote_cache() if shareable else None
+    from_remote = False
+
     try:
-        # Download the archive
-        client = httpx.Client(follow_redirects=True, http2=True)
-        with client.stream("GET", url, timeout=60.0) as response:
-            if response.status_code != 200:
-                error_text = response.read().decode()
-                raise httpx.RequestError(
-                    f"Error downloading file '{url}': {response.status_code} {error_text}"
-                )
-            with os.fdopen(fd, "wb") as f:
-                for chunk in response.iter_raw(chunk_size=CHUNK_SIZE):
-                    f.write(chunk)
+        # Download the archive, from the hosts' shared tier if it has it
+        if remote is not None:
+            with timings.span("remote.get") as remote_span:
+                from_remote = remote.get(cache_key(url), tmp_file_name)
+                remote_span.set(hit=from_remote)
+        if not from_remote:
+            download_archive(url, tmp_file_name, timings, progress)
 
         # Extract the archive
-        if archive_type in {"zip", "tar", "gztar", "bztar", "xztar"}:
-            shutil.unpack_archive(tmp_file_name, extract_directory, archive_type)
-        else:
+        if archive_type not in {"zip", "tar", "gztar", "bztar", "xztar"}:
             raise Exception(
                 f"download_and_extract_archive(): Unsupported archive type '{archive_type}'"
             )
+        with timings.span("unpack") as unpack_span:
+            estimated_bytes = estimate_extracted_bytes(tmp_file_name, archive_type)
+            if extract_directory is None:
+                scratch_root = choose_root(workspace, estimated_bytes)
+                scratch_directory = tempfile.mkdtemp(
+                    prefix=scope_prefix(), dir=scratch_root
+                )
+                with timings.span("unpack.reserve", bytes=estimated_bytes):
+                    reserve(scratch_directory, estimated_bytes, workspace)
+                extract_directory = scratch_directory
+            try:
+                extract_archive(
+                    tmp_file_name, extract_directory, archive_type, progress
+                )
+            except Exception:
+                if not from_remote:
+                    raise
+                # a corrupt blob in the shared tier costs a provider download, never
+                # the call; the good archive replaces it below
+                unpack_span.set(remote_corrupt=True)
+                clear_directory(extract_directory)
+                from_remote = False
+                download_archive(url, tmp_file_name, timings, progress)
+                extract_archive(
+                    tmp_file_name, extract_directory, archive_type, progress
+                )
+
+            # TODO: figure out if this screws up with path removal on cleanup
+            extract_directory = collapse_single_child(extract_directory)
+
+            # Index the tree once, so tree() and the language split never re-walk it
+            with timings.span("unpack.manifest") as manifest_span:
+                manifest = build_manifest(extract_directory)
+                write_manifest(manifest)
+                manifest_span.set(files=len(manifest.entries))
+            unpack_span.set(
+                files=len(manifest.entries),
+                bytes=sum(e.size for e in manifest.entries),
+            )
 
         # Split the archive into language groups
-        lang_groups.extend(copy_and_split_root_by_language_group(extract_directory))
+        if split:
+            with timings.span("split") as split_span:
+                lang_groups.extend(
+                    copy_and_split_root_by_language_group(
+                        extract_directory,
+                        manifest,
+                        lang_group_directory,
+                        scratch_dir=scratch_root if scratch_directory else None,
+                        progress=progress,
+                    )
+                )
+                split_span.set(
+                    languages=len(lang_groups),
+                    files=sum(
+                        len(manifest.entries_for_language(g.language))
+                        for g in lang_groups
+                    ),
+                )
 
-        # TODO: figure out if this screws up with path removal on cleanup
-        child_dirs = os.listdir(extract_directory)
-        if len(child_dirs) == 1:
-            extract_directory = os.path.join(extract_directory, child_dirs[0])
+        if remote is not None and not from_remote:
+            with timings.span("remote.put") as remote_span:
+                # private trees never leave this host: an archive fetched with
+                # credentials is only shared if anonymous requests get it too
+                public = not credential_scope(url) or is_public(url)
+                remote_span.set(
+                    public=public,
+                    stored=public and remote.put(cache_key(url), tmp_file_name),
+                    bytes=os.path.getsize(tmp_file_name),
+                )
     except Exception as exc:
+        if scratch_directory is not None:
+            shutil.rmtree(scratch_directory, ignore_errors=True)
+            for lang_group in lang_groups:
+                shutil.rmtree(lang_group.path, ignore_errors=True)
+            release(scratch_directory, workspace)
         raise Exception(
             f"Error extracting archive '{tmp_file_name}' obtained from '{url}': {exc}"
         ) from exc
@@ -90,6 +351,87 @@ def download_and_extract_archive(url: str) -> Tuple[str, List[LanguageGroup]]:
     return extract_directory, lang_groups
 
 
+def load_cached_archive(entry: str) -> Tuple[str, List[LanguageGroup]]:
+    """
+    Returns the source directory and language groups stored in a cache entry.
+    For packed entries both are the pack file, language groups are views of it.
+    """
+    pack_path = os.path.join(entry, PACK_FILE_NAME)
+    if os.path.isfile(pack_path):
+        languages = open_pack(pack_path).manifest().languages()
+        lang_groups = [LanguageGroup(lang, pack_path) for lang in sorted(languages)]
+        return pack_path, lang_groups
+    source_directory = collapse_single_child(os.path.join(entry, CACHE_TREE_DIR))
+    lang_dir = os.path.join(entry, CACHE_LANG_DIR)
+    lang_groups = [
+        LanguageGroup(language, os.path.join(lang_dir, language))
+        for language in sorted(os.listdir(lang_dir))
+    ]
+    return source_directory, lang_groups
+
+
+def extract_archive_entry(
+    url: str,
+    entry: str,
+    timings: Timings = None,
+    progress: ProgressReporter = None,
+    shareable: bool = True,
+    format: str = CACHE_FORMATS[0],
+):
+    """
+    Fills an empty entry directory with the tree of url, stored in the given
+    cache format: the extracted tree and its language groups, or a pack.
+    """
+    if format != "tree":
+        # extracted to scratch space, which is only needed while packing
+        workspace = get_workspace()
+        scratch_directory = tempfile.mkdtemp(prefix=scope_prefix(), dir=workspace.root)
+        try:
+            root, _ = download_and_extract_archive(
+                url, scratch_directory, None, timings, progress, shareable, split=False
+            )
+            with timings.span("pack", format=format) as pack_span:
+                pack_span.set(
+                    bytes=write_pack(
+                        root,
+                        os.path.join(entry, PACK_FILE_NAME),
+                        compress=format == "pack+zlib",
+                    )
+                )
+        finally:
+            shutil.rmtree(scratch_directory, ignore_errors=True)
+        return
+
+    tree_dir = os.path.join(entry, CACHE_TREE_DIR)
+    lang_dir = os.path.join(entry, CACHE_LANG_DIR)
+    os.makedirs(tree_dir)
+    os.makedirs(lang_dir)
+    download_and_extract_archive(url, tree_dir, lang_dir, timings, progress, shareable)
+
+
+def download_and_extract_archive_cached(
+    url: str, timings: Timings = None, progress: ProgressReporter = None
+) -> Tuple[str, List[LanguageGroup]]:
+    """
+    Same as download_and_extract_archive(), but through the filesystem cache:
+    concurrent callers for the same url, in any process, share a single fetch.
+    """
+    timings = timings or Timings()
+    fetched = False
+
+    def create(staging: str):
+        nonlocal fetched
+        fetched = True
+        extract_archive_entry(
+            url, staging, timings, progress, format=get_cache_format()
+        )
+
+    with timings.span("cache") as cache_span:
+        entry = get_or_create_entry(scoped_cache_key(url), create)
+        cache_span.set(hit=not fetched)
+    return load_cached_archive(entry)
+
+
 ### TODO
 # GITLAB default clone
 # https://gitlab.com/NTPsec/ntpsec/-/archive/master/ntpsec-master.zip
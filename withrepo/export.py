@@ -0,0 +1,159 @@
+# Standard library
+import io
+import os
+import json
+import struct
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple
+
+# Local
+from withrepo.pack import read_file, split_pack_path
+
+# CONSTANTS
+EXPORT_FORMATS = ("jsonl", "binary")
+EXPORT_FIELDS = ("path", "abs_path", "language", "is_code", "size", "content_hash")
+BINARY_MAGIC = b"WREXPORT"
+BINARY_VERSION = 1
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Binary format, all integers little-endian:
+#   magic, u32 header length, header JSON {"version", "fields", "content"}
+#   then per file: u32 row length, row JSON (a list of field values, in order),
+#   and if content is exported, u64 content length and the raw content bytes.
+
+
+def field_values(f, fields: Sequence[str]) -> list:
+    return [getattr(f, field) for field in fields]
+
+
+def _text_writer(fileobj):
+    if isinstance(fileobj, io.TextIOBase):
+        return fileobj.write
+    return lambda s: fileobj.write(s.encode())
+
+
+def export_jsonl(
+    files, fileobj, fields: Sequence[str], include_content: bool
+) -> int:
+    """One JSON object per line; content is decoded as UTF-8, with replacement."""
+    write = _text_writer(fileobj)
+    count = 0
+    for f in files:
+        record = dict(zip(fields, field_values(f, fields)))
+        if include_content:
+            try:
+                record["content"] = read_file(f.abs_path).decode(errors="replace")
+            except OSError:
+                record["content"] = None
+        write(json.dumps(record, separators=(",", ":")) + "\n")
+        count += 1
+    return count
+
+
+def _sendfile(src: BinaryIO, dst: BinaryIO, length: int) -> int:
+    """Copies in the kernel when dst is backed by a file or pipe; returns bytes sent."""
+    if not hasattr(os, "sendfile"):
+        return 0
+    try:
+        out_fd = dst.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return 0
+    dst.flush()
+    sent = 0
+    try:
+        while sent < length:
+            n = os.sendfile(out_fd, src.fileno(), sent, length - sent)
+            if n == 0:
+                break
+            sent += n
+    except OSError:
+        if sent == 0:
+            return 0  # not supported for this pair of files, copy in userspace
+        raise
+    return sent
+
+
+def _copy_exactly(src: BinaryIO, dst: BinaryIO, length: int):
+    remaining = length - _sendfile(src, dst, length)
+    src.seek(length - remaining)
+    while remaining:
+        chunk = src.read(min(COPY_CHUNK_SIZE, remaining))
+        if not chunk:
+            raise Exception(f"withrepo.export: {src.name} changed while exporting")
+        dst.write(chunk)
+        remaining -= len(chunk)
+
+
+def export_binary(
+    files, fileobj: BinaryIO, fields: Sequence[str], include_content: bool
+) -> int:
+    """Length-prefixed records; content bytes are copied through untouched."""
+    header = json.dumps(
+        {"version": BINARY_VERSION, "fields": list(fields), "content": include_content}
+    ).encode()
+    fileobj.write(BINARY_MAGIC + struct.pack("<I", len(header)) + header)
+    count = 0
+    for f in files:
+        row = json.dumps(field_values(f, fields), separators=(",", ":")).encode()
+        fileobj.write(struct.pack("<I", len(row)) + row)
+        if include_content and split_pack_path(f.abs_path) is not None:
+            try:
+                data = read_file(f.abs_path)
+            except OSError:
+                data = b""
+            fileobj.write(struct.pack("<Q", len(data)) + data)
+        elif include_content:
+            try:
+                src = open(f.abs_path, "rb")
+            except OSError:
+                fileobj.write(struct.pack("<Q", 0))
+            else:
+                with src:
+                    length = os.fstat(src.fileno()).st_size
+                    fileobj.write(struct.pack("<Q", length))
+                    _copy_exactly(src, fileobj, length)
+        count += 1
+    return count
+
+
+def export_files(
+    files,
+    fileobj,
+    format: str = "jsonl",
+    fields: Sequence[str] = None,
+    include_content: bool = True,
+) -> int:
+    """Streams RepoFiles into fileobj, one file at a time. Returns the record count."""
+    if format not in EXPORT_FORMATS:
+        raise Exception(
+            f"withrepo.export: unknown format {format}, use one of {EXPORT_FORMATS}"
+        )
+    fields = tuple(fields or EXPORT_FIELDS)
+    if format == "jsonl":
+        return export_jsonl(files, fileobj, fields, include_content)
+    return export_binary(files, fileobj, fields, include_content)
+
+
+def _read_exactly(fileobj: BinaryIO, length: int) -> bytes:
+    data = fileobj.read(length)
+    if len(data) != length:
+        raise Exception("withrepo.export: truncated binary export")
+    return data
+
+
+def read_binary_export(fileobj: BinaryIO) -> Iterator[Tuple[dict, Optional[bytes]]]:
+    """Yields (fields, content) per record of a binary export, content None if omitted."""
+    if _read_exactly(fileobj, len(BINARY_MAGIC)) != BINARY_MAGIC:
+        raise Exception("withrepo.export: not a binary export")
+    (header_len,) = struct.unpack("<I", _read_exactly(fileobj, 4))
+    header = json.loads(_read_exactly(fileobj, header_len))
+    if header["version"] != BINARY_VERSION:
+        raise Exception(f"withrepo.export: unsupported version {header['version']}")
+    fields: List[str] = header["fields"]
+    while prefix := fileobj.read(4):
+        (row_len,) = struct.unpack("<I", prefix)
+        record = dict(zip(fields, json.loads(_read_exactly(fileobj, row_len))))
+        content = None
+        if header["content"]:
+            (length,) = struct.unpack("<Q", _read_exactly(fileobj, 8))
+            content = _read_exactly(fileobj, length)
+        yield record, content
@@ -0,0 +1,181 @@
+# Standard library
+import os
+import re
+import mmap
+import fnmatch
+import contextlib
+import functools
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Local
+from withrepo.search import BINARY_SNIFF_BYTES, SearchMatch, is_binary
+from withrepo.pack import read_file, split_pack_path
+from withrepo.constants import LANGUAGE_TO_LSP_LANGUAGE_MAP
+from withrepo.resources.vendor import VENDOR_PATTERNS
+
+# CONSTANTS
+GREP_CHUNK_SIZE = 64  # files per worker task
+PARALLEL_MIN_FILES = 512  # below this, process startup costs more than it saves
+MAX_GREP_WORKERS = 8
+
+Pattern = Union[str, bytes, "re.Pattern"]
+
+
+@functools.lru_cache(maxsize=None)
+def vendor_regex() -> "re.Pattern":
+    return re.compile("|".join(f"(?:{p})" for p in VENDOR_PATTERNS))
+
+
+def is_vendored(path: str) -> bool:
+    return vendor_regex().search(path) is not None
+
+
+def compile_bytes_pattern(pattern: Pattern) -> "re.Pattern":
+    """
+    Compiles pattern for matching against raw bytes, line by line. Strings are
+    regexes, as in grep; compiled str patterns keep their flags.
+    """
+    flags = re.MULTILINE
+    if isinstance(pattern, re.Pattern):
+        flags |= pattern.flags & ~re.UNICODE
+        pattern = pattern.pattern
+    if isinstance(pattern, str):
+        pattern = pattern.encode()
+    return re.compile(pattern, flags)
+
+
+def select_files(
+    files,
+    languages: Sequence[str] = None,
+    globs: Sequence[str] = None,
+    include_vendor: bool = False,
+) -> list:
+    """
+    The RepoFiles in one of languages (language or LSP language names) and
+    matching one of globs, without vendored paths unless include_vendor.
+    """
+    languages = set(languages or ())
+    selected = []
+    for f in files:
+        if languages and not (
+            f.language in languages
+            or LANGUAGE_TO_LSP_LANGUAGE_MAP.get(f.language) in languages
+        ):
+            continue
+        if globs and not any(fnmatch.fnmatchcase(f.path, g) for g in globs):
+            continue
+        if not include_vendor and is_vendored(f.path):
+            continue
+        selected.append(f)
+    return selected
+
+
+def grep_file(
+    path: str, abs_path: str, regex: "re.Pattern", max_results: int = None
+) -> List[SearchMatch]:
+    """Matching lines of one file, at most one match per line."""
+    try:
+        if split_pack_path(abs_path) is not None:
+            # already mapped, a slice of the pack is as cheap as a mapping
+            mm = contextlib.nullcontext(read_file(abs_path))
+        else:
+            with open(abs_path, "rb") as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:  # empty file
+                    return []
+    except OSError:
+        return []
+
+    matches = []
+    with mm as mm:
+        if is_binary(mm[:BINARY_SNIFF_BYTES]):
+            return matches
+        line_no, counted_to, pos, end = 1, 0, 0, len(mm)
+        while pos <= end:
+            m = regex.search(mm, pos)
+            if m is None:
+                break
+            line_start = mm.rfind(b"\n", 0, m.start()) + 1
+            line_end = mm.find(b"\n", m.end())
+            if line_end == -1:
+                line_end = end
+            line_no += mm[counted_to:line_start].count(b"\n")
+            counted_to = line_start
+            line = mm[line_start:line_end].rstrip(b"\r")
+            matches.append(SearchMatch(path, line_no, line.decode(errors="replace")))
+            if max_results and len(matches) >= max_results:
+                break
+            pos = line_end + 1
+    return matches
+
+
+def _grep_chunk(
+    chunk: Sequence[Tuple[str, str]], regex: "re.Pattern", max_results: Optional[int]
+) -> List[SearchMatch]:
+    matches = []
+    for path, abs_path in chunk:
+        remaining = max_results - len(matches) if max_results else None
+        matches.extend(grep_file(path, abs_path, regex, remaining))
+        if max_results and len(matches) >= max_results:
+            break
+    return matches
+
+
+def available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not on Linux
+        return os.cpu_count() or 1
+
+
+def default_workers(n_files: int) -> int:
+    if n_files < PARALLEL_MIN_FILES:
+        return 1
+    return min(MAX_GREP_WORKERS, available_cpus())
+
+
+def grep_files(
+    files: Sequence[Tuple[str, str]],
+    pattern: Pattern,
+    max_results: int = None,
+    workers: int = None,
+) -> Iterator[SearchMatch]:
+    """
+    Streams matches from (relative path, absolute path) pairs, in file order.
+    With workers > 1 files are scanned in chunks on a process pool; stopping
+    early, or closing the iterator, cancels the chunks that haven't started.
+    """
+    regex = compile_bytes_pattern(pattern)
+    if workers is None:
+        workers = default_workers(len(files))
+
+    if workers <= 1:
+        chunks = (_grep_chunk([f], regex, max_results) for f in files)
+        yield from _take(chunks, max_results)
+        return
+
+    # deferred, it pulls in multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            pool.submit(_grep_chunk, files[i : i + GREP_CHUNK_SIZE], regex, max_results)
+            for i in range(0, len(files), GREP_CHUNK_SIZE)
+        ]
+        yield from _take((future.result() for future in futures), max_results)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _take(
+    batches: Iterable[List[SearchMatch]], max_results: Optional[int]
+) -> Iterator[SearchMatch]:
+    found = 0
+    for batch in batches:
+        for match in batch:
+            yield match
+            found += 1
+            if max_results and found >= max_results:
+                return
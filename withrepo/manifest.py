@@ -0,0 +1,147 @@
+# Standard library
+import os
+import glob
+import json
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+# Local
+from withrepo.utils import get_language_from_ext
+from withrepo.constants import LANGUAGE_TO_LSP_LANGUAGE_MAP
+
+# CONSTANTS
+MANIFEST_VERSION = 1
+SIDECAR_MARKER = ".withrepo-"
+MANIFEST_SUFFIX = f"{SIDECAR_MARKER}manifest.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class ManifestEntry:
+    path: str  # Relative to the manifest root
+    size: int
+    language: str
+    is_code: bool
+    content_hash: str
+
+    @property
+    def lsp_language(self) -> Optional[str]:
+        return LANGUAGE_TO_LSP_LANGUAGE_MAP.get(self.language, None)
+
+
+@dataclass
+class Manifest:
+    root: str
+    entries: List[ManifestEntry]
+
+    def languages(self) -> List[str]:
+        """Returns the LSP languages that have at least one code file in the tree."""
+        languages = {e.lsp_language for e in self.entries if e.is_code}
+        return [lang for lang in languages if lang]
+
+    def entries_for_language(self, lsp_language: str) -> List[ManifestEntry]:
+        return [
+            e for e in self.entries if e.is_code and e.lsp_language == lsp_language
+        ]
+
+    def by_path(self) -> Dict[str, ManifestEntry]:
+        return {e.path: e for e in self.entries}
+
+
+def sidecar_path(root: str, suffix: str) -> str:
+    """
+    Sidecars live next to the tree they describe, never inside it,
+    so walks and copies of the tree stay byte-identical to the archive.
+    """
+    return os.path.normpath(root) + suffix
+
+
+def is_sidecar(name: str) -> bool:
+    return SIDECAR_MARKER in name
+
+
+def remove_sidecars(root: str):
+    for path in glob.glob(glob.escape(os.path.normpath(root)) + SIDECAR_MARKER + "*"):
+        os.remove(path)
+
+
+def manifest_path(root: str) -> str:
+    return sidecar_path(root, MANIFEST_SUFFIX)
+
+
+def hash_file(path: str) -> str:
+    h = hashlib.sha1()
+    if os.path.islink(path):
+        h.update(os.readlink(path).encode())
+        return h.hexdigest()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def build_manifest(root: str) -> Manifest:
+    entries = []
+    for dirpath, _, files in os.walk(root):
+        for file in files:
+            abs_path = os.path.join(dirpath, file)
+            _, language, is_code = get_language_from_ext(file)
+            try:
+                size = os.lstat(abs_path).st_size
+                content_hash = hash_file(abs_path)
+            except OSError:
+                size, content_hash = 0, ""
+            entries.append(
+                ManifestEntry(
+                    path=os.path.relpath(abs_path, root),
+                    size=size,
+                    language=language,
+                    is_code=is_code,
+                    content_hash=content_hash,
+                )
+            )
+    entries.sort(key=lambda e: e.path)
+    return Manifest(root=root, entries=entries)
+
+
+def write_manifest(manifest: Manifest) -> str:
+    """
+    Writes the manifest as a single compact JSON document: languages are
+    interned into a table and each file is a flat row of
+    [path, size, language_id, is_code, content_hash].
+    """
+    languages: Dict[str, int] = {}
+    rows = []
+    for e in manifest.entries:
+        lang_id = languages.setdefault(e.language, len(languages))
+        rows.append([e.path, e.size, lang_id, int(e.is_code), e.content_hash])
+
+    path = manifest_path(manifest.root)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(
+            {"version": MANIFEST_VERSION, "languages": list(languages), "files": rows},
+            f,
+            separators=(",", ":"),
+        )
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_manifest(root: str) -> Optional[Manifest]:
+    """Returns the manifest for the tree at root, or None if there isn't a usable one."""
+    try:
+        with open(manifest_path(root), "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != MANIFEST_VERSION:
+        return None
+
+    languages = data["languages"]
+    entries = [
+        ManifestEntry(path, size, languages[lang_id], bool(is_code), content_hash)
+        for path, size, lang_id, is_code, content_hash in data["files"]
+    ]
+    return Manifest(root=root, entries=entries)
@@ -0,0 +1,282 @@
+# Standard library
+import os
+import glob
+import json
+import bisect
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Local
+from withrepo.timing import Span, Tracer, add_tracer, remove_tracer
+
+# CONSTANTS
+METRICS_DIR_ENV_VAR = "WITHREPO_METRICS_DIR"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in pairs
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help: str):
+        self.name, self.help = name, help
+        self.values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, value: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + value
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return [[list(map(list, k)), v] for k, v in self.values.items()]
+
+    def merge(self, snapshot: list):
+        for key, value in snapshot:
+            key = tuple(map(tuple, key))
+            self.values[key] = self.values.get(key, 0) + value
+
+    def render(self) -> List[str]:
+        return [f"{self.name}{_format_labels(k)} {v}" for k, v in self.values.items()]
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, buckets=LATENCY_BUCKETS):
+        self.name, self.help = name, help
+        self.buckets = tuple(buckets)
+        # per label set: [bucket counts..., +Inf count, sum]
+        self.values: Dict[LabelKey, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            row = self.values.setdefault(key, [0] * (len(self.buckets) + 2))
+            row[index] += 1
+            row[-1] += value
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return [[list(map(list, k)), list(v)] for k, v in self.values.items()]
+
+    def merge(self, snapshot: list):
+        for key, row in snapshot:
+            key = tuple(map(tuple, key))
+            mine = self.values.setdefault(key, [0] * (len(self.buckets) + 2))
+            for i, value in enumerate(row):
+                mine[i] += value
+
+    def render(self) -> List[str]:
+        lines = []
+        for key, row in self.values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), row[:-1]):
+                cumulative += count
+                le = (("le", str(bound)),)
+                lines.append(f"{self.name}_bucket{_format_labels(key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {row[-1]}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Process-wide metrics. Updates are thread-safe; with a multiprocess directory,
+    every process flushes its snapshot there and render() aggregates all of them.
+    """
+
+    def __init__(self):
+        self.metrics: Dict[str, object] = {}
+        self.multiprocess_dir: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str) -> Counter:
+        with self._lock:
+            return self.metrics.setdefault(name, Counter(name, help))
+
+    def histogram(self, name: str, help: str, buckets=LATENCY_BUCKETS) -> Histogram:
+        with self._lock:
+            return self.metrics.setdefault(name, Histogram(name, help, buckets))
+
+    def snapshot(self) -> dict:
+        return {name: metric.snapshot() for name, metric in self.metrics.items()}
+
+    def flush(self):
+        if not self.multiprocess_dir:
+            return
+        path = os.path.join(self.multiprocess_dir, f"metrics_{os.getpid()}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.snapshot(), f)
+        os.replace(tmp_path, path)
+
+    def collect(self) -> Dict[str, object]:
+        """Returns fresh metric objects holding this process' values, or every process'."""
+        if not self.multiprocess_dir:
+            snapshots = [self.snapshot()]
+        else:
+            self.flush()
+            snapshots = []
+            pattern = os.path.join(self.multiprocess_dir, "metrics_*.json")
+            for path in sorted(glob.glob(pattern)):
+                try:
+                    with open(path, "r") as f:
+                        snapshots.append(json.load(f))
+                except (OSError, ValueError):
+                    continue
+
+        merged = {}
+        for name, metric in self.metrics.items():
+            if metric.kind == "counter":
+                merged[name] = Counter(name, metric.help)
+            else:
+                merged[name] = Histogram(name, metric.help, metric.buckets)
+            for snapshot in snapshots:
+                merged[name].merge(snapshot.get(name, []))
+        return merged
+
+    def render(self) -> str:
+        """Renders the metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, metric in sorted(self.collect().items()):
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+DOWNLOADS = REGISTRY.counter("withrepo_downloads_total", "Archive downloads.")
+DOWNLOAD_BYTES = REGISTRY.counter(
+    "withrepo_download_bytes_total", "Archive bytes fetched from providers."
+)
+DOWNLOAD_SECONDS = REGISTRY.histogram(
+    "withrepo_download_seconds", "Archive download latency."
+)
+CACHE_HITS = REGISTRY.counter("withrepo_cache_hits_total", "Cache entries reused.")
+CACHE_MISSES = REGISTRY.counter(
+    "withrepo_cache_misses_total", "Cache entries fetched."
+)
+REMOTE_CACHE_HITS = REGISTRY.counter(
+    "withrepo_remote_cache_hits_total", "Archives fetched from the shared cache tier."
+)
+REMOTE_CACHE_MISSES = REGISTRY.counter(
+    "withrepo_remote_cache_misses_total", "Archives missing from the shared cache tier."
+)
+REMOTE_CACHE_UPLOADS = REGISTRY.counter(
+    "withrepo_remote_cache_uploads_total", "Archives published to the shared cache tier."
+)
+RATE_LIMIT_WAIT_SECONDS = REGISTRY.histogram(
+    "withrepo_rate_limit_wait_seconds", "Time spent waiting on provider rate limits."
+)
+RATE_LIMIT_RETRIES = REGISTRY.counter(
+    "withrepo_rate_limit_retries_total", "Downloads retried after a rate limit."
+)
+EXTRACT_BYTES = REGISTRY.counter(
+    "withrepo_extract_bytes_total", "Bytes extracted from archives."
+)
+EXTRACT_SECONDS = REGISTRY.histogram(
+    "withrepo_extract_seconds", "Archive extraction latency."
+)
+SPLIT_SECONDS = REGISTRY.histogram(
+    "withrepo_split_seconds", "Language split latency."
+)
+FILES_WALKED = REGISTRY.counter(
+    "withrepo_files_walked_total", "Files listed by RepoContext.tree()."
+)
+CLEANUP_SECONDS = REGISTRY.histogram("withrepo_cleanup_seconds", "Cleanup latency.")
+FAILURES = REGISTRY.counter("withrepo_failures_total", "Failed phases.")
+
+
+class MetricsTracer(Tracer):
+    """Feeds the registry from the timing spans that repo() already records."""
+
+    def on_end(self, span: Span):
+        attrs = span.attributes
+        provider = attrs.get("provider", "unknown")
+        if "error" in attrs:
+            FAILURES.inc(provider=provider, phase=span.name)
+            return
+
+        if span.name == "download":
+            DOWNLOADS.inc(provider=provider)
+            DOWNLOAD_BYTES.inc(attrs.get("bytes", 0), provider=provider)
+            DOWNLOAD_SECONDS.observe(span.duration, provider=provider)
+            if attrs.get("retries"):
+                RATE_LIMIT_RETRIES.inc(attrs["retries"], provider=provider)
+        elif span.name == "ratelimit":
+            RATE_LIMIT_WAIT_SECONDS.observe(attrs.get("waited", 0), provider=provider)
+        elif span.name == "cache":
+            (CACHE_HITS if attrs.get("hit") else CACHE_MISSES).inc(provider=provider)
+        elif span.name == "remote.get":
+            (REMOTE_CACHE_HITS if attrs.get("hit") else REMOTE_CACHE_MISSES).inc()
+        elif span.name == "remote.put":
+            if attrs.get("stored"):
+                REMOTE_CACHE_UPLOADS.inc()
+        elif span.name == "unpack":
+            EXTRACT_BYTES.inc(attrs.get("bytes", 0))
+            EXTRACT_SECONDS.observe(span.duration)
+        elif span.name == "split":
+            SPLIT_SECONDS.observe(span.duration)
+        elif span.name == "tree":
+            FILES_WALKED.inc(attrs.get("files", 0))
+        elif span.name == "cleanup":
+            CLEANUP_SECONDS.observe(span.duration)
+
+
+_tracer: Optional[MetricsTracer] = None
+
+
+def enable_metrics(multiprocess_dir: str = None) -> MetricsRegistry:
+    """
+    Starts collecting metrics. Pass a directory shared by every worker process
+    (or set $WITHREPO_METRICS_DIR) to aggregate metrics across processes.
+    """
+    global _tracer
+    multiprocess_dir = multiprocess_dir or os.environ.get(METRICS_DIR_ENV_VAR)
+    if multiprocess_dir:
+        os.makedirs(multiprocess_dir, exist_ok=True)
+    REGISTRY.multiprocess_dir = multiprocess_dir
+    if _tracer is None:
+        _tracer = MetricsTracer()
+        add_tracer(_tracer)
+    return REGISTRY
+
+
+def flush_metrics():
+    """Publishes this process' metrics to the multiprocess directory, if enabled."""
+    if _tracer is not None:
+        REGISTRY.flush()
+
+
+def disable_metrics():
+    global _tracer
+    if _tracer is not None:
+        remove_tracer(_tracer)
+        _tracer = None
+    REGISTRY.flush()
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
@@ -0,0 +1,276 @@
+# Standard library
+import io
+import os
+import json
+import mmap
+import stat
+import zlib
+import errno
+import shutil
+import struct
+import threading
+import contextlib
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, TextIO, Tuple
+
+# Local
+from withrepo.manifest import Manifest, ManifestEntry, build_manifest, load_manifest
+
+# CONSTANTS
+PACK_VERSION = 1
+PACK_MAGIC = b"WRPACK01"
+PACK_SUFFIX = ".wrpack"
+PACK_FILE_NAME = f"tree{PACK_SUFFIX}"
+FOOTER = struct.Struct("<QQ8s")  # index offset, index length, magic
+COMPRESS_LEVEL = 6
+COMPRESS_MAX_SIZE = 16 * 1024 * 1024  # larger files are stored as is
+COPY_CHUNK_SIZE = 1024 * 1024
+MAX_LINK_DEPTH = 8
+MAX_OPEN_PACKS = 64
+
+# entry flags
+COMPRESSED = 1
+SYMLINK = 2
+EXECUTABLE = 4
+
+
+class PackEntry(NamedTuple):
+    path: str
+    size: int  # uncompressed
+    language: str
+    is_code: bool
+    content_hash: str
+    offset: int
+    stored_size: int
+    flags: int
+
+
+def write_pack(
+    root: str, pack_path: str, manifest: Manifest = None, compress: bool = False
+) -> int:
+    """
+    Stores the tree at root as one file: contents back to back in path order,
+    then a sorted index in the manifest's row format, then a fixed-size footer
+    pointing at the index. Files are zlib-compressed, one by one, when compress
+    is set and it makes them smaller. Returns the number of bytes written.
+    """
+    manifest = manifest or load_manifest(root) or build_manifest(root)
+    languages: Dict[str, int] = {}
+    rows = []
+    tmp_path = f"{pack_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as out:
+            out.write(PACK_MAGIC)
+            offset = len(PACK_MAGIC)
+            for e in sorted(manifest.entries, key=lambda e: e.path):
+                src = os.path.join(root, e.path)
+                st = os.lstat(src)
+                flags = EXECUTABLE if st.st_mode & stat.S_IXUSR else 0
+                if stat.S_ISLNK(st.st_mode):
+                    flags = SYMLINK
+                    out.write(os.readlink(src).encode())
+                elif compress and st.st_size <= COMPRESS_MAX_SIZE:
+                    with open(src, "rb") as f:
+                        data = f.read()
+                    packed = zlib.compress(data, COMPRESS_LEVEL)
+                    if len(packed) < len(data):
+                        data, flags = packed, flags | COMPRESSED
+                    out.write(data)
+                else:
+                    with open(src, "rb") as f:
+                        shutil.copyfileobj(f, out, COPY_CHUNK_SIZE)
+                stored_size = out.tell() - offset
+                lang_id = languages.setdefault(e.language, len(languages))
+                rows.append(
+                    [
+                        e.path,
+                        e.size,
+                        lang_id,
+                        int(e.is_code),
+                        e.content_hash,
+                        offset,
+                        stored_size,
+                        flags,
+                    ]
+                )
+                offset += stored_size
+
+            index = json.dumps(
+                {"version": PACK_VERSION, "languages": list(languages), "files": rows},
+                separators=(",", ":"),
+            ).encode()
+            out.write(index)
+            out.write(FOOTER.pack(offset, len(index), PACK_MAGIC))
+            written = out.tell()
+        os.replace(tmp_path, pack_path)
+    except BaseException:
+        # a failed write, e.g. a file vanishing or a full disk, leaves nothing behind
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    return written
+
+
+def file_identity(st: os.stat_result) -> Tuple[int, int, int, int]:
+    """Tells a file from the one that replaced it at the same path."""
+    return st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns
+
+
+class Pack:
+    """
+    A read-only view of a pack file. The whole file is mmapped, so reading a
+    file is a dictionary lookup plus a slice of the mapping.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self.identity = file_identity(os.fstat(f.fileno()))
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < len(PACK_MAGIC) + FOOTER.size:
+            raise Exception(f"withrepo.pack: {path} is truncated")
+        index_offset, index_length, magic = FOOTER.unpack(self._mm[-FOOTER.size :])
+        if self._mm[: len(PACK_MAGIC)] != PACK_MAGIC or magic != PACK_MAGIC:
+            raise Exception(f"withrepo.pack: {path} is not a pack")
+        data = json.loads(self._mm[index_offset : index_offset + index_length])
+        if data.get("version") != PACK_VERSION:
+            raise Exception(
+                f"withrepo.pack: unsupported version {data.get('version')}"
+            )
+        languages = data["languages"]
+        self.entries: List[PackEntry] = [
+            PackEntry(p, size, languages[lang], bool(is_code), h, off, stored, flags)
+            for p, size, lang, is_code, h, off, stored, flags in data["files"]
+        ]
+        self._positions: Dict[str, int] = {
+            e.path: i for i, e in enumerate(self.entries)
+        }
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._positions
+
+    def entry(self, path: str) -> Optional[PackEntry]:
+        i = self._positions.get(path)
+        return None if i is None else self.entries[i]
+
+    def manifest(self) -> Manifest:
+        return Manifest(
+            root=self.path,
+            entries=[
+                ManifestEntry(e.path, e.size, e.language, e.is_code, e.content_hash)
+                for e in self.entries
+            ],
+        )
+
+    def read_bytes(self, path: str) -> bytes:
+        """The contents of the file at path; symlinks within the pack are followed."""
+        e = self.entry(path)
+        for _ in range(MAX_LINK_DEPTH):
+            if e is None or not e.flags & SYMLINK:
+                break
+            target = self._mm[e.offset : e.offset + e.stored_size].decode()
+            target = os.path.normpath(os.path.join(os.path.dirname(e.path), target))
+            e = self.entry(target)
+        if e is None or e.flags & SYMLINK:
+            raise FileNotFoundError(
+                errno.ENOENT, f"{path} is not in the pack", self.path
+            )
+        data = self._mm[e.offset : e.offset + e.stored_size]
+        return zlib.decompress(data) if e.flags & COMPRESSED else data
+
+    def read_text(self, path: str) -> str:
+        """Decoded the way open(path, "r") would, universal newlines included."""
+        return io.TextIOWrapper(io.BytesIO(self.read_bytes(path))).read()
+
+    def unpack(self, dest: str) -> int:
+        """Writes the tree into dest, a new or empty directory. Returns the count."""
+        if os.path.exists(dest) and os.listdir(dest):
+            raise Exception(f"withrepo.pack: {dest} is not empty")
+        os.makedirs(dest, exist_ok=True)
+        for e in self.entries:
+            target = os.path.join(dest, e.path)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            data = self._mm[e.offset : e.offset + e.stored_size]
+            if e.flags & SYMLINK:
+                os.symlink(data.decode(), target)
+                continue
+            with open(target, "wb") as f:
+                f.write(zlib.decompress(data) if e.flags & COMPRESSED else data)
+            if e.flags & EXECUTABLE:
+                os.chmod(target, 0o755)
+        return len(self.entries)
+
+    def close(self):
+        self._mm.close()
+
+
+# packs stay mapped while anything uses them, the table only avoids reopening
+_open_packs: "OrderedDict[str, Pack]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def open_pack(path: str) -> Pack:
+    # a pack replaced since it was opened, e.g. by a re-fetch, is opened again;
+    # the old mapping stays valid for whoever still holds it
+    identity = file_identity(os.stat(path))
+    with _lock:
+        pack = _open_packs.get(path)
+        if pack is not None and pack.identity == identity:
+            _open_packs.move_to_end(path)
+            return pack
+    pack = Pack(path)
+    with _lock:
+        _open_packs[path] = pack
+        while len(_open_packs) > MAX_OPEN_PACKS:
+            _open_packs.popitem(last=False)
+    return pack
+
+
+def is_pack(path: str) -> bool:
+    return path.endswith(PACK_SUFFIX) and os.path.isfile(path)
+
+
+def split_pack_path(abs_path: str) -> Optional[Tuple[str, str]]:
+    """
+    Files of packed trees have abs_paths inside the pack, such as
+    <entry>/tree.wrpack/src/a.py. Returns (pack path, path in the pack) for
+    those, None for files on disk.
+    """
+    i = abs_path.find(PACK_SUFFIX + os.sep)
+    if i == -1:
+        return None
+    pack_path = abs_path[: i + len(PACK_SUFFIX)]
+    if pack_path not in _open_packs and not os.path.isfile(pack_path):
+        return None  # a directory that happens to use the suffix
+    return pack_path, abs_path[len(pack_path) + 1 :]
+
+
+def read_file(abs_path: str) -> bytes:
+    """The bytes of a file, on disk or in a pack."""
+    located = split_pack_path(abs_path)
+    if located is None:
+        with open(abs_path, "rb") as f:
+            return f.read()
+    pack_path, path = located
+    return open_pack(pack_path).read_bytes(path)
+
+
+def open_text(abs_path: str, errors: str = None) -> TextIO:
+    """open(abs_path, "r") for files on disk or in a pack."""
+    if split_pack_path(abs_path) is None:
+        return open(abs_path, "r", errors=errors)
+    return io.TextIOWrapper(io.BytesIO(read_file(abs_path)), errors=errors)
+
+
+def file_size(abs_path: str) -> int:
+    located = split_pack_path(abs_path)
+    if located is None:
+        return os.path.getsize(abs_path)
+    pack_path, path = located
+    e = open_pack(pack_path).entry(path)
+    if e is None:
+        raise FileNotFoundError(errno.ENOENT, f"{path} is not in the pack", pack_path)
+    return e.size
@@ -0,0 +1,295 @@
+# Standard library
+import os
+import json
+import threading
+import importlib
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Local
+from withrepo.cache import get_cache_dir
+from withrepo.grep import available_cpus
+from withrepo.manifest import hash_file
+from withrepo.pack import file_size, read_file
+from withrepo.resources.tree_sitter import (
+    EXT_TO_TREE_SITTER_LANGUAGE,
+    TREE_SITTER_SYMBOL_NODE_TYPES,
+)
+
+# CONSTANTS
+PARSE_CACHE_VERSION = 1
+PARSE_CACHE_DIR = "parse"
+MEMORY_CACHE_SIZE = 50_000
+PARSE_CHUNK_SIZE = 32  # files per worker task
+PARALLEL_MIN_FILES = 64
+MAX_PARSE_FILE_SIZE = 2 * 1024 * 1024
+MAX_NAME_DEPTH = 4
+TREE_SITTER_MISSING = "tree-sitter is not installed, pip install 'withrepo[parse]'"
+
+# grammars that live under a different module or entry point than their name
+GRAMMAR_MODULES = {
+    "tsx": ("tree_sitter_typescript", "language_tsx"),
+    "php": ("tree_sitter_php", "language_php"),
+}
+
+
+class Symbol(NamedTuple):
+    name: str
+    kind: str  # "function", "class", "method", ...
+    start_line: int  # 1-based, inclusive
+    end_line: int
+    start_byte: int
+    end_byte: int
+    parent: Optional[str]  # name of the enclosing symbol, if any
+
+
+class ParsedFile(NamedTuple):
+    path: str
+    content_hash: str
+    grammar: str
+    symbols: List[Symbol]
+    error: Optional[str] = None
+    cached: bool = False
+
+
+def load_tree_sitter():
+    """The tree_sitter module, or None if the optional "parse" extra isn't installed."""
+    try:
+        import tree_sitter  # deferred, only parse() needs it
+    except ImportError:
+        return None
+    return tree_sitter
+
+
+def is_available() -> bool:
+    return load_tree_sitter() is not None
+
+
+def grammar_for_path(path: str) -> Optional[str]:
+    return EXT_TO_TREE_SITTER_LANGUAGE.get(os.path.splitext(path)[1].lower())
+
+
+def load_language(grammar: str):
+    """
+    The tree_sitter.Language for grammar, from tree-sitter-language-pack,
+    tree-sitter-languages or a per-grammar tree-sitter-<name> package.
+    """
+    for pack in ("tree_sitter_language_pack", "tree_sitter_languages"):
+        try:
+            return importlib.import_module(pack).get_language(grammar)
+        except Exception:
+            continue
+    tree_sitter = load_tree_sitter()
+    module_name, entry_point = GRAMMAR_MODULES.get(
+        grammar, (f"tree_sitter_{grammar}", "language")
+    )
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    return tree_sitter.Language(getattr(module, entry_point)())
+
+
+# per-process parsers; grammars load on first use, in each worker
+_parsers: Dict[str, object] = {}
+
+
+def get_parser(grammar: str):
+    if grammar not in _parsers:
+        tree_sitter = load_tree_sitter()
+        language = load_language(grammar)
+        parser = None
+        if language is not None:
+            try:
+                parser = tree_sitter.Parser(language)
+            except TypeError:  # tree-sitter < 0.22
+                parser = tree_sitter.Parser()
+                parser.set_language(language)
+        _parsers[grammar] = parser
+    return _parsers[grammar]
+
+
+def node_name(node) -> Optional[str]:
+    # C-like declarations nest the name in declarators, e.g. a function_definition's
+    # function_declarator's identifier
+    for _ in range(MAX_NAME_DEPTH):
+        name = node.child_by_field_name("name")
+        if name is not None:
+            return name.text.decode(errors="replace")
+        declarator = node.child_by_field_name("declarator")
+        if declarator is None:
+            return None
+        if declarator.child_count == 0:
+            return declarator.text.decode(errors="replace")
+        node = declarator
+    return None
+
+
+def extract_symbols(tree, grammar: str) -> List[Symbol]:
+    node_types = TREE_SITTER_SYMBOL_NODE_TYPES.get(grammar, {})
+    symbols = []
+    stack: List[Tuple[object, Optional[str]]] = [(tree.root_node, None)]
+    while stack:
+        node, parent = stack.pop()
+        kind = node_types.get(node.type)
+        if kind and not (
+            # `struct foo x;` uses a specifier without defining anything
+            node.type.endswith("_specifier")
+            and node.child_by_field_name("body") is None
+        ):
+            name = node_name(node)
+            if name:
+                symbols.append(
+                    Symbol(
+                        name,
+                        kind,
+                        node.start_point[0] + 1,
+                        node.end_point[0] + 1,
+                        node.start_byte,
+                        node.end_byte,
+                        parent,
+                    )
+                )
+                parent = name
+        stack.extend((child, parent) for child in reversed(node.children))
+    symbols.sort(key=lambda s: s.start_byte)
+    return symbols
+
+
+def parse_file(abs_path: str, grammar: str) -> Tuple[List[Symbol], Optional[str]]:
+    """Returns (symbols, error) for one file."""
+    parser = get_parser(grammar)
+    if parser is None:
+        return [], f"no tree-sitter grammar installed for {grammar}"
+    try:
+        if file_size(abs_path) > MAX_PARSE_FILE_SIZE:
+            return [], "file too large to parse"
+        source = read_file(abs_path)
+        return extract_symbols(parser.parse(source), grammar), None
+    except Exception as e:
+        return [], f"{type(e).__name__}: {e}"
+
+
+def _parse_chunk(
+    chunk: Sequence[Tuple[str, str]],
+) -> List[Tuple[List[Symbol], Optional[str]]]:
+    return [parse_file(abs_path, grammar) for abs_path, grammar in chunk]
+
+
+class ParseCache:
+    """
+    Parse results keyed by (grammar, content hash): an in-process LRU, backed by
+    <cache dir>/parse when the filesystem cache is enabled, so unchanged files
+    are never re-parsed across commits or processes.
+    """
+
+    def __init__(self, max_entries: int = MEMORY_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[Tuple[str, str], List[Symbol]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, grammar: str, content_hash: str) -> Optional[str]:
+        cache_dir = get_cache_dir()
+        if cache_dir is None:
+            return None
+        return os.path.join(
+            cache_dir,
+            PARSE_CACHE_DIR,
+            f"v{PARSE_CACHE_VERSION}",
+            content_hash[:2],
+            f"{content_hash}.{grammar}.json",
+        )
+
+    def get(self, grammar: str, content_hash: str) -> Optional[List[Symbol]]:
+        key = (grammar, content_hash)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        path = self._path(grammar, content_hash)
+        if path is None:
+            return None
+        try:
+            with open(path, "r") as f:
+                symbols = [Symbol(*row) for row in json.load(f)]
+        except (OSError, ValueError, TypeError):
+            return None
+        self._remember(key, symbols)
+        return symbols
+
+    def put(self, grammar: str, content_hash: str, symbols: List[Symbol]):
+        self._remember((grammar, content_hash), symbols)
+        path = self._path(grammar, content_hash)
+        if path is None:
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(symbols, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    def _remember(self, key: Tuple[str, str], symbols: List[Symbol]):
+        with self._lock:
+            self._memory[key] = symbols
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+
+PARSE_CACHE = ParseCache()
+
+
+def parse_files(files, workers: int = None) -> List[ParsedFile]:
+    """
+    Parses the RepoFiles that have a tree-sitter grammar, in order. Cached results
+    are reused by content hash and misses are parsed across worker processes.
+    """
+    jobs = []
+    for f in files:
+        grammar = grammar_for_path(f.path)
+        if grammar is None:
+            continue
+        try:
+            content_hash = f.content_hash or hash_file(f.abs_path)
+        except OSError:
+            continue
+        jobs.append((f, grammar, content_hash))
+
+    if not is_available():
+        return [
+            ParsedFile(f.path, content_hash, grammar, [], TREE_SITTER_MISSING)
+            for f, grammar, content_hash in jobs
+        ]
+
+    results: List[Optional[ParsedFile]] = []
+    misses = []
+    for f, grammar, content_hash in jobs:
+        symbols = PARSE_CACHE.get(grammar, content_hash)
+        if symbols is None:
+            misses.append(len(results))
+            results.append(None)
+        else:
+            results.append(ParsedFile(f.path, content_hash, grammar, symbols, cached=True))
+
+    if workers is None:
+        workers = 1 if len(misses) < PARALLEL_MIN_FILES else available_cpus()
+    tasks = [(jobs[i][0].abs_path, jobs[i][1]) for i in misses]
+    if workers > 1:
+        chunks = [
+            tasks[i : i + PARSE_CHUNK_SIZE] for i in range(0, len(tasks), PARSE_CHUNK_SIZE)
+        ]
+        # deferred, it pulls in multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = [r for chunk in pool.map(_parse_chunk, chunks) for r in chunk]
+    else:
+        parsed = _parse_chunk(tasks)
+
+    for i, (symbols, error) in zip(misses, parsed):
+        f, grammar, content_hash = jobs[i]
+        symbols = [Symbol(*s) for s in symbols]
+        if error is None:
+            PARSE_CACHE.put(grammar, content_hash, symbols)
+        results[i] = ParsedFile(f.path, content_hash, grammar, symbols, error)
+    return results
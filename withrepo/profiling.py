@@ -0,0 +1,168 @@
+# Standard library
+import os
+import json
+import time
+import tempfile
+import threading
+import contextlib
+from dataclasses import dataclass
+from typing import Iterator, Optional, Union
+
+# CONSTANTS
+PROFILE_DIR_ENV_VAR = "WITHREPO_PROFILE_DIR"
+PROFILE_SAMPLE_ENV_VAR = "WITHREPO_PROFILE_SAMPLE"
+TRACEMALLOC_FRAMES = 8
+TOP_FUNCTIONS = 50
+TOP_ALLOCATIONS = 25
+
+
+@dataclass
+class ProfilingConfig:
+    directory: Optional[str] = None  # None disables profiling
+    sample_every: int = 1  # profile 1 in N repo() calls
+
+
+_config: Optional[ProfilingConfig] = None
+_calls = 0
+_lock = threading.Lock()
+
+
+def configure_profiling(
+    directory: str = None, sample_every: int = None
+) -> ProfilingConfig:
+    """
+    Enables profiling of repo() calls into directory, 1 in sample_every calls.
+    Defaults come from $WITHREPO_PROFILE_DIR and $WITHREPO_PROFILE_SAMPLE.
+    """
+    global _config
+    directory = directory or os.environ.get(PROFILE_DIR_ENV_VAR)
+    if sample_every is None:
+        sample_every = int(os.environ.get(PROFILE_SAMPLE_ENV_VAR) or 1)
+    _config = ProfilingConfig(directory, max(1, sample_every))
+    return _config
+
+
+def get_profiling_config() -> ProfilingConfig:
+    return _config or configure_profiling()
+
+
+def default_profile_dir() -> str:
+    return os.path.join(tempfile.gettempdir(), "withrepo-profiles")
+
+
+def _sampled(sample_every: int) -> bool:
+    global _calls
+    with _lock:
+        _calls += 1
+        return (_calls - 1) % sample_every == 0
+
+
+def profiler_for_call(profile: Union[bool, str, None]) -> Optional["Profiler"]:
+    """
+    Returns a Profiler for this repo() call, or None if it shouldn't be profiled.
+    profile=None defers to the configured directory and sampling, profile=True
+    always profiles, profile=False never does and a string is a dump directory.
+    """
+    if profile is False:
+        return None
+    config = get_profiling_config()
+    if isinstance(profile, str):
+        return Profiler(profile)
+    if profile is True:
+        return Profiler(config.directory or default_profile_dir())
+    if config.directory and _sampled(config.sample_every):
+        return Profiler(config.directory)
+    return None
+
+
+def profiled(profiler: Optional["Profiler"]):
+    return profiler.section() if profiler else contextlib.nullcontext()
+
+
+class Profiler:
+    """
+    Profiles the withrepo work of one repo() call: setup, every tree() call and
+    cleanup run under cProfile, and allocations are traced with tracemalloc for
+    the life of the context. dump() writes the stats and top allocation sites.
+    """
+
+    def __init__(self, directory: str):
+        import cProfile  # the profiling modules load only when a call is profiled
+
+        self.directory: str = directory
+        self.profile = cProfile.Profile()
+        self._owns_tracemalloc = False
+        self._depth = 0
+        self.started_at = time.time()
+
+    def start(self):
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._owns_tracemalloc = True
+
+    def stop(self):
+        """Stops tracing allocations, if this profiler started it. Idempotent."""
+        import tracemalloc
+
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    @contextlib.contextmanager
+    def section(self) -> Iterator[None]:
+        # sections nest (e.g. tree() inside setup); only the outermost toggles cProfile
+        enabled = False
+        if self._depth == 0:
+            try:
+                self.profile.enable()
+                enabled = True
+            except ValueError:  # another profiler is active on this thread
+                pass
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if enabled:
+                self.profile.disable()
+
+    def dump(self, meta: dict = None) -> str:
+        """Writes the profile into a fresh directory and returns its path."""
+        import pstats
+        import tracemalloc
+
+        # snapshot first, so the dump's own allocations don't show up in it
+        snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        traced = tracemalloc.get_traced_memory() if snapshot else None
+        self.stop()
+
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started_at))
+        out = tempfile.mkdtemp(
+            prefix=f"withrepo-{stamp}-{os.getpid()}-", dir=self.directory
+        )
+
+        self.profile.dump_stats(os.path.join(out, "profile.pstats"))
+        with open(os.path.join(out, "profile.txt"), "w") as f:
+            try:
+                stats = pstats.Stats(self.profile, stream=f)
+                stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+            except TypeError:  # nothing was profiled
+                f.write("no profile data\n")
+
+        meta = dict(meta or {})
+        if snapshot is not None:
+            current, peak = traced
+            meta.update(traced_memory_bytes=current, peak_traced_memory_bytes=peak)
+            with open(os.path.join(out, "allocations.txt"), "w") as f:
+                f.write(f"current={current} peak={peak}\n\n")
+                for stat in snapshot.statistics("traceback")[:TOP_ALLOCATIONS]:
+                    f.write(f"{stat.size} bytes in {stat.count} blocks\n")
+                    f.write("\n".join(stat.traceback.format()) + "\n\n")
+
+        meta.update(started_at=self.started_at, duration=time.time() - self.started_at)
+        with open(os.path.join(out, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2, default=str)
+        return out
@@ -0,0 +1,103 @@
+# Standard library
+import time
+import queue
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+# CONSTANTS
+PROGRESS_MIN_INTERVAL = 0.1
+# terminal phases, after which no more events are reported
+DONE = "done"
+ERROR = "error"
+
+
+@dataclass
+class ProgressEvent:
+    phase: str  # "download", "extract", "split", then "done" or "error"
+    done: int
+    total: Optional[int]  # None when unknown, e.g. no Content-Length
+    unit: str  # "bytes", "members" or "groups"
+    elapsed: float  # seconds since the fetch started
+    detail: str = ""
+
+    @property
+    def fraction(self) -> Optional[float]:
+        if not self.total:
+            return None
+        return min(1.0, self.done / self.total)
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+class ProgressReporter:
+    """
+    Rate-limits progress updates from the hot loops: an update is only delivered
+    if min_interval has passed since the last one, or if it completes its phase.
+    """
+
+    def __init__(
+        self, callback: ProgressCallback, min_interval: float = PROGRESS_MIN_INTERVAL
+    ):
+        self.callback = callback
+        self.min_interval = min_interval
+        self.started_at = time.monotonic()
+        self._last_sent = 0.0
+
+    def update(
+        self, phase: str, done: int, total: Optional[int], unit: str, detail: str = ""
+    ):
+        now = time.monotonic()
+        finished = total is not None and done >= total
+        if not finished and now - self._last_sent < self.min_interval:
+            return
+        self._last_sent = now
+        self.callback(
+            ProgressEvent(phase, done, total, unit, now - self.started_at, detail)
+        )
+
+    def finish(self, detail: str = ""):
+        self.callback(
+            ProgressEvent(DONE, 1, 1, "", time.monotonic() - self.started_at, detail)
+        )
+
+    def fail(self, detail: str = ""):
+        self.callback(
+            ProgressEvent(ERROR, 0, None, "", time.monotonic() - self.started_at, detail)
+        )
+
+
+def make_reporter(progress) -> Optional[ProgressReporter]:
+    if progress is None or isinstance(progress, ProgressReporter):
+        return progress
+    return ProgressReporter(progress)
+
+
+class ProgressQueue:
+    """
+    Event-iterator view of progress: pass it as repo(progress=...) on a worker
+    thread and iterate it on another, until the fetch is done or fails.
+
+        events = ProgressQueue()
+        threading.Thread(target=fetch, args=(events,)).start()
+        for event in events:
+            print(event.phase, event.fraction)
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self._queue: "queue.Queue[ProgressEvent]" = queue.Queue(maxsize)
+
+    def __call__(self, event: ProgressEvent):
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            # never block the fetch on a slow consumer, only terminal events matter
+            if event.phase in (DONE, ERROR):
+                self._queue.put(event)
+
+    def __iter__(self) -> Iterator[ProgressEvent]:
+        while True:
+            event = self._queue.get()
+            yield event
+            if event.phase in (DONE, ERROR):
+                return
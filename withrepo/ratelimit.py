@@ -0,0 +1,326 @@
+# Standard library
+import os
+import json
+import time
+import heapq
+import itertools
+import threading
+import contextlib
+import contextvars
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, Mapping, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+# Local
+from withrepo.budget import get_workspace
+from withrepo.cache import entry_lock
+
+# CONSTANTS
+RATE_LIMITS_ENV_VAR = "WITHREPO_RATE_LIMITS"
+RATE_LIMIT_SHARED_ENV_VAR = "WITHREPO_RATE_LIMIT_SHARED"
+MAX_WAIT = 15 * 60.0  # callers that would wait longer fail instead
+MAX_RETRIES = 5
+# GitHub's secondary limits come without a reset time, its docs ask for a minute
+DEFAULT_BACKOFF = 60.0
+# once this fraction of a quota is left, what remains is spread over its window
+PACE_BELOW = 0.25
+# RateLimit-Reset is an epoch on GitHub and GitLab, but seconds in the IETF draft
+EPOCH_THRESHOLD = 1_000_000_000
+
+
+class RateLimitInfo(NamedTuple):
+    limit: Optional[int]
+    remaining: Optional[int]
+    reset_at: Optional[float]  # epoch seconds
+    retry_after: Optional[float]  # seconds
+
+
+def _header(headers: Mapping[str, str], *names: str) -> Optional[str]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value.strip()
+    return None
+
+
+def _number(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def parse_rate_limit_headers(
+    headers: Mapping[str, str], now: float = None
+) -> RateLimitInfo:
+    """
+    Reads Retry-After and the X-RateLimit-* (GitHub, Bitbucket) or RateLimit-*
+    (GitLab, IETF draft) headers of a response. Missing headers are None.
+    """
+    now = time.time() if now is None else now
+    headers = {k.lower(): v for k, v in headers.items()}
+    limit = _number(_header(headers, "x-ratelimit-limit", "ratelimit-limit"))
+    remaining = _number(
+        _header(headers, "x-ratelimit-remaining", "ratelimit-remaining")
+    )
+    reset_at = _number(_header(headers, "x-ratelimit-reset", "ratelimit-reset"))
+    if reset_at is not None and reset_at < EPOCH_THRESHOLD:
+        reset_at += now
+
+    retry_after = _header(headers, "retry-after")
+    if retry_after is not None:
+        seconds = _number(retry_after)
+        if seconds is None:
+            try:
+                seconds = parsedate_to_datetime(retry_after).timestamp() - now
+            except (TypeError, ValueError):
+                seconds = None
+        retry_after = max(0.0, seconds) if seconds is not None else None
+
+    return RateLimitInfo(
+        int(limit) if limit is not None else None,
+        int(remaining) if remaining is not None else None,
+        reset_at,
+        retry_after,
+    )
+
+
+def is_rate_limited(status_code: int, info: RateLimitInfo) -> bool:
+    # a 403 is only a rate limit when the headers say so, otherwise it's an auth error
+    if status_code == 429:
+        return True
+    return status_code in (403, 503) and (
+        info.retry_after is not None or info.remaining == 0
+    )
+
+
+_priority: contextvars.ContextVar = contextvars.ContextVar(
+    "withrepo_request_priority", default=0
+)
+
+
+@contextlib.contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """Requests made in this block queue ahead of those with a lower priority."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def _initial_state(burst: int) -> dict:
+    return {
+        "tokens": float(burst),
+        "updated": time.time(),
+        "blocked_until": 0.0,
+        # the provider's own quota, from the last response's headers
+        "quota": None,
+        "quota_limit": None,
+        "quota_reset": 0.0,
+    }
+
+
+class RateLimiter:
+    """
+    A token bucket for one provider host. Callers wait for a token in priority
+    order instead of failing, and responses feed the bucket back: Retry-After
+    and exhausted quotas block it until they expire, and a quota running low is
+    paced out over the rest of its window rather than spent in one burst.
+
+    rate is in requests per second; None only paces what the headers ask for.
+    With a state_path the bucket is kept in that file, under its lock, so every
+    process using it shares the budget. Priorities order the callers of one
+    process; across processes, requests are served as they come.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        rate: float = None,
+        burst: int = 1,
+        state_path: str = None,
+        max_wait: float = MAX_WAIT,
+    ):
+        self.host = host
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.state_path = state_path
+        self.max_wait = max_wait
+        self._state = _initial_state(self.burst)
+        self._cond = threading.Condition()
+        self._waiters = []  # heap of (-priority, arrival)
+        self._arrivals = itertools.count()
+        if state_path:
+            os.makedirs(os.path.dirname(state_path), exist_ok=True)
+
+    def _load(self) -> dict:
+        try:
+            with open(self.state_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return _initial_state(self.burst)
+
+    def _save(self, state: dict):
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    @contextlib.contextmanager
+    def _locked_state(self) -> Iterator[dict]:
+        if self.state_path is None:
+            yield self._state
+            return
+        with entry_lock(self.state_path):
+            state = self._load()
+            yield state
+            self._save(state)
+
+    def _take(self, state: dict, now: float) -> float:
+        """Takes a token and returns 0, or returns how long until one is available."""
+        if now < state["blocked_until"]:
+            return state["blocked_until"] - now
+        if state["quota"] is not None and now >= state["quota_reset"]:
+            state["quota"] = None  # a new window, its size comes with the next response
+        quota = state["quota"]
+        if quota is not None and quota <= 0:
+            return state["quota_reset"] - now
+
+        rate = self.rate
+        if quota is not None and quota <= (state["quota_limit"] or 0) * PACE_BELOW:
+            paced = quota / max(state["quota_reset"] - now, 1.0)
+            rate = paced if rate is None else min(rate, paced)
+        if rate is None:
+            state["tokens"] = float(self.burst)
+        else:
+            elapsed = max(0.0, now - state["updated"])
+            state["tokens"] = min(self.burst, state["tokens"] + elapsed * rate)
+        state["updated"] = now
+
+        if state["tokens"] < 1:
+            return (1 - state["tokens"]) / rate
+        state["tokens"] -= 1
+        if quota is not None:
+            state["quota"] = quota - 1
+        return 0.0
+
+    def acquire(self, priority: int = None, timeout: float = None) -> float:
+        """
+        Waits for a token, behind every waiter of a higher priority (by default,
+        that of request_priority()). Returns the seconds waited; raises
+        TimeoutError if the host stays limited for longer than timeout.
+        """
+        priority = _priority.get() if priority is None else priority
+        timeout = self.max_wait if timeout is None else timeout
+        start = time.monotonic()
+        me = (-priority, next(self._arrivals))
+        with self._cond:
+            heapq.heappush(self._waiters, me)
+            try:
+                while True:
+                    wait = None  # until the waiters ahead are served
+                    if self._waiters[0] == me:
+                        with self._locked_state() as state:
+                            wait = self._take(state, time.time())
+                        if wait <= 0:
+                            return time.monotonic() - start
+                        if time.monotonic() + wait - start > timeout:
+                            raise TimeoutError(
+                                f"withrepo.ratelimit: {self.host} is rate limited "
+                                f"for another {wait:.0f}s"
+                            )
+                    self._cond.wait(wait)
+            finally:
+                self._waiters.remove(me)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> bool:
+        """
+        Updates the bucket from a response. Returns True if the request was
+        rejected by a rate limit, in which case it should be retried after
+        acquire() again.
+        """
+        now = time.time()
+        info = parse_rate_limit_headers(headers, now)
+        limited = is_rate_limited(status_code, info)
+        with self._cond, self._locked_state() as state:
+            if info.remaining is not None and info.reset_at is not None:
+                state["quota"] = info.remaining
+                state["quota_limit"] = info.limit
+                state["quota_reset"] = info.reset_at
+            if limited:
+                if info.retry_after is not None:
+                    until = now + info.retry_after
+                elif info.remaining == 0 and info.reset_at is not None:
+                    until = info.reset_at
+                else:
+                    until = now + DEFAULT_BACKOFF
+                state["blocked_until"] = max(state["blocked_until"], until)
+            self._cond.notify_all()
+        return limited
+
+
+_limits: Dict[str, Tuple[Optional[float], int]] = {}
+_shared = False
+_max_wait = MAX_WAIT
+_limiters: Dict[str, RateLimiter] = {}
+_initialized = False
+_lock = threading.Lock()
+
+
+def _parse_limits(spec: str) -> Dict[str, Tuple[float, int]]:
+    """Parses "github.com=5:10,api.github.com=1", host=rate[:burst]."""
+    limits = {}
+    for item in filter(None, (s.strip() for s in spec.split(","))):
+        host, _, value = item.partition("=")
+        rate, _, burst = value.partition(":")
+        limits[host.strip()] = (float(rate), int(burst or 1))
+    return limits
+
+
+def init_rate_limits(
+    limits: Dict[str, Union[float, Tuple[float, int]]] = None,
+    shared: bool = None,
+    max_wait: float = MAX_WAIT,
+):
+    """
+    Sets the pace of requests to each provider host, as requests per second or
+    (requests per second, burst). Hosts without a limit are only held back by
+    their rate-limit headers. With shared, the buckets live in the workspace and
+    are shared by every process using it. Defaults come from $WITHREPO_RATE_LIMITS
+    ("github.com=5:10,api.github.com=1") and $WITHREPO_RATE_LIMIT_SHARED.
+    """
+    global _limits, _shared, _max_wait, _initialized
+    if limits is None:
+        limits = _parse_limits(os.environ.get(RATE_LIMITS_ENV_VAR, ""))
+    if shared is None:
+        shared = os.environ.get(RATE_LIMIT_SHARED_ENV_VAR, "") not in ("", "0")
+    with _lock:
+        _limits = {
+            host: limit if isinstance(limit, tuple) else (limit, 1)
+            for host, limit in limits.items()
+        }
+        _shared, _max_wait = shared, max_wait
+        _limiters.clear()
+        _initialized = True
+
+
+def get_rate_limiter(url: str) -> RateLimiter:
+    """Returns the bucket of the host of url, which may also be a bare host."""
+    if not _initialized:
+        init_rate_limits()
+    host = urlparse(url).hostname or url
+    with _lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            rate, burst = _limits.get(host, (None, 1))
+            state_path = None
+            if _shared:
+                state_path = os.path.join(
+                    get_workspace().rate_limit_root(), f"{host}.json"
+                )
+            limiter = RateLimiter(host, rate, burst, state_path, _max_wait)
+            _limiters[host] = limiter
+    return limiter
@@ -0,0 +1,163 @@
+# Standard library
+import os
+import re
+import json
+import time
+import contextlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import quote, urlparse
+
+# Local
+from withrepo.utils import RepoArguments, RepoProvider
+from withrepo.cache import get_cache_dir
+from withrepo.ratelimit import get_rate_limiter
+from withrepo.auth import credentials_hook, get_token_pool, scoped_cache_key
+
+# Third party
+if TYPE_CHECKING:
+    import httpx
+
+# CONSTANTS
+REF_TTL = 60.0
+REF_TIMEOUT = 10.0
+REFS_DIR = "refs"
+
+SHA_PATTERN = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+
+PROVIDER_HOSTS = {
+    "github.com": RepoProvider.GITHUB,
+    "gitlab.com": RepoProvider.GITLAB,
+    "bitbucket.org": RepoProvider.BITBUCKET,
+}
+
+
+@dataclass
+class ResolvedRef:
+    sha: str
+    etag: str
+    resolved_at: float
+
+
+def ref_resolution_url(args: RepoArguments) -> Optional[str]:
+    """
+    Returns the provider API url that resolves the requested ref to a commit sha,
+    or None when the arguments don't identify a repository we know how to resolve.
+    """
+    user, repo, provider = args.user, args.repo, args.provider
+    if args.url:
+        parsed = urlparse(args.url)
+        parts = parsed.path.strip("/").split("/")
+        if parsed.hostname not in PROVIDER_HOSTS or len(parts) != 2:
+            return None
+        (user, repo), provider = parts, PROVIDER_HOSTS[parsed.hostname]
+    if not (user and repo):
+        return None
+
+    ref = quote(args.branch or "HEAD", safe="")
+    if provider == RepoProvider.GITHUB:
+        return f"https://api.github.com/repos/{user}/{repo}/commits/{ref}"
+    elif provider == RepoProvider.GITLAB:
+        project = quote(f"{user}/{repo}", safe="")
+        return f"https://gitlab.com/api/v4/projects/{project}/repository/commits/{ref}"
+    elif provider == RepoProvider.BITBUCKET:
+        return f"https://api.bitbucket.org/2.0/repositories/{user}/{repo}/commit/{ref}"
+    return None
+
+
+def parse_sha(response: "httpx.Response") -> str:
+    if response.headers.get("content-type", "").startswith("application/json"):
+        data = response.json()
+        sha = data.get("id") or data.get("hash") or data["sha"]
+    else:
+        sha = response.text.strip()
+    if not SHA_PATTERN.fullmatch(sha):
+        raise ValueError(f"withrepo.parse_sha(): '{sha[:64]}' is not a commit sha")
+    return sha
+
+
+def ref_cache_path(resolution_url: str) -> str:
+    key = scoped_cache_key(resolution_url)
+    return os.path.join(get_cache_dir(), REFS_DIR, f"{key}.json")
+
+
+def load_resolved_ref(path: str) -> Optional[ResolvedRef]:
+    try:
+        with open(path, "r") as f:
+            return ResolvedRef(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def store_resolved_ref(path: str, resolved: ResolvedRef):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(resolved.__dict__, f)
+    os.replace(tmp_path, path)
+
+
+def resolve_ref(args: RepoArguments, ttl: float = REF_TTL) -> Optional[str]:
+    """
+    Resolves a branch (or HEAD) request to a commit sha, so its archive can be cached.
+
+    Resolutions are cached for ttl seconds; after that they are revalidated with
+    If-None-Match, so an unchanged ref costs one small 304 before the cache hit.
+    Without a cache directory every call asks the provider. Returns None if the
+    ref can't be resolved, in which case the caller should fall back to
+    downloading the ref's archive directly.
+    """
+    resolution_url = ref_resolution_url(args)
+    if resolution_url is None:
+        return None
+
+    path = ref_cache_path(resolution_url) if get_cache_dir() else None
+    cached = load_resolved_ref(path) if path else None
+    now = time.time()
+    if cached and now - cached.resolved_at < ttl:
+        return cached.sha
+
+    import httpx  # deferred, it's most of the cost of importing withrepo
+
+    headers = {"Accept": "application/vnd.github.sha"}
+    if cached and cached.etag:
+        headers["If-None-Match"] = cached.etag
+    # a resolution is worth less than the wait for a rate-limited API
+    limiter = get_rate_limiter(resolution_url)
+    pool = get_token_pool(resolution_url)
+    token = pool.take() if pool else None
+    if pool is not None and token is None:
+        return None
+    if token is not None:
+        headers.update(pool.headers(token))
+    try:
+        limiter.acquire(timeout=REF_TIMEOUT)
+        hooks = {"request": [credentials_hook(pool)]} if pool else None
+        with httpx.Client(
+            follow_redirects=True, http2=True, event_hooks=hooks
+        ) as client:
+            response = client.get(resolution_url, headers=headers, timeout=REF_TIMEOUT)
+    except (httpx.HTTPError, TimeoutError):
+        return None
+    if token is not None:
+        pool.observe(token, response.status_code, response.headers)
+    else:
+        limiter.observe(response.status_code, response.headers)
+
+    if response.status_code == 304 and cached:
+        resolved = ResolvedRef(cached.sha, cached.etag, now)
+    elif response.status_code == 200:
+        try:
+            sha = parse_sha(response)
+        # a body that isn't a commit object, or whose sha is missing or null
+        except (ValueError, KeyError, AttributeError, TypeError):
+            return None
+        resolved = ResolvedRef(sha, response.headers.get("etag", ""), now)
+    else:
+        return None
+
+    if path:
+        # an unwritable cache only costs the next call a revalidation
+        with contextlib.suppress(OSError):
+            store_resolved_ref(path, resolved)
+    return resolved.sha
@@ -0,0 +1,118 @@
+# Standard library
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Union
+
+# CONSTANTS
+REMOTE_CACHE_ENV_VAR = "WITHREPO_REMOTE_CACHE"
+REMOTE_CACHE_TOKEN_ENV_VAR = "WITHREPO_REMOTE_CACHE_TOKEN"
+REMOTE_TIMEOUT = 60.0
+CHUNK_SIZE = 2 * 1024 * 1024
+
+
+class RemoteCache(ABC):
+    """
+    A cache tier shared by every host, consulted after the local cache and before
+    the provider. It stores the archives of commit-pinned urls, keyed by
+    cache.cache_key(url), so blobs are immutable once written.
+
+    Both methods are best-effort: a remote tier that is down or slow only costs
+    a provider download, it never fails a repo() call.
+    """
+
+    @abstractmethod
+    def get(self, key: str, file_name: str) -> bool:
+        """Writes the blob for key into file_name. Returns False on a miss."""
+
+    @abstractmethod
+    def put(self, key: str, file_name: str) -> bool:
+        """Publishes file_name as the blob for key. Returns True if it was stored."""
+
+
+class HttpBlobStore(RemoteCache):
+    """
+    The minimal HTTP blob protocol, served by anything from nginx with WebDAV
+    to an S3 presigning proxy:
+
+        GET {base_url}/{key}  -> 200 with the blob, or 404
+        PUT {base_url}/{key}  -> 2xx once the blob is stored
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: Dict[str, str] = None,
+        timeout: float = REMOTE_TIMEOUT,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+
+    def blob_url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+    def get(self, key: str, file_name: str) -> bool:
+        import httpx  # deferred, like every other network path
+
+        try:
+            with httpx.stream(
+                "GET",
+                self.blob_url(key),
+                headers=self.headers,
+                timeout=self.timeout,
+                follow_redirects=True,
+            ) as response:
+                if response.status_code != 200:
+                    return False
+                with open(file_name, "wb") as f:
+                    for chunk in response.iter_raw(chunk_size=CHUNK_SIZE):
+                        f.write(chunk)
+                expected = response.headers.get("content-length")
+                # a truncated blob would fail extraction, treat it as a miss instead
+                return expected is None or int(expected) == os.path.getsize(file_name)
+        except (httpx.HTTPError, OSError, ValueError):
+            return False
+
+    def put(self, key: str, file_name: str) -> bool:
+        import httpx
+
+        try:
+            with open(file_name, "rb") as f:
+                response = httpx.put(
+                    self.blob_url(key),
+                    content=f,  # streamed, with a Content-Length from the file size
+                    headers=self.headers,
+                    timeout=self.timeout,
+                )
+            return response.is_success
+        except (httpx.HTTPError, OSError):
+            return False
+
+
+_remote_cache: Optional[RemoteCache] = None
+
+
+def init_remote_cache(
+    backend: Union[str, RemoteCache] = None, token: str = None
+) -> Optional[RemoteCache]:
+    """
+    Enables the shared cache tier, given a RemoteCache or the base url of an
+    HttpBlobStore. Falls back to $WITHREPO_REMOTE_CACHE, and its bearer token to
+    $WITHREPO_REMOTE_CACHE_TOKEN; with neither set the tier is disabled.
+    Only used for trees that go through the local filesystem cache.
+    """
+    global _remote_cache
+    backend = backend or os.environ.get(REMOTE_CACHE_ENV_VAR)
+    if isinstance(backend, str):
+        token = token or os.environ.get(REMOTE_CACHE_TOKEN_ENV_VAR)
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        backend = HttpBlobStore(backend, headers)
+    _remote_cache = backend
+    return _remote_cache
+
+
+def get_remote_cache() -> Optional[RemoteCache]:
+    """Returns the shared cache tier, or None if it hasn't been enabled."""
+    if _remote_cache is None and os.environ.get(REMOTE_CACHE_ENV_VAR):
+        return init_remote_cache()
+    return _remote_cache
@@ -1,4 +1,23 @@
-from withrepo.resources.languages import EXT_TO_LANGUAGE_DATA
-from withrepo.resources.tree_sitter import EXT_TO_TREE_SITTER_LANGUAGE
+import importlib
 
-__all__ = ["EXT_TO_LANGUAGE_DATA", "EXT_TO_TREE_SITTER_LANGUAGE"]
+# tables are loaded on first access (PEP 562), see withrepo/__init__.py
+_LAZY_ATTRIBUTES = {
+    "EXT_TO_LANGUAGE": "withrepo.resources.languages",
+    "EXT_TO_LANGUAGE_DATA": "withrepo.resources.languages",
+    "EXT_TO_TREE_SITTER_LANGUAGE": "withrepo.resources.tree_sitter",
+}
+
+__all__ = ["EXT_TO_LANGUAGE", "EXT_TO_LANGUAGE_DATA", "EXT_TO_TREE_SITTER_LANGUAGE"]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
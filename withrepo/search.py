@@ -0,0 +1,301 @@
+# Standard library
+import os
+import re
+import sys
+import json
+import struct
+import hashlib
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Union
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python 3.10
+    import sre_parse
+
+# Local
+from withrepo.manifest import SIDECAR_MARKER, sidecar_path
+from withrepo.pack import file_size, open_text, read_file
+
+# CONSTANTS
+INDEX_SUFFIX = f"{SIDECAR_MARKER}search.idx"
+INDEX_MAGIC = b"WRTRIGRAM1"
+MAX_INDEXED_FILE_SIZE = 4 * 1024 * 1024
+BINARY_SNIFF_BYTES = 8000
+PARALLEL_CHUNK_SIZE = 256
+# IGNORECASE also matches i, k and s to non-ASCII letters (İ, ı, K, ſ), which the
+# index doesn't fold, so case-insensitive literals are split around them
+NON_ASCII_FOLDS = re.compile("[iks]", re.IGNORECASE)
+
+Query = Union[str, "re.Pattern"]
+
+
+class SearchMatch(NamedTuple):
+    path: str
+    line_no: int  # 1-based
+    line: str
+
+
+def is_binary(data: bytes) -> bool:
+    return b"\0" in data[:BINARY_SNIFF_BYTES]
+
+
+def trigrams(data: bytes) -> array:
+    """Distinct lowercased byte trigrams of data, packed as 24-bit ints."""
+    data = data.lower()
+    return array(
+        "I", ((a << 16) | (b << 8) | c for a, b, c in set(zip(data, data[1:], data[2:])))
+    )
+
+
+def file_trigrams(abs_path: str) -> Optional[array]:
+    """
+    Trigrams of the file at abs_path, an empty array for files too large to index,
+    or None for binaries and unreadable files, which are never searched.
+    """
+    try:
+        if file_size(abs_path) > MAX_INDEXED_FILE_SIZE:
+            return array("I")
+        data = read_file(abs_path)
+    except OSError:
+        return None
+    if is_binary(data):
+        return None
+    return trigrams(data)
+
+
+def _file_trigrams_chunk(abs_paths: Sequence[str]) -> List[Optional[array]]:
+    return [file_trigrams(p) for p in abs_paths]
+
+
+class TrigramIndex:
+    """
+    Trigram posting lists over the files of one tree. Everything is array-backed:
+    sorted trigram keys, offsets into a flat postings array of file ids, so the
+    index persists and loads as three contiguous buffers.
+    """
+
+    def __init__(
+        self,
+        paths: List[str],
+        keys: array,
+        offsets: array,
+        postings: array,
+        unindexed: List[int],
+        fingerprint: str,
+    ):
+        self.paths = paths
+        self.keys = keys
+        self.offsets = offsets
+        self.postings = postings
+        self.unindexed = unindexed  # file ids that are always candidates
+        self.fingerprint = fingerprint
+
+    def posting(self, trigram: int) -> Sequence[int]:
+        lo, hi = 0, len(self.keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.keys[mid] < trigram:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(self.keys) or self.keys[lo] != trigram:
+            return ()
+        return self.postings[self.offsets[lo] : self.offsets[lo + 1]]
+
+    def candidates(self, literals: Iterable[str]) -> List[int]:
+        """File ids that contain every trigram of every literal, in path order."""
+        required = set()
+        for literal in literals:
+            required.update(trigrams(literal.encode()))
+        if not required:
+            return list(range(len(self.paths)))
+
+        postings = sorted((self.posting(t) for t in required), key=len)
+        ids = set(postings[0])
+        for posting in postings[1:]:
+            if not ids:
+                break
+            ids.intersection_update(posting)
+        ids.update(self.unindexed)
+        return sorted(ids)
+
+
+def tree_fingerprint(files) -> str:
+    h = hashlib.sha1()
+    for f in sorted(files, key=lambda f: f.path):
+        h.update(f"{f.path}\0{f.content_hash or f.size}\n".encode())
+    return h.hexdigest()
+
+
+def build_trigram_index(files, workers: int = None) -> TrigramIndex:
+    """Builds the index over RepoFiles, across worker processes if workers > 1."""
+    files = sorted(files, key=lambda f: f.path)
+    abs_paths = [f.abs_path for f in files]
+    if workers and workers > 1 and len(abs_paths) > PARALLEL_CHUNK_SIZE:
+        chunks = [
+            abs_paths[i : i + PARALLEL_CHUNK_SIZE]
+            for i in range(0, len(abs_paths), PARALLEL_CHUNK_SIZE)
+        ]
+        # deferred, it pulls in multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            per_file = [t for chunk in pool.map(_file_trigrams_chunk, chunks) for t in chunk]
+    else:
+        per_file = [file_trigrams(p) for p in abs_paths]
+
+    paths, unindexed = [], []
+    posting_lists: Dict[int, array] = {}
+    for f, file_trigram_set in zip(files, per_file):
+        if file_trigram_set is None:
+            continue
+        file_id = len(paths)
+        paths.append(f.path)
+        if not file_trigram_set and file_size(f.abs_path) > MAX_INDEXED_FILE_SIZE:
+            unindexed.append(file_id)
+        for t in file_trigram_set:
+            posting = posting_lists.get(t)
+            if posting is None:
+                posting = posting_lists[t] = array("I")
+            posting.append(file_id)
+
+    keys = array("I", sorted(posting_lists))
+    offsets, postings = array("I", [0]), array("I")
+    for t in keys:
+        postings.extend(posting_lists[t])
+        offsets.append(len(postings))
+    return TrigramIndex(
+        paths, keys, offsets, postings, unindexed, tree_fingerprint(files)
+    )
+
+
+def index_path(root: str) -> str:
+    return sidecar_path(root, INDEX_SUFFIX)
+
+
+def write_trigram_index(index: TrigramIndex, root: str) -> str:
+    header = json.dumps(
+        {
+            "fingerprint": index.fingerprint,
+            "paths": index.paths,
+            "unindexed": index.unindexed,
+            "byteorder": sys.byteorder,
+            "itemsize": index.keys.itemsize,
+            "lengths": [len(index.keys), len(index.offsets), len(index.postings)],
+        }
+    ).encode()
+    path = index_path(root)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(INDEX_MAGIC + struct.pack("<Q", len(header)) + header)
+        for arr in (index.keys, index.offsets, index.postings):
+            arr.tofile(f)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_trigram_index(root: str) -> Optional[TrigramIndex]:
+    try:
+        with open(index_path(root), "rb") as f:
+            if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                return None
+            (header_len,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(header_len))
+            arrays = []
+            for length in header["lengths"]:
+                arr = array("I")
+                if arr.itemsize != header["itemsize"]:
+                    return None
+                arr.fromfile(f, length)
+                if header["byteorder"] != sys.byteorder:
+                    arr.byteswap()
+                arrays.append(arr)
+    except (OSError, ValueError, EOFError, KeyError, struct.error):
+        return None
+    keys, offsets, postings = arrays
+    return TrigramIndex(
+        header["paths"], keys, offsets, postings, header["unindexed"], header["fingerprint"]
+    )
+
+
+def required_literals(parsed) -> List[str]:
+    """
+    Literal strings that every match of a parsed regex must contain. Alternations,
+    classes and optional parts end a literal run, so this under-approximates.
+    """
+    runs, current = [], []
+
+    def flush():
+        if len(current) >= 3:
+            runs.append("".join(current))
+        current.clear()
+
+    for op, av in parsed:
+        if op is sre_parse.LITERAL:
+            current.append(chr(av))
+        elif op is sre_parse.AT:
+            continue  # anchors are zero-width, the run continues
+        elif op is sre_parse.SUBPATTERN:
+            flush()
+            runs.extend(required_literals(av[-1]))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            flush()
+            min_repeat, _, item = av
+            if min_repeat >= 1:
+                runs.extend(required_literals(item))
+        else:
+            flush()
+    flush()
+    return runs
+
+
+def query_literals(query: Query) -> List[str]:
+    if isinstance(query, str):
+        return [query]
+    literals = required_literals(sre_parse.parse(query.pattern, query.flags))
+    if query.flags & re.IGNORECASE:
+        # the index only folds ASCII case
+        literals = [lit for lit in literals if lit.isascii()]
+        if not query.flags & re.ASCII:
+            literals = [
+                run
+                for lit in literals
+                for run in NON_ASCII_FOLDS.split(lit)
+                if len(run) >= 3
+            ]
+    return literals
+
+
+def query_matcher(query: Query):
+    if isinstance(query, str):
+        return lambda line: query in line
+    return lambda line: query.search(line) is not None
+
+
+def search_files(
+    root: str, paths: Iterable[str], query: Query, max_results: int = None
+) -> List[SearchMatch]:
+    """Verifies candidate files line by line, like grep."""
+    matches = []
+    matcher = query_matcher(query)
+    for path in paths:
+        try:
+            with open_text(os.path.join(root, path), errors="replace") as f:
+                for line_no, line in enumerate(f, 1):
+                    line = line.rstrip("\n")
+                    if matcher(line):
+                        matches.append(SearchMatch(path, line_no, line))
+                        if max_results and len(matches) >= max_results:
+                            return matches
+        except OSError:
+            continue
+    return matches
+
+
+def search_index(
+    index: TrigramIndex, root: str, query: Query, max_results: int = None
+) -> List[SearchMatch]:
+    candidates = index.candidates(query_literals(query))
+    paths = [index.paths[i] for i in candidates]
+    return search_files(root, paths, query, max_results)
@@ -0,0 +1,114 @@
+# Standard library
+import os
+import contextlib
+from dataclasses import dataclass
+from typing import List
+
+# Local
+from withrepo.budget import get_workspace
+from withrepo.cache import (
+    entry_lock,
+    get_cache_dir,
+    get_cache_format,
+    is_entry_complete,
+    publish_entry,
+    add_holder,
+    remove_holder,
+    live_holders,
+    HOLDERS_SUFFIX,
+)
+from withrepo.auth import scoped_cache_key
+from withrepo.download import extract_archive_entry, load_cached_archive
+from withrepo.progress import ProgressReporter
+from withrepo.timing import Timings
+from withrepo.trash import discard
+from withrepo.utils import LanguageGroup, set_tree_writable
+
+# CONSTANTS
+READ_ONLY_MARKER = "read-only"
+
+
+@dataclass
+class SharedTree:
+    entry: str  # the cache or shared entry holding the tree and its language groups
+    holder: str  # this context's reference, see cache.add_holder()
+    path: str
+    lang_groups: List[LanguageGroup]
+    persistent: bool  # lives in the cache, so it outlives its last reader
+
+
+def protect_entry(entry: str):
+    """
+    Makes the tree and language groups of an entry read-only, once. The entry
+    directory itself stays writable, so sidecars such as the search index can
+    still be stored next to the tree.
+    """
+    marker = os.path.join(entry, READ_ONLY_MARKER)
+    if os.path.exists(marker):
+        return
+    source_directory, lang_groups = load_cached_archive(entry)
+    for path in [source_directory, *(g.path for g in lang_groups)]:
+        set_tree_writable(path, False)
+    open(marker, "w").close()
+
+
+def acquire_shared_tree(
+    url: str,
+    persistent: bool,
+    timings: Timings = None,
+    progress: ProgressReporter = None,
+) -> SharedTree:
+    """
+    Returns a read-only checkout of url, shared by every context (in any process)
+    that asks for it while it's held: only the first one downloads and extracts.
+    Persistent trees are entries of the filesystem cache; the others live in the
+    workspace and are deleted once their last holder releases them.
+    """
+    timings = timings or Timings()
+    base = get_cache_dir() if persistent else get_workspace().shared_root()
+    os.makedirs(base, exist_ok=True)
+    entry = os.path.join(base, scoped_cache_key(url))
+
+    with timings.span("shared", persistent=persistent) as span:
+        # registering under the lock orders us against a concurrent last release
+        with entry_lock(entry):
+            holder = add_holder(entry)
+            try:
+                fetched = not is_entry_complete(entry)
+                if fetched:
+                    publish_entry(
+                        entry,
+                        lambda staging: extract_archive_entry(
+                            url,
+                            staging,
+                            timings,
+                            progress,
+                            shareable=persistent,
+                            format=get_cache_format() if persistent else "tree",
+                        ),
+                    )
+                protect_entry(entry)
+            except BaseException:
+                remove_holder(holder)
+                raise
+            readers = len(live_holders(entry))
+        span.set(hit=not fetched, readers=readers)
+
+    source_directory, lang_groups = load_cached_archive(entry)
+    return SharedTree(entry, holder, source_directory, lang_groups, persistent)
+
+
+def release_shared_tree(tree: SharedTree) -> bool:
+    """
+    Drops this context's reference to tree. Returns True if it was the last one
+    and the checkout was discarded; persistent trees are kept for the cache.
+    """
+    with entry_lock(tree.entry):
+        remove_holder(tree.holder)
+        if tree.persistent or live_holders(tree.entry):
+            return False
+        with contextlib.suppress(OSError):
+            os.rmdir(tree.entry + HOLDERS_SUFFIX)
+        # renamed away under the lock, the read-only files are deleted in the background
+        discard(tree.entry)
+    return True
@@ -0,0 +1,315 @@
+# Standard library
+import os
+import json
+import shutil
+import time
+import hashlib
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Local
+from withrepo.budget import get_workspace
+from withrepo.cache import entry_lock
+from withrepo.checkout import checkout_tree
+from withrepo.manifest import Manifest, ManifestEntry, hash_file
+from withrepo.progress import ProgressReporter
+from withrepo.timing import Timings
+from withrepo.utils import LanguageGroup, get_language_from_ext, scope_prefix
+from withrepo.constants import LANGUAGE_TO_LSP_LANGUAGE_MAP
+
+# CONSTANTS
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILE_NAME = "snapshot.json"
+INDEX_LANG_DIR = "lang"
+# a file written in the same tick as the scan may change again without its
+# mtime moving, so anything this close to the last scan is checked again
+RACY_WINDOW_NS = 2 * 1_000_000_000
+PROGRESS_EVERY = 1000
+
+
+class FileState(NamedTuple):
+    size: int
+    mtime_ns: int
+    language: str
+    is_code: bool
+    content_hash: str
+
+
+@dataclass
+class Snapshot:
+    root: str
+    scanned_at_ns: int
+    # directory -> [mtime_ns, subdirectory names, file names], "" is the root
+    dirs: Dict[str, list]
+    files: Dict[str, FileState]
+
+    def manifest(self) -> Manifest:
+        entries = [
+            ManifestEntry(path, s.size, s.language, s.is_code, s.content_hash)
+            for path, s in sorted(self.files.items())
+        ]
+        return Manifest(root=self.root, entries=entries)
+
+
+class ScanResult(NamedTuple):
+    snapshot: Snapshot
+    changed: List[str]  # added or modified files
+    deleted: List[str]
+    dirs_listed: int
+    files_hashed: int
+
+
+def index_dir(root_path: str) -> str:
+    key = hashlib.sha256(os.path.abspath(root_path).encode()).hexdigest()[:32]
+    return os.path.join(get_workspace().index_root(), key)
+
+
+def write_snapshot(snapshot: Snapshot, path: str):
+    languages: Dict[str, int] = {}
+    files = []
+    for p, s in snapshot.files.items():
+        lang_id = languages.setdefault(s.language, len(languages))
+        files.append([p, s.size, s.mtime_ns, lang_id, int(s.is_code), s.content_hash])
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(
+            {
+                "version": SNAPSHOT_VERSION,
+                "root": snapshot.root,
+                "scanned_at_ns": snapshot.scanned_at_ns,
+                "languages": list(languages),
+                "dirs": snapshot.dirs,
+                "files": files,
+            },
+            f,
+            separators=(",", ":"),
+        )
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path: str) -> Optional[Snapshot]:
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != SNAPSHOT_VERSION:
+        return None
+    languages = data["languages"]
+    return Snapshot(
+        root=data["root"],
+        scanned_at_ns=data["scanned_at_ns"],
+        dirs=data["dirs"],
+        files={
+            p: FileState(size, mtime_ns, languages[lang_id], bool(is_code), h)
+            for p, size, mtime_ns, lang_id, is_code, h in data["files"]
+        },
+    )
+
+
+# the last snapshot of each root in this process, with the mtime of its file
+_snapshots: Dict[str, Tuple[int, Snapshot]] = {}
+_lock = threading.Lock()
+
+
+def cached_snapshot(path: str) -> Optional[Snapshot]:
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    with _lock:
+        cached = _snapshots.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    snapshot = load_snapshot(path)
+    if snapshot is not None:
+        remember_snapshot(path, snapshot)
+    return snapshot
+
+
+def remember_snapshot(path: str, snapshot: Snapshot):
+    with _lock:
+        _snapshots[path] = (os.stat(path).st_mtime_ns, snapshot)
+
+
+def scan(
+    root: str, previous: Snapshot = None, progress: ProgressReporter = None
+) -> ScanResult:
+    """
+    Compares root with previous, like git's index: directories whose mtime hasn't
+    moved reuse their previous listing, and files whose size and mtime haven't
+    moved reuse their previous hash. Every file is still lstat()ed, since editing
+    a file in place doesn't touch its directory, but only changed files are read.
+    """
+    scanned_at_ns = time.time_ns()
+    racy_after = (previous.scanned_at_ns - RACY_WINDOW_NS) if previous else 0
+    prev_dirs = previous.dirs if previous else {}
+    prev_files = previous.files if previous else {}
+
+    dirs: Dict[str, list] = {}
+    files: Dict[str, FileState] = {}
+    changed, dirs_listed, hashed = [], 0, 0
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        abs_dir = os.path.join(root, rel_dir) if rel_dir else root
+        try:
+            mtime_ns = os.stat(abs_dir).st_mtime_ns
+        except FileNotFoundError:
+            continue
+        prev = prev_dirs.get(rel_dir)
+        if prev is not None and prev[0] == mtime_ns and mtime_ns < racy_after:
+            _, subdirs, names = prev
+        else:
+            subdirs, names = [], []
+            try:
+                with os.scandir(abs_dir) as it:
+                    for entry in it:
+                        # as in os.walk, links to directories are neither walked
+                        # nor listed as files
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                subdirs.append(entry.name)
+                        else:
+                            names.append(entry.name)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            subdirs.sort()
+            names.sort()
+            dirs_listed += 1
+        dirs[rel_dir] = [mtime_ns, subdirs, names]
+
+        for name in names:
+            path = os.path.join(rel_dir, name) if rel_dir else name
+            abs_path = os.path.join(abs_dir, name)
+            try:
+                st = os.lstat(abs_path)
+            except FileNotFoundError:
+                continue
+            state = prev_files.get(path)
+            if (
+                state is not None
+                and state.size == st.st_size
+                and state.mtime_ns == st.st_mtime_ns
+                and st.st_mtime_ns < racy_after
+            ):
+                files[path] = state
+                continue
+            try:
+                content_hash = hash_file(abs_path)
+            except OSError:
+                continue
+            hashed += 1
+            if state is None or state.content_hash != content_hash:
+                changed.append(path)
+            _, language, is_code = get_language_from_ext(name)
+            files[path] = FileState(
+                st.st_size, st.st_mtime_ns, language, is_code, content_hash
+            )
+            if progress and len(files) % PROGRESS_EVERY == 0:
+                progress.update("index", len(files), None, "files")
+        stack.extend(
+            reversed([os.path.join(rel_dir, d) if rel_dir else d for d in subdirs])
+        )
+
+    deleted = [p for p in prev_files if p not in files]
+    snapshot = Snapshot(root, scanned_at_ns, dirs, files)
+    return ScanResult(snapshot, changed, deleted, dirs_listed, hashed)
+
+
+def lsp_language(state: FileState) -> Optional[str]:
+    return LANGUAGE_TO_LSP_LANGUAGE_MAP.get(state.language) if state.is_code else None
+
+
+def update_language_groups(
+    root: str, lang_dir: str, result: ScanResult, previous: Optional[Snapshot]
+):
+    """Applies a scan to the per-language copies: only changed and deleted files."""
+    prev_files = previous.files if previous else {}
+    for path in result.deleted:
+        language = lsp_language(prev_files[path])
+        if language:
+            try:
+                os.remove(os.path.join(lang_dir, language, path))
+            except FileNotFoundError:
+                pass
+    for path in result.changed:
+        language = lsp_language(result.snapshot.files[path])
+        if not language:
+            continue
+        dest = os.path.join(lang_dir, language, path)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        if os.path.lexists(dest):
+            os.remove(dest)
+        shutil.copy2(os.path.join(root, path), dest, follow_symlinks=False)
+
+
+def index_root_path(
+    root_path: str, timings: Timings = None, progress: ProgressReporter = None
+) -> Tuple[Manifest, List[LanguageGroup], str]:
+    """
+    Returns the manifest and language groups of a local tree, kept up to date
+    incrementally: the previous call's snapshot is rescanned and only what changed
+    is hashed and copied into the language groups, so repeated calls cost a stat
+    per file instead of a copy of the tree per language.
+
+    The groups returned are a private view, hardlinked from the index into a
+    scratch directory that is also returned, so a later call updating the index
+    never changes them under this one. Updates replace files rather than write
+    into them, so the links stay as they were; the caller must do the same.
+    """
+    timings = timings or Timings()
+    root = os.path.abspath(root_path)
+    directory = index_dir(root)
+    snapshot_path = os.path.join(directory, SNAPSHOT_FILE_NAME)
+    lang_dir = os.path.join(directory, INDEX_LANG_DIR)
+    os.makedirs(os.path.dirname(directory), exist_ok=True)
+
+    with timings.span("index") as span, entry_lock(directory):
+        # under the lock, so a sweep of stale indexes can't drop it from under us
+        os.makedirs(lang_dir, exist_ok=True)
+        os.utime(directory)  # marks the index as used, see sweep_stale_indexes()
+        previous = cached_snapshot(snapshot_path)
+        if previous is not None and previous.root != root:
+            previous = None  # a hash collision, start over
+        if previous is None:
+            # whatever an unreadable snapshot left behind is out of sync
+            shutil.rmtree(lang_dir, ignore_errors=True)
+            os.makedirs(lang_dir, exist_ok=True)
+        result = scan(root, previous, progress)
+        with timings.span("split") as split_span:
+            update_language_groups(root, lang_dir, result, previous)
+            split_span.set(files=len(result.changed) + len(result.deleted))
+        # an untouched tree isn't rewritten, so a no-op call stays a stat per file
+        if (
+            previous is None
+            or result.files_hashed
+            or result.deleted
+            or result.dirs_listed
+        ):
+            write_snapshot(result.snapshot, snapshot_path)
+            remember_snapshot(snapshot_path, result.snapshot)
+        span.set(
+            files=len(result.snapshot.files),
+            changed=len(result.changed),
+            deleted=len(result.deleted),
+            dirs_listed=result.dirs_listed,
+            incremental=previous is not None,
+        )
+        view = tempfile.mkdtemp(prefix=scope_prefix(), dir=get_workspace().root)
+        try:
+            with timings.span("index.view") as view_span:
+                materializer = checkout_tree(lang_dir, view, "hardlink")
+                view_span.set(mode=materializer.mode)
+        except BaseException:
+            shutil.rmtree(view, ignore_errors=True)
+            raise
+
+    manifest = result.snapshot.manifest()
+    lang_groups = [
+        LanguageGroup(language, os.path.join(view, language))
+        for language in sorted(manifest.languages())
+    ]
+    return manifest, lang_groups, view
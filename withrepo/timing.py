@@ -0,0 +1,138 @@
+# Standard library
+import time
+import threading
+import contextlib
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+
+# CONSTANTS
+CONNECTION_TRACE_EVENTS = ("connection.connect_tcp", "connection.start_tls")
+
+
+@dataclass
+class Span:
+    name: str
+    start: float
+    end: float = None
+    parent: Optional[str] = None
+    attributes: Dict[str, object] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "parent": self.parent,
+            "duration": self.duration,
+            "attributes": dict(self.attributes),
+        }
+
+
+class Tracer:
+    """
+    Hook interface for forwarding spans, e.g. to an OpenTelemetry tracer.
+    Hooks are called synchronously on the thread that ran the phase.
+    """
+
+    def on_start(self, span: Span):
+        pass
+
+    def on_end(self, span: Span):
+        pass
+
+
+_tracers: List[Tracer] = []
+
+
+def add_tracer(tracer: Tracer):
+    _tracers.append(tracer)
+
+
+def remove_tracer(tracer: Tracer):
+    if tracer in _tracers:
+        _tracers.remove(tracer)
+
+
+class Timings:
+    """
+    Per-phase timing spans of one repo() call, with byte and file counts attached
+    as attributes. Spans are only recorded when enabled or a tracer is registered.
+    """
+
+    def __init__(self, enabled: bool = False, tags: Dict[str, object] = None):
+        self.enabled: bool = enabled
+        self.tags: Dict[str, object] = tags or {}  # attached to every span
+        self.spans: List[Span] = []
+        self._local = threading.local()
+
+    @property
+    def active(self) -> bool:
+        return self.enabled or bool(_tracers)
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        if not self.active:
+            yield Span(name, 0.0, 0.0)
+            return
+
+        stack = self._local.__dict__.setdefault("stack", [])
+        span = Span(name, time.perf_counter(), parent=stack[-1] if stack else None)
+        span.attributes.update(self.tags)
+        span.attributes.update(attributes)
+        for tracer in list(_tracers):
+            tracer.on_start(span)
+        stack.append(name)
+        try:
+            yield span
+        except GeneratorExit:
+            raise  # a generator's consumer stopped early, which isn't a failure
+        except BaseException as exc:
+            span.set(error=type(exc).__name__)
+            raise
+        finally:
+            stack.pop()
+            span.end = time.perf_counter()
+            self.spans.append(span)
+            for tracer in list(_tracers):
+                tracer.on_end(span)
+
+    def summary(self) -> Dict[str, float]:
+        """Total seconds spent per phase name."""
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            totals[span.name] = totals.get(span.name, 0.0) + span.duration
+        return totals
+
+    def to_list(self) -> List[dict]:
+        return [span.to_dict() for span in self.spans]
+
+    def __str__(self) -> str:
+        lines = [
+            f"{name}: {seconds * 1000:.1f}ms" for name, seconds in self.summary().items()
+        ]
+        return "Timings(\n    " + "\n    ".join(lines) + "\n)"
+
+    def httpx_trace(self) -> Callable[[str, dict], None]:
+        """
+        Returns an httpx "trace" extension that turns the connection's TCP connect
+        and TLS handshake into spans.
+        """
+        open_spans: Dict[str, contextlib.AbstractContextManager] = {}
+
+        def trace(event_name: str, info: dict):
+            if not event_name.startswith(CONNECTION_TRACE_EVENTS):
+                return
+            name = event_name.rsplit(".", 1)[0].replace("connection.", "download.")
+            if event_name.endswith(".started"):
+                cm = self.span(name)
+                cm.__enter__()
+                open_spans[name] = cm
+            elif name in open_spans:
+                open_spans.pop(name).__exit__(None, None, None)
+
+        return trace
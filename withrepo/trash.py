@@ -0,0 +1,183 @@
+# Standard library
+import os
+import time
+import queue
+import tempfile
+import threading
+from typing import Callable, List
+
+# Local
+from withrepo.utils import SCOPE_PREFIX, scope_owner_pid, is_pid_alive, force_rmtree
+from withrepo.budget import get_workspace
+from withrepo.cache import entry_lock
+
+# CONSTANTS
+TRASH_DIR_NAME = "withrepo-trash"
+UNTAGGED_ORPHAN_AGE = 24 * 60 * 60.0
+# root_path indexes unused for this long are dropped, the next call rebuilds them
+STALE_INDEX_AGE = 7 * 24 * 60 * 60.0
+
+_queue: "queue.Queue[tuple]" = queue.Queue()
+_lock = threading.Lock()
+_worker: threading.Thread = None
+_swept = False
+
+
+def trash_dir(parent: str = None) -> str:
+    return os.path.join(parent or tempfile.gettempdir(), TRASH_DIR_NAME)
+
+
+def _remove(path: str):
+    if os.path.isdir(path) and not os.path.islink(path):
+        force_rmtree(path)  # shared checkouts are read-only
+    elif os.path.lexists(path):
+        os.remove(path)
+
+
+def _delete_forever():
+    while True:
+        path, on_deleted = _queue.get()
+        try:
+            _remove(path)
+            if on_deleted is not None:
+                on_deleted()
+        except Exception:
+            pass
+        finally:
+            _queue.task_done()
+
+
+def _ensure_worker():
+    global _worker
+    with _lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_delete_forever, name="withrepo-trash", daemon=True
+            )
+            _worker.start()
+
+
+def discard(path: str, on_deleted: Callable[[], None] = None):
+    """
+    Removes path off the caller's thread: it is atomically renamed into a trash
+    directory on the same filesystem and deleted in the background, after which
+    on_deleted is called. Anything the background thread doesn't get to before
+    exit is swept on the next startup.
+    """
+    if not os.path.lexists(path):
+        if on_deleted is not None:
+            on_deleted()
+        return
+    parent = os.path.dirname(os.path.abspath(path))
+    trash = trash_dir(parent)
+    target = os.path.join(trash, f"{os.getpid()}_{os.urandom(16).hex()}")
+    if os.path.basename(parent) == TRASH_DIR_NAME:
+        target = path
+    else:
+        try:
+            os.makedirs(trash, exist_ok=True)
+            os.rename(path, target)
+        except OSError:
+            # no permission to create the trash, delete in place
+            target = path
+    _ensure_worker()
+    _queue.put((target, on_deleted))
+
+
+def drain(timeout: float = None) -> bool:
+    """Blocks until every discarded path is deleted. Returns False on timeout."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while _queue.unfinished_tasks:
+        if deadline is not None and time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def find_orphans(parent: str = None) -> List[str]:
+    """
+    Returns scratch paths under parent whose owner process is gone: tagged scope_
+    paths of dead pids, untagged ones that are older than a day, and the trash
+    left behind by dead processes.
+    """
+    parent = parent or tempfile.gettempdir()
+    orphans = []
+    now = time.time()
+    for name in os.listdir(parent):
+        if not name.startswith(SCOPE_PREFIX):
+            continue
+        path = os.path.join(parent, name)
+        pid = scope_owner_pid(name)
+        if pid is None:
+            try:
+                if now - os.lstat(path).st_mtime > UNTAGGED_ORPHAN_AGE:
+                    orphans.append(path)
+            except OSError:
+                continue
+        elif pid != os.getpid() and not is_pid_alive(pid):
+            orphans.append(path)
+
+    trash = trash_dir(parent)
+    if os.path.isdir(trash):
+        for name in os.listdir(trash):
+            pid = name.split("_", 1)[0]
+            if pid.isdigit() and int(pid) != os.getpid() and not is_pid_alive(int(pid)):
+                orphans.append(os.path.join(trash, name))
+    return orphans
+
+
+def sweep_orphans(parent: str = None) -> List[str]:
+    """
+    Discards the scratch paths left behind by crashed workers, in the background.
+    Sweeps every workspace root unless a parent directory is given.
+    """
+    if parent:
+        parents = [parent]
+    else:
+        workspace = get_workspace()
+        parents = workspace.roots()
+        # released shared checkouts and dropped indexes go to trashes of their own
+        for root in (workspace.shared_root(), workspace.index_root()):
+            if os.path.isdir(root):
+                parents.append(root)
+    orphans = [path for p in parents for path in find_orphans(p)]
+    for path in orphans:
+        discard(path)
+    if not parent:
+        orphans.extend(sweep_stale_indexes())
+    return orphans
+
+
+def sweep_stale_indexes(max_age: float = STALE_INDEX_AGE) -> List[str]:
+    """
+    Discards the root_path indexes that no call has used for max_age seconds.
+    An index in use by another process is skipped.
+    """
+    index_root = get_workspace().index_root()
+    if not os.path.isdir(index_root):
+        return []
+    stale = []
+    now = time.time()
+    for name in os.listdir(index_root):
+        path = os.path.join(index_root, name)
+        if name == TRASH_DIR_NAME or not os.path.isdir(path):
+            continue
+        try:
+            with entry_lock(path, timeout=0):
+                # every index_root_path() call touches its index
+                if now - os.stat(path).st_mtime > max_age:
+                    discard(path)
+                    stale.append(path)
+        except (OSError, TimeoutError):
+            continue
+    return stale
+
+
+def sweep_orphans_once():
+    """Runs sweep_orphans() on the first call in each process, off the caller's thread."""
+    global _swept
+    with _lock:
+        if _swept:
+            return
+        _swept = True
+    threading.Thread(target=sweep_orphans, name="withrepo-sweep", daemon=True).start()
@@ -1,5 +1,7 @@
 # Standard library
 import os
+import sys
+import stat
 from enum import Enum
 from dataclasses import dataclass
 from typing import Tuple, List
@@ -7,7 +9,7 @@ import shutil
 import tempfile
 
 # Local
-from withrepo.resources.languages import EXT_TO_LANGUAGE_DATA
+from withrepo.resources.languages import EXT_TO_LANGUAGE, NO_LANGUAGE
 from withrepo.constants import LANGUAGE_TO_LSP_LANGUAGE_MAP
 
 
@@ -20,6 +22,67 @@ def is_file_empty(path):
     return os.stat(path).st_size == 0
 
 
+def is_pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+WRITE_BITS = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
+
+def set_tree_writable(root: str, writable: bool):
+    """
+    Adds or removes every write bit on root, a file or a directory, and everything
+    under it; links are skipped.
+    """
+    paths = [root]
+    for dirpath, dirnames, filenames in os.walk(root):
+        paths.extend(os.path.join(dirpath, name) for name in [*dirnames, *filenames])
+    for path in paths:
+        st = os.lstat(path)
+        if stat.S_ISLNK(st.st_mode):
+            continue
+        mode = stat.S_IMODE(st.st_mode)
+        os.chmod(path, mode | stat.S_IWUSR if writable else mode & ~WRITE_BITS)
+
+
+def _make_writable_and_retry(func, path, _):
+    try:
+        os.chmod(os.path.dirname(path), stat.S_IRWXU)
+        if os.path.isdir(path) and not os.path.islink(path):
+            os.chmod(path, stat.S_IRWXU)
+        func(path)
+    except OSError:
+        pass
+
+
+def force_rmtree(path: str):
+    """shutil.rmtree() that also removes read-only trees, ignoring anything else."""
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_make_writable_and_retry)
+    else:
+        shutil.rmtree(path, onerror=_make_writable_and_retry)
+
+
+# Every scratch path is tagged with its owner's pid, so orphans can be told apart
+SCOPE_PREFIX = "scope_"
+
+
+def scope_prefix() -> str:
+    return f"{SCOPE_PREFIX}{os.getpid()}_"
+
+
+def scope_owner_pid(name: str):
+    """Returns the pid that owns a scratch path name, or None for untagged names."""
+    pid = name[len(SCOPE_PREFIX) :].split("_", 1)[0]
+    return int(pid) if name.startswith(SCOPE_PREFIX) and pid.isdigit() else None
+
+
 # Dtos for downloads
 class RepoProvider(Enum):
     GITHUB = "github"
@@ -65,9 +128,7 @@ def get_all_paths_from_root_relative(root_path):
 
 def get_language_from_ext(path) -> Tuple[str, str, bool]:
     root, ext = os.path.splitext(path)
-    language_info = EXT_TO_LANGUAGE_DATA.get(ext, {})
-    is_code = language_info.get("is_code", False)
-    language = language_info.get("language_mode", None)
+    language, is_code = EXT_TO_LANGUAGE.get(ext, NO_LANGUAGE)
     lsp_language = LANGUAGE_TO_LSP_LANGUAGE_MAP.get(language, None)
     return lsp_language, language, is_code
 
@@ -86,7 +147,49 @@ def keep_file_for_language(root, file, language):
     #         return False
 
 
-def copy_and_split_root_by_language_group(abs_root_path) -> List[LanguageGroup]:
+def make_language_group_dir(language, dest_dir=None, scratch_dir=None) -> str:
+    if dest_dir is None:
+        return tempfile.mkdtemp(prefix=scope_prefix(), dir=scratch_dir)
+    path = os.path.join(dest_dir, language)
+    os.makedirs(path)
+    return path
+
+
+def copy_language_group_from_manifest(
+    abs_root_path, manifest, language, dest_dir=None, scratch_dir=None
+) -> str:
+    """
+    Copies only the files of the given language, preserving their paths relative
+    to abs_root_path, so the copy's root lines up with the manifest's root.
+    """
+    tmp_parent_dir = make_language_group_dir(language, dest_dir, scratch_dir)
+    for entry in manifest.entries_for_language(language):
+        dest = os.path.join(tmp_parent_dir, entry.path)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        src = os.path.join(abs_root_path, entry.path)
+        shutil.copy2(src, dest, follow_symlinks=False)
+    return tmp_parent_dir
+
+
+def copy_and_split_root_by_language_group(
+    abs_root_path, manifest=None, dest_dir=None, scratch_dir=None, progress=None
+) -> List[LanguageGroup]:
+    if manifest is not None:
+        languages = manifest.languages()
+        lang_groups = []
+        for language in languages:
+            lang_groups.append(
+                LanguageGroup(
+                    language,
+                    copy_language_group_from_manifest(
+                        abs_root_path, manifest, language, dest_dir, scratch_dir
+                    ),
+                )
+            )
+            if progress:
+                progress.update("split", len(lang_groups), len(languages), "groups")
+        return lang_groups
+
     abs_paths, _ = get_all_paths_from_root_relative(abs_root_path)
     languages = set()
 
@@ -98,11 +201,13 @@ def copy_and_split_root_by_language_group(abs_root_path) -> List[LanguageGroup]:
 
     copy_paths = []
     # copy the root directory into a temporary directory per language
-    for _ in range(len(languages)):
-        tmp_parent_dir = tempfile.mkdtemp(prefix="scope_")
+    for language in languages:
+        tmp_parent_dir = make_language_group_dir(language, dest_dir, scratch_dir)
         print(f"Copying {abs_root_path} to {tmp_parent_dir}")
         shutil.copytree(abs_root_path, tmp_parent_dir, dirs_exist_ok=True)
         copy_paths.append(tmp_parent_dir)
+        if progress:
+            progress.update("split", len(copy_paths), len(languages), "groups")
 
     for copy_path, language in zip(copy_paths, languages):
         for root, dirs, files in os.walk(copy_path):
@@ -1,8 +1,9 @@
 # Standard library
 import os
-import shutil
+import re
 import contextlib
-from typing import Iterator, List, Union, Dict
+import dataclasses
+from typing import Iterator, List, NamedTuple, Optional, Union, Dict
 from collections import defaultdict
 
 # Local
@@ -10,13 +11,40 @@ from withrepo.utils import RepoArguments, LanguageGroup, RepoProvider
 from withrepo.download import (
     parse_repo_arguments_into_download_url,
     download_and_extract_archive,
+    download_and_extract_archive_cached,
+)
+from withrepo.cache import get_cache_dir
+from withrepo.shared import SharedTree, acquire_shared_tree, release_shared_tree
+from withrepo.snapshot import INDEX_LANG_DIR, index_dir, index_root_path
+from withrepo.refs import resolve_ref
+from withrepo.ratelimit import request_priority
+from withrepo.auth import TokenPool, use_tokens
+from withrepo.trash import discard, sweep_orphans_once
+from withrepo.budget import release
+from withrepo.timing import Timings
+from withrepo.metrics import flush_metrics
+from withrepo.profiling import Profiler, profiled, profiler_for_call
+from withrepo.progress import ProgressCallback, ProgressReporter, make_reporter
+from withrepo.utils import SCOPE_PREFIX
+from withrepo.utils import get_language_from_ext
+from withrepo.manifest import Manifest, load_manifest, remove_sidecars
+from withrepo.grep import grep_files, select_files
+from withrepo.export import export_files
+from withrepo.checkout import checkout_tree
+from withrepo.pack import Pack, is_pack, open_pack
+from withrepo.chunks import Chunk, batched, chunk_files
+from withrepo.parse import ParsedFile, grammar_for_path, parse_files
+from withrepo.search import (
+    SearchMatch,
+    TrigramIndex,
+    build_trigram_index,
+    load_trigram_index,
+    search_index,
+    tree_fingerprint,
+    write_trigram_index,
 )
-from withrepo.utils import (
-    get_language_from_ext,
-    copy_and_split_root_by_language_group
-) 
 
-from withrepo.resources.languages import EXT_TO_LANGUAGE_DATA
+from withrepo.resources.languages import EXT_TO_LANGUAGE, NO_LANGUAGE
 
 
 # THIS IS JUST HERE FOR COMPATIBILITY WITH ADRENALINE PROD
@@ -31,13 +59,15 @@ class File(object):
         has_ingress=False,
         change_type=None,
         db_id=None,
+        previous_path=None,
         **kwargs,
     ):
         self.db_id = db_id
         self.path = path  # Relative to the root directory
         self.abs_path = abs_path  # Relative to the repository root
         self.content = content
-        self.change_type = change_type
+        self.change_type = change_type  # "added", "modified", "deleted" or "renamed"
+        self.previous_path = previous_path  # Path before a rename
         self.summary = summary
 
         self.file_name = File.get_file_name(path)
@@ -45,10 +75,8 @@ class File(object):
 
         if language:
             self.language = language
-        elif self.file_extension in EXT_TO_LANGUAGE_DATA:
-            self.language = EXT_TO_LANGUAGE_DATA[self.file_extension]["language_mode"]
         else:
-            self.language = None
+            self.language = EXT_TO_LANGUAGE.get(self.file_extension, NO_LANGUAGE)[0]
 
         self.embedding = None
         self.children = []
@@ -57,6 +85,52 @@ class File(object):
     def __repr__(self):
         return f"File(path={self.path})"
 
+    @classmethod
+    def from_repo_file(cls, repo_file: "RepoFile", include_content: bool = True):
+        """
+        Builds a File from a RepoFile without re-deriving what it already knows:
+        the language is reused when both resolve the same extension, and the
+        content is the RepoFile's own (cached) string, not a copy.
+        """
+        file_name = repo_file.file_name
+        if file_name.lower() == "readme":
+            file_extension = ".md"
+        else:
+            file_extension = f".{file_name.rsplit('.', 1)[-1]}".lower()
+        if file_extension == repo_file.file_extension:
+            language = repo_file.language
+        else:
+            language = EXT_TO_LANGUAGE.get(file_extension, NO_LANGUAGE)[0]
+
+        file = cls.__new__(cls)
+        file.__dict__.update(
+            db_id=None,
+            path=repo_file.path,
+            abs_path=repo_file.abs_path,
+            content=repo_file.contents() if include_content else None,
+            change_type=None,
+            previous_path=None,
+            summary=None,
+            file_name=file_name,
+            file_extension=file_extension,
+            language=language,
+            embedding=None,
+            children=[],
+            has_ingress=False,
+        )
+        return file
+
+    @classmethod
+    def from_repo_files(
+        cls,
+        repo_files: List["RepoFile"],
+        include_content: bool = True,
+        lazy: bool = False,
+    ) -> Union[List["File"], Iterator["File"]]:
+        """Bulk from_repo_file(); with lazy, Files are built (and read) as iterated."""
+        files = (cls.from_repo_file(f, include_content) for f in repo_files)
+        return files if lazy else list(files)
+
     @staticmethod
     def get_file_name(path):
         if not path:
@@ -92,18 +166,33 @@ class File(object):
 
 
 class RepoFile:
-    def __init__(self, abs_path: str, relative_path: str, preload: bool = False):
+    def __init__(
+        self,
+        abs_path: str,
+        relative_path: str,
+        preload: bool = False,
+        language: str = None,
+        is_code: bool = None,
+        size: int = None,
+        content_hash: str = None,
+        pack: Pack = None,
+    ):
         self.file_name: str = os.path.basename(abs_path)
         self.file_extension: str = os.path.splitext(abs_path)[1]
         self.abs_path: str = abs_path
         self.path: str = relative_path
+        self.pack: Pack = pack  # set for files of packed trees, read from the pack
         self._contents: str = None
         if preload:
             self.contents()
-        _, language, is_code = get_language_from_ext(abs_path)
+        # language and is_code are precomputed when built from a manifest
+        if is_code is None:
+            _, language, is_code = get_language_from_ext(abs_path)
         self.language: str = language
         self.is_code: bool = is_code
-        # self.tree_sitter_lang = EXT_TO_TREE_SITTER_LANGUAGE.get(self.ext, None)
+        self.size: int = size
+        self.content_hash: str = content_hash
+        self.tree_sitter_lang: str = grammar_for_path(abs_path)
 
     def __len__(self) -> int:
         return len(self.content.split("\n"))
@@ -121,8 +210,11 @@ class RepoFile:
     def contents(self) -> str:
         try:
             if self._contents is None:
-                with open(self.abs_path, "r") as f:
-                    self._contents = f.read()
+                if self.pack is not None:
+                    self._contents = self.pack.read_text(self.path)
+                else:
+                    with open(self.abs_path, "r") as f:
+                        self._contents = f.read()
             return self._contents
         except Exception:
             # print(f"RepoFile::contents() Error reading file {self.abs_path}")
@@ -131,10 +223,28 @@ class RepoFile:
 
 class RepoContext:
     def __init__(
-        self, path: str, url: str, args: RepoArguments, lang_groups: List[LanguageGroup]
+        self,
+        path: str,
+        url: str,
+        args: RepoArguments,
+        lang_groups: List[LanguageGroup],
+        cached: bool = False,
+        timings: Timings = None,
+        profiler: Profiler = None,
+        shared: SharedTree = None,
+        manifest: Manifest = None,
+        view: str = None,
     ):
         """Stores the context for a withrepo test."""
         self.path: str = path
+        self.timings: Timings = timings or Timings()
+        self.profiler: Profiler = profiler
+        self.cached: bool = cached  # cached trees are shared, never cleaned up
+        # read-only checkouts are shared and released by the last context to clean up
+        self.shared: SharedTree = shared
+        self.read_only: bool = shared is not None
+        # local trees' language groups are a private view, discarded on cleanup
+        self.view: str = view
         self.url: str = url
         self.user: str = args.user
         self.repo: str = args.repo
@@ -142,6 +252,7 @@ class RepoContext:
         self.branch: str = args.branch
         self.repo_url: str = args.url
         self.root_dir: str = args.root_dir
+        self.root_path: str = args.root_path  # the caller's own tree, never modified
         self.provider: RepoProvider = args.provider
         self.lang_groups: List[LanguageGroup] = lang_groups
         self.languages: List[str] = list(
@@ -150,6 +261,10 @@ class RepoContext:
 
         self.files: List[RepoFile] = []
         self.lang_trees: Dict[str, List[RepoFile]] = {}
+        # packed cache entries have no directory tree, path is the pack file
+        self.pack: Pack = open_pack(path) if is_pack(path) else None
+        self._manifest: Manifest = manifest
+        self._search_index: TrigramIndex = None
 
     def __str__(self):
         return f"""RepoContext(
@@ -163,6 +278,51 @@ class RepoContext:
             path={self.path}
         )"""
 
+    @property
+    def manifest(self) -> Manifest:
+        """The manifest written at extraction time, or None for trees without one."""
+        if self._manifest is None:
+            if self.pack is not None:
+                self._manifest = self.pack.manifest()
+            else:
+                self._manifest = load_manifest(self.path)
+        return self._manifest
+
+    def _tree_from_manifest(
+        self, manifest: Manifest, multilang: bool, store: bool
+    ) -> Union[List[RepoFile], Dict[str, List[RepoFile]]]:
+        if not multilang:
+            groups = [(None, self.path, manifest.entries)]
+        else:
+            groups = [
+                (
+                    lang_group.language,
+                    lang_group.path,
+                    manifest.entries_for_language(lang_group.language),
+                )
+                for lang_group in self.lang_groups
+            ]
+
+        trees = defaultdict(list)
+        for language, root, entries in groups:
+            root = os.path.abspath(root)
+            for e in entries:
+                if self.root_dir and not e.path.startswith(self.root_dir):
+                    continue
+                trees[language].append(
+                    RepoFile(
+                        os.path.join(root, e.path),
+                        e.path,
+                        preload=store,
+                        language=e.language,
+                        is_code=e.is_code,
+                        size=e.size,
+                        content_hash=e.content_hash,
+                        pack=self.pack,
+                    )
+                )
+        return trees if multilang else trees[None]
+
     def tree(
         self, multilang: bool = False, store: bool = False
     ) -> Union[List[RepoFile], Dict[str, List[RepoFile]]]:
@@ -171,6 +331,194 @@ class RepoContext:
         If multilang is False, returns a list of RepoFiles.
         If multilang is True, returns a dict mapping languages to lists of RepoFiles.
         """
+        with profiled(self.profiler):
+            with self.timings.span("tree", multilang=multilang) as span:
+                tree = self._tree(multilang, store)
+                if multilang:
+                    span.set(files=sum(len(files) for files in tree.values()))
+                else:
+                    span.set(files=len(tree))
+        return tree
+
+    def build_search_index(self, workers: int = None) -> TrigramIndex:
+        """
+        Builds the trigram index used by search(), across worker processes if
+        workers > 1. For trees with a manifest the index is stored next to it,
+        so the cache and later contexts of the same tree reuse it; local trees
+        keep theirs in the workspace, next to their snapshot.
+        """
+        with profiled(self.profiler):
+            with self.timings.span("search.index") as span:
+                files = self.tree()
+                index_root = self.path
+                if self.root_path:
+                    # never write next to the caller's own directory
+                    index_root = os.path.join(index_dir(self.path), INDEX_LANG_DIR)
+                persist = self.manifest is not None
+                index = load_trigram_index(index_root) if persist else None
+                span.set(loaded=index is not None)
+                if index is None or index.fingerprint != tree_fingerprint(files):
+                    index = build_trigram_index(files, workers=workers)
+                    if persist:
+                        write_trigram_index(index, index_root)
+                span.set(files=len(index.paths), trigrams=len(index.keys))
+        self._search_index = index
+        return index
+
+    def search(
+        self, query: Union[str, re.Pattern], max_results: int = None
+    ) -> List[SearchMatch]:
+        """
+        Returns the lines matching query, a substring or a compiled regex. Only
+        the files the trigram index can't rule out are read; binaries are skipped.
+        """
+        if self._search_index is None:
+            self.build_search_index()
+        with profiled(self.profiler):
+            with self.timings.span("search") as span:
+                matches = search_index(self._search_index, self.path, query, max_results)
+                span.set(matches=len(matches))
+        return matches
+
+    def grep(
+        self,
+        pattern: Union[str, bytes, re.Pattern],
+        languages: List[str] = None,
+        globs: List[str] = None,
+        max_results: int = None,
+        workers: int = None,
+        include_vendor: bool = False,
+    ) -> Iterator[SearchMatch]:
+        """
+        Streams the lines matching the regex pattern without building an index.
+        Files are mmap'd and matched as bytes, across worker processes for large
+        trees; binaries and vendored paths are skipped. Stops after max_results.
+        """
+        files = [
+            (f.path, f.abs_path)
+            for f in select_files(self.tree(), languages, globs, include_vendor)
+        ]
+        matches = grep_files(files, pattern, max_results, workers)
+        with self.timings.span("grep", files=len(files)) as span:
+            found = 0
+            try:
+                while True:
+                    # only the matching is profiled, not the caller's work between
+                    with profiled(self.profiler):
+                        match = next(matches, None)
+                    if match is None:
+                        break
+                    found += 1
+                    yield match
+            finally:
+                matches.close()
+                span.set(matches=found)
+
+    def parse(
+        self, languages: List[str] = None, workers: int = None
+    ) -> List[ParsedFile]:
+        """
+        Parses every file with a tree-sitter grammar into its symbols and spans.
+        Results are cached by content hash, so re-parsing a mostly unchanged
+        commit only parses the changed files. Needs the "parse" extra; without
+        it every ParsedFile carries an error instead of symbols.
+        """
+        files = select_files(self.tree(), languages, include_vendor=True)
+        with profiled(self.profiler):
+            with self.timings.span("parse") as span:
+                parsed = parse_files(files, workers=workers)
+                span.set(
+                    files=len(parsed), cached=sum(1 for p in parsed if p.cached)
+                )
+        return parsed
+
+    def chunks(
+        self,
+        max_chars: int = None,
+        max_lines: int = None,
+        overlap: int = 0,
+        languages: List[str] = None,
+        batch_size: int = None,
+        workers: int = None,
+        include_vendor: bool = False,
+    ) -> Iterator[Union[Chunk, List[Chunk]]]:
+        """
+        Streams fixed-budget chunks of the tree's text files for embedding or
+        summarization, with their path and line span. Chunks break on lines and
+        hold at most max_chars characters and/or max_lines lines (2000 characters
+        by default); consecutive chunks of a file share overlap lines. Files are
+        read lazily, across worker processes for large trees. With batch_size,
+        lists of up to batch_size chunks are yielded instead.
+        """
+        files = [
+            (f.path, f.abs_path, f.language)
+            for f in select_files(self.tree(), languages, include_vendor=include_vendor)
+        ]
+        chunks = chunk_files(files, max_chars, max_lines, overlap, workers)
+        if batch_size:
+            return batched(chunks, batch_size)
+        return chunks
+
+    def to_files(
+        self, include_content: bool = True, lazy: bool = False
+    ) -> Union[List[File], Iterator[File]]:
+        """The tree as legacy File objects, see File.from_repo_files()."""
+        return File.from_repo_files(self.tree(), include_content, lazy)
+
+    def checkout(self, dest: str, mode: str = "reflink") -> str:
+        """
+        Materializes the tree into dest, a new or empty directory, as a private
+        working copy. reflink clones files sharing their blocks (copy-on-write,
+        near instant on btrfs and XFS); hardlink links them, so files must be
+        replaced rather than edited in place or the source changes too; copy
+        copies in the kernel with copy_file_range. Each falls back to the next
+        cheapest mode the filesystems support. Packed trees are always unpacked,
+        which is a copy. Returns dest.
+        """
+        with profiled(self.profiler):
+            with self.timings.span("checkout", mode=mode) as span:
+                if self.pack is not None:
+                    span.set(**{"files.copy": self.pack.unpack(dest)})
+                else:
+                    materializer = checkout_tree(self.path, dest, mode)
+                    span.set(
+                        **{f"files.{m}": n for m, n in materializer.counts.items()}
+                    )
+        return dest
+
+    def export(
+        self,
+        fileobj,
+        format: str = "jsonl",
+        fields: List[str] = None,
+        include_content: bool = True,
+    ) -> int:
+        """
+        Streams the tree into fileobj one file at a time, as JSON lines or as
+        length-prefixed binary records (see withrepo.export.read_binary_export)
+        whose content bytes are copied straight from disk. fields are RepoFile
+        attributes. Returns the number of records written.
+        """
+        with profiled(self.profiler):
+            with self.timings.span("export", format=format) as span:
+                count = export_files(
+                    self.tree(), fileobj, format, fields, include_content
+                )
+                span.set(files=count)
+        return count
+
+    def _tree(
+        self, multilang: bool, store: bool
+    ) -> Union[List[RepoFile], Dict[str, List[RepoFile]]]:
+        manifest = self.manifest
+        if manifest is not None:
+            tree = self._tree_from_manifest(manifest, multilang, store)
+            if store and multilang:
+                self.lang_trees = tree
+            elif store:
+                self.files = tree
+            return tree
+
         if not multilang:
             files = []
             for root, _, files_list in os.walk(self.path, topdown=True):
@@ -205,15 +553,100 @@ class RepoContext:
             return lang_trees
 
     def cleanup(self, log: bool = False):
+        with profiled(self.profiler):
+            with self.timings.span("cleanup", cached=self.cached):
+                self._cleanup(log)
+        flush_metrics()
+
+    def _cleanup(self, log: bool):
+        if self.root_path:
+            # only the view goes, the caller's own tree is never touched
+            view, self.view = self.view, None
+            if view is not None:
+                if log:
+                    print(f"RepoContext::cleanup() Cleaning up {view}")
+                discard(view)
+            return
+        if self.shared is not None:
+            shared, self.shared = self.shared, None
+            released = release_shared_tree(shared)
+            if log:
+                state = "Released" if released else "Keeping"
+                print(f"RepoContext::cleanup() {state} shared {self.path}")
+            return
+        if self.cached:
+            if log:
+                print(f"RepoContext::cleanup() Keeping cached {self.path}")
+            return
         if log:
             print(f"RepoContext::cleanup() Cleaning up {self.path}")
             print(f"RepoContext::cleanup() Cleaning up {self.lang_groups}")
-        # cleanup the source directory and the group directories
-        if os.path.exists(self.path):
-            shutil.rmtree(self.path)
+        # cleanup the source directory and the group directories; they are renamed
+        # into the trash and deleted in the background, so this is O(1)
+        scope_dir = os.path.dirname(self.path)
+        if not os.path.basename(scope_dir).startswith(SCOPE_PREFIX):
+            scope_dir = self.path
+            remove_sidecars(self.path)
+        # the disk budget reservation is held until the bytes are actually gone
+        discard(scope_dir, on_deleted=lambda: release(scope_dir))
         for lang_group in self.lang_groups:
-            if os.path.exists(lang_group.path):
-                shutil.rmtree(lang_group.path)
+            discard(lang_group.path)
+
+
+class SourceTree(NamedTuple):
+    args: RepoArguments  # with branch and HEAD requests resolved to a commit
+    url: Optional[str]  # the archive's, None for local trees
+    path: str
+    lang_groups: List[LanguageGroup]
+    cached: bool = False  # whether the tree lives in the shared cache
+    shared: Optional[SharedTree] = None  # the shared checkout of read-only trees
+    manifest: Optional[Manifest] = None  # for local trees, from their snapshot
+    view: Optional[str] = None  # for local trees, their private language groups
+
+
+def _fetch_source_tree(
+    args: RepoArguments,
+    timings: Timings,
+    progress: ProgressReporter = None,
+    read_only: bool = False,
+) -> SourceTree:
+    """Materializes the tree repo() was asked for."""
+    if args.root_path:
+        # local trees are indexed incrementally, against the previous call's snapshot
+        manifest, lang_groups, view = index_root_path(args.root_path, timings, progress)
+        return SourceTree(
+            args, None, args.root_path, lang_groups, manifest=manifest, view=view
+        )
+
+    # only commit-pinned trees are immutable, and therefore safe to cache or share,
+    # so branch and HEAD requests are pinned to the commit they resolve to first;
+    # read-only requests that can't be pinned get a private checkout instead
+    with timings.span("resolve") as span:
+        if not args.commit and (get_cache_dir() or read_only):
+            sha = resolve_ref(args)
+            if sha:
+                args = dataclasses.replace(args, commit=sha)
+        cached = bool(args.commit and get_cache_dir())
+        pinned = cached or (read_only and bool(args.commit))
+        download_args = dataclasses.replace(args, branch="") if pinned else args
+        repo_zip_url = parse_repo_arguments_into_download_url(download_args)
+        span.set(cached=cached)
+
+    shared = None
+    if read_only and pinned:
+        shared = acquire_shared_tree(repo_zip_url, cached, timings, progress)
+        source_directory_path, lang_groups = shared.path, shared.lang_groups
+    elif cached:
+        source_directory_path, lang_groups = download_and_extract_archive_cached(
+            repo_zip_url, timings, progress
+        )
+    else:
+        source_directory_path, lang_groups = download_and_extract_archive(
+            repo_zip_url, timings=timings, progress=progress
+        )
+    return SourceTree(
+        args, repo_zip_url, source_directory_path, lang_groups, cached, shared
+    )
 
 
 @contextlib.contextmanager
@@ -229,6 +662,11 @@ def repo(
     cleanup_callback: bool = False,
     timeit: bool = False,
     log: bool = False,
+    profile: Union[bool, str] = None,
+    progress: ProgressCallback = None,
+    read_only: bool = False,
+    priority: int = 0,
+    token: Union[str, List[str], TokenPool] = None,
 ) -> Iterator[RepoContext]:
     args = RepoArguments(
         user=user,
@@ -244,16 +682,70 @@ def repo(
     if args.invalid():
         raise ValueError("Invalid repo arguments")
 
-    if not root_path:
-        repo_zip_url = parse_repo_arguments_into_download_url(args)
-        source_directory_path, lang_groups = download_and_extract_archive(repo_zip_url)
-    else:
-        repo_zip_url = None
-        lang_groups = copy_and_split_root_by_language_group(root_path)
-        source_directory_path = root_path
+    # reclaim the scratch space of crashed workers, in the background
+    sweep_orphans_once()
 
-    repo_ctx = RepoContext(source_directory_path, repo_zip_url, args, lang_groups)
-    yield repo_ctx
+    profiler = profiler_for_call(profile)
+    if profiler:
+        profiler.start()
 
-    if not root_path and not cleanup_callback:
-        repo_ctx.cleanup(log=log)
+    provider_tag = "local" if root_path else getattr(provider, "value", provider)
+    timings = Timings(enabled=timeit, tags={"provider": provider_tag})
+    reporter = make_reporter(progress)
+    # provider requests queue behind those of higher-priority calls when rate limited,
+    # and are authenticated with token, over the credentials from init_auth()
+    with profiled(profiler), request_priority(priority), use_tokens(token, provider):
+        try:
+            source = _fetch_source_tree(args, timings, reporter, read_only)
+        except BaseException as exc:
+            if reporter:
+                reporter.fail(str(exc))
+            if profiler:
+                profiler.stop()
+            flush_metrics()
+            raise
+    if reporter:
+        reporter.finish(source.path)
+
+    repo_zip_url = source.url
+    try:
+        repo_ctx = RepoContext(
+            source.path,
+            source.url,
+            source.args,
+            source.lang_groups,
+            cached=source.cached,
+            timings=timings,
+            profiler=profiler,
+            shared=source.shared,
+            manifest=source.manifest,
+            view=source.view,
+        )
+    except BaseException:
+        if source.shared is not None:
+            release_shared_tree(source.shared)
+        if source.view is not None:
+            discard(source.view)
+        raise
+    # a body that raises, or a generator closed early, still cleans up
+    try:
+        yield repo_ctx
+    finally:
+        try:
+            if not cleanup_callback:
+                repo_ctx.cleanup(log=log)
+            if timeit and log:
+                print(f"RepoContext::timings {repo_ctx.timings}")
+        finally:
+            # cleanup_callback contexts publish here, and again on their cleanup
+            flush_metrics()
+            if profiler:
+                profile_path = profiler.dump(
+                    {
+                        "url": repo_zip_url,
+                        "root_path": root_path,
+                        "timings": timings.to_list(),
+                    }
+                )
+                if log:
+                    print(f"RepoContext::profile written to {profile_path}")